@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+WeatherAPI užklausų kelio apkrovos testas prieš vietinį meteo.lt simuliatorių
+
+Paleidimas:
+    python benchmarks/bench_fetch_path.py --requests 2000 --concurrency 32 --latency-ms 20
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from http_client import HttpClient
+from meteo_simulator import MeteoSimulator
+from weather_api import WeatherAPI
+
+
+def percentile(values, q: float) -> float:
+    """
+    Grąžina q-tąjį procentilį iš surūšiuotų reikšmių
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--places', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--csv', help="Įrašyta prognozė CSV formatu")
+    args = parser.parse_args()
+
+    simulator = MeteoSimulator(extra_places=args.places, csv_path=args.csv,
+                               latency=args.latency_ms / 1000, error_rate=args.error_rate,
+                               seed=42)
+    client = HttpClient(rate_per_second=None, pool_maxsize=args.concurrency, backoff_max=0.05)
+
+    with simulator:
+        api = WeatherAPI('vilnius', base_url=simulator.base_url, client=client)
+        codes = list(simulator.places)
+        latencies = []
+
+        def fetch(i: int) -> bool:
+            start = time.perf_counter()
+            data = api._make_request(f'places/{codes[i % len(codes)]}/forecasts/long-term')
+            latencies.append(time.perf_counter() - start)
+            return data is not None
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            ok = sum(executor.map(fetch, range(args.requests)))
+        elapsed = time.perf_counter() - start
+        stats = simulator.stats()
+
+    latencies.sort()
+    print(f"Užklausų: {args.requests}, lygiagretumas: {args.concurrency}, "
+          f"sėkmingų: {ok}")
+    print(f"  pralaidumas: {args.requests / elapsed:8.1f} užkl./s")
+    print(f"  vėlinimas p50: {percentile(latencies, 50) * 1000:7.1f} ms, "
+          f"p95: {percentile(latencies, 95) * 1000:7.1f} ms, "
+          f"p99: {percentile(latencies, 99) * 1000:7.1f} ms")
+    print(f"  simuliatorius: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Prognozės analizatorių mikro-benchmark'as: stulpelinis kelias prieš pd.DataFrame(records)
+
+Paleidimas:
+    python benchmarks/bench_forecast_parser.py --places 200 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from forecast_parser import parse_forecast_timestamps, parse_forecast_timestamps_pandas
+
+
+def make_records(hours: int = 240):
+    """
+    Sukuria vienos vietovės long-term prognozės įrašus
+    """
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return [{
+        'forecastTimeUtc': (start + timedelta(hours=h)).strftime('%Y-%m-%d %H:%M:%S'),
+        'airTemperature': 10.5 + h % 9,
+        'feelsLikeTemperature': 8.2 + h % 9,
+        'windSpeed': 3 + h % 4,
+        'windGust': 7 + h % 5,
+        'windDirection': (h * 17) % 360,
+        'cloudCover': (h * 13) % 101,
+        'seaLevelPressure': 1000 + h % 30,
+        'relativeHumidity': 50 + h % 50,
+        'totalPrecipitation': 0.3 if h % 6 == 0 else 0,
+        'conditionCode': 'light-rain' if h % 6 == 0 else 'cloudy'
+    } for h in range(hours)]
+
+
+def bench(parser, payloads, tz, cutoff, repeat: int) -> float:
+    """
+    Grąžina geriausią visų vietovių apdorojimo laiką sekundėmis
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for records in payloads:
+            parser(records, tz, cutoff)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--places', type=int, default=200)
+    parser.add_argument('--hours', type=int, default=240)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    tz = pytz.timezone('Europe/Vilnius')
+    cutoff = datetime.now(tz) + timedelta(days=7)
+    payloads = [make_records(args.hours) for _ in range(args.places)]
+
+    pd.testing.assert_frame_equal(parse_forecast_timestamps(payloads[0], tz, cutoff),
+                                  parse_forecast_timestamps_pandas(payloads[0], tz, cutoff))
+
+    legacy = bench(parse_forecast_timestamps_pandas, payloads, tz, cutoff, args.repeat)
+    columnar = bench(parse_forecast_timestamps, payloads, tz, cutoff, args.repeat)
+
+    print(f"Vietovių: {args.places}, įrašų vietovei: {args.hours}")
+    print(f"  pd.DataFrame(records) kelias: {legacy * 1000:8.1f} ms "
+          f"({legacy / args.places * 1e6:7.1f} µs/vietovei)")
+    print(f"  stulpelinis kelias:           {columnar * 1000:8.1f} ms "
+          f"({columnar / args.places * 1e6:7.1f} µs/vietovei)")
+    print(f"  pagreitėjimas: {legacy / columnar:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Paleidimo (importavimo) laiko benchmark'as kiekvienam src moduliui
+
+Kiekvienas modulis importuojamas atskirame procese su `python -X importtime`,
+todėl matuojamas šaltas paleidimas, o ne jau įkeltų modulių podėlis.
+
+Paleidimas:
+    python benchmarks/bench_import_time.py --repeat 5 --top 8
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULES = [
+    'src',
+    'src.http_client',
+    'src.response_cache',
+    'src.forecast_parser',
+    'src.place_catalog',
+    'src.observation_store',
+    'src.forecast_archive',
+    'src.weather_api',
+    'src.data_analysis',
+    'src.interpolation',
+    'src.visualization',
+    'src.meteo_simulator',
+]
+
+# import time:  self [us] | cumulative | imported package
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(module: str) -> Tuple[float, List[Tuple[int, str]]]:
+    """
+    Importuoja modulį naujame procese
+
+    Returns:
+        Tuple: (bendras modulio importo laikas ms, [(savas laikas µs, modulis), ...])
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total = 0.0
+    self_times = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        self_times.append((int(self_us), name))
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, self_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=5,
+                        help="Kiek lėčiausių priklausomybių rodyti kiekvienam moduliui")
+    args = parser.parse_args()
+
+    print(f"{'modulis':<24} {'min ms':>9} {'med ms':>9}  lėčiausios priklausomybės")
+    for module in args.modules:
+        try:
+            runs = [measure(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{module:<24} {'-':>9} {'-':>9}  klaida: {e}")
+            continue
+
+        totals = sorted(total for total, _ in runs)
+        heaviest: Dict[str, int] = {}
+        for self_us, name in min(runs)[1]:
+            top_level = name.split('.')[0]
+            heaviest[top_level] = heaviest.get(top_level, 0) + self_us
+        slowest = sorted(heaviest.items(), key=lambda item: -item[1])[:args.top]
+
+        print(f"{module:<24} {totals[0]:9.1f} {totals[len(totals) // 2]:9.1f}  "
+              + ", ".join(f"{name} {us / 1000:.0f}" for name, us in slowest))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Ataskaitos benchmark'as: vieno praėjimo generate_summary_report() prieš atskirus analizės metodus
+
+Paleidimas:
+    python benchmarks/bench_summary_report.py --stations 100 --days 365 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_analysis import WeatherAnalyzer, REPORT_SECTIONS
+
+
+def make_station(days: int, seed: int):
+    """
+    Sukuria vienos stoties valandinius istorinius duomenis ir 10 dienų prognozę
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-01', periods=days * 24, freq='h', tz='Europe/Vilnius')
+    historical = pd.DataFrame({
+        'temperatura': rng.normal(7, 9, len(index)),
+        'dregme': rng.uniform(40, 95, len(index)),
+        'vejo_greitis': rng.uniform(0, 15, len(index)),
+        'slegimasJuros': rng.normal(1013, 12, len(index)),
+        'krituliai': rng.exponential(0.3, len(index)),
+    }, index=index)
+    forecast_index = pd.date_range(index[-1] + pd.Timedelta(hours=1), periods=240, freq='h')
+    forecast = historical.iloc[-240:].set_axis(forecast_index)
+    return historical, forecast
+
+
+def separate_report(analyzer: WeatherAnalyzer):
+    """
+    Ataskaitos sekcijos, kiekvieną skaičiuojant atskiru metodu
+    """
+    return {section: getattr(analyzer, method)() for section, method in REPORT_SECTIONS.items()}
+
+
+def bench(stations, report, repeat: int) -> float:
+    """
+    Grąžina geriausią visų stočių ataskaitų laiką sekundėmis (be rezultatų podėlio)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        analyzers = [WeatherAnalyzer(h, f, cache_size=0) for h, f in stations]
+        start = time.perf_counter()
+        for analyzer in analyzers:
+            report(analyzer)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stations', type=int, default=100)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    stations = [make_station(args.days, seed) for seed in range(args.stations)]
+
+    separate = bench(stations, separate_report, args.repeat)
+    single = bench(stations, WeatherAnalyzer.generate_summary_report, args.repeat)
+
+    print(f"Stočių: {args.stations}, įrašų stočiai: {args.days * 24}")
+    print(f"  atskiri metodai: {separate * 1000:8.1f} ms "
+          f"({separate / args.stations * 1000:6.2f} ms/stočiai)")
+    print(f"  vienas praėjimas: {single * 1000:7.1f} ms "
+          f"({single / args.stations * 1000:6.2f} ms/stočiai)")
+    print(f"  pagreitėjimas: {separate / single:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
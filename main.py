@@ -10,9 +10,14 @@ from typing import Dict, Any
 
 # Importuojame mūsų modulius
 from src.weather_api import WeatherAPI
+from src.response_cache import ResponseCache
+from src.observation_store import ObservationStore
+from src.forecast_archive import ForecastArchive
 from src.data_analysis import WeatherAnalyzer
-from src.visualization import WeatherVisualizer
-from src.interpolation import TemperatureInterpolator
+
+# WeatherVisualizer (matplotlib, seaborn) ir TemperatureInterpolator (scipy)
+# importuojami tik prieš naudojimą, kad meniu ir prognozių nuskaitymas
+# nelauktų grafikų bibliotekų įkėlimo
 
 # Konfigūruojame logging sistemą
 logging.basicConfig(
@@ -40,18 +45,28 @@ def main():
         
         # Inicializuojame API objektą Vilniui
         print("Inicializuojama API prisijungimas...")
-        api = WeatherAPI('vilnius')
+        # Kai API lėtas ar nepasiekiamas, iki 3 val. pasenę atsakymai grąžinami iš
+        # karto ir atnaujinami fone
+        api = WeatherAPI('vilnius', cache=ResponseCache('data/http_cache.sqlite'),
+                         observation_store=ObservationStore('data/observations.sqlite'),
+                         stale_ttl=3 * 3600)
         
-        # Nustatome datos intervalą (paskutinės 30 dienų)
+        # Nustatome datos intervalą (paskutiniai metai)
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
+        start_date = end_date - timedelta(days=365)
         
         start_date_str = start_date.strftime('%Y-%m-%d')
         end_date_str = end_date.strftime('%Y-%m-%d')
         
-        print("DĖMESIO: Istoriniai duomenys neprieinami per meteo.lt API")
-        print("Naudojami tik prognozės duomenys (realūs API duomenys)")
-        historical_data = None
+        # Istoriniai stebėjimai: siunčiamos tik saugykloje dar nesančios dienos
+        print("Sinchronizuojami istoriniai stebėjimai (pirmą kartą gali užtrukti)...")
+        historical_data = api.get_historical_data(start_date_str, end_date_str)
+        
+        if historical_data is None or historical_data.empty:
+            print("ĮSPĖJIMAS: Nepavyko gauti istorinių duomenų")
+            historical_data = None
+        else:
+            print(f"Gauti istoriniai duomenys: {len(historical_data)} įrašų")
         
         # Gauname prognozės duomenis
         print("Nuskaitoma oro prognozė...")
@@ -63,18 +78,21 @@ def main():
         else:
             print(f"Gauti prognozės duomenys: {len(forecast_data)} įrašų")
             
-        # Išsaugome duomenis (tik prognozės duomenis)
+        # Archyvuojame prognozės leidimą (jau išsaugoti leidimai praleidžiami)
         if forecast_data is not None:
-            forecast_data.to_csv('data/forecast_data.csv', encoding='utf-8')
-            print("Prognozės duomenys išsaugoti: data/forecast_data.csv")
+            archive = ForecastArchive('data/forecast_archive')
+            if archive.capture(api):
+                print("Prognozės leidimas archyvuotas: data/forecast_archive")
+            else:
+                print("Šis prognozės leidimas jau archyvuotas")
             
-        # Inicializuojame analizės objektą (tik su prognozės duomenimis)
+        # Inicializuojame analizės objektą
         if forecast_data is None or forecast_data.empty:
             print("KLAIDA: Nepavyko gauti prognozės duomenų iš API")
             return
             
         print("Atliekama duomenų analizė su realiais API duomenimis...")
-        analyzer = WeatherAnalyzer(historical_data=None, forecast_data=forecast_data)
+        analyzer = WeatherAnalyzer(historical_data=historical_data, forecast_data=forecast_data)
         
         # Apskaičiuojame metinius vidurkius
         yearly_averages = analyzer.calculate_yearly_averages()
@@ -105,7 +123,8 @@ def main():
             
         # Sukuriame vizualizacijas su realiais API duomenimis
         print("\nKuriamos vizualizacijos su realiais meteo.lt API duomenimis...")
-        visualizer = WeatherVisualizer(historical_data=None, forecast_data=forecast_data)
+        from src.visualization import WeatherVisualizer
+        visualizer = WeatherVisualizer(historical_data=historical_data, forecast_data=forecast_data)
         
         # Temperatūros tendencijų grafikas
         temp_plot = visualizer.plot_temperature_trend()
@@ -142,6 +161,7 @@ def main():
                 time_str = timestamp.strftime('%Y-%m-%d %H:%M:%S')
                 temp_series[time_str] = row['temperatura']
                 
+            from src.interpolation import TemperatureInterpolator
             interpolator = TemperatureInterpolator(temp_series)
             
             # Lyginame interpoliacijos metodus
@@ -203,31 +223,33 @@ def demo_multiple_cities():
     print("KELIŲ MIESTŲ DEMO REŽIMAS")
     print("=" * 40)
     
-    for city in cities:
-        try:
-            print(f"Nuskaitomi {city.title()} prognozės duomenys...")
-            api = WeatherAPI(city)
-            
-            # Gauname prognozės duomenis (nes istoriniai neprieinami)
-            data = api.get_forecast_data(days=7)
+    print(f"Lygiagrečiai nuskaitomi {len(cities)} miestų prognozės duomenys...")
+    try:
+        api = WeatherAPI(cities[0], cache=ResponseCache('data/http_cache.sqlite'))
+        # Gauname prognozės duomenis (nes istoriniai neprieinami)
+        forecasts = api.fetch_forecasts(cities, days=7)
+    except Exception as e:
+        print(f"Klaida nuskaitant miestų duomenis: {e}")
+        forecasts = {}
+        
+    for city, data in forecasts.items():
+        if data is not None and not data.empty:
+            city_data[city] = data
+            print(f"  {city.title()}: {len(data)} prognozės įrašų")
             
-            if data is not None and not data.empty:
-                city_data[city] = data
-                print(f"  {city.title()}: {len(data)} prognozės įrašų")
-                
-                # Greitų statistikos iš prognozės duomenų
-                if 'temperatura' in data.columns:
-                    avg_temp = data['temperatura'].mean()
-                    min_temp = data['temperatura'].min()
-                    max_temp = data['temperatura'].max()
-                    print(f"  Vidutinė temperatūra: {avg_temp:.1f}°C")
-                    print(f"  Temperatūros diapazonas: {min_temp:.1f}°C - {max_temp:.1f}°C")
-                    
-        except Exception as e:
-            print(f"Klaida nuskaitant {city} duomenis: {e}")
+            # Greitų statistikos iš prognozės duomenų
+            if 'temperatura' in data.columns:
+                avg_temp = data['temperatura'].mean()
+                min_temp = data['temperatura'].min()
+                max_temp = data['temperatura'].max()
+                print(f"  Vidutinė temperatūra: {avg_temp:.1f}°C")
+                print(f"  Temperatūros diapazonas: {min_temp:.1f}°C - {max_temp:.1f}°C")
+        else:
+            print(f"Klaida nuskaitant {city} duomenis")
             
     if len(city_data) > 1:
         # Sukuriame miestų palyginimo grafiką
+        from src.visualization import WeatherVisualizer
         visualizer = WeatherVisualizer()
         comparison_plot = visualizer.plot_city_comparison(city_data)
         if comparison_plot:
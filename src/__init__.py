@@ -1,11 +1,43 @@
 # -*- coding: utf-8 -*-
 """
 Oro duomenų analizės sistemos pagrindiniai moduliai
+
+Klasės importuojamos tingiai (PEP 562): `import src` nieko neįkelia, o modulis
+(ir jo priklausomybės - matplotlib, seaborn, scipy) importuojamas tik pirmą
+kartą kreipiantis į atitinkamą klasę.
 """
-from .weather_api import WeatherAPI
-from .data_analysis import WeatherAnalyzer
-from .visualization import WeatherVisualizer
-from .interpolation import TemperatureInterpolator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .weather_api import WeatherAPI
+    from .data_analysis import WeatherAnalyzer
+    from .visualization import WeatherVisualizer
+    from .interpolation import TemperatureInterpolator
 
 __version__ = "1.0.0"
-__all__ = ["WeatherAPI", "WeatherAnalyzer", "WeatherVisualizer", "TemperatureInterpolator"]
\ No newline at end of file
+__all__ = ["WeatherAPI", "WeatherAnalyzer", "WeatherVisualizer", "TemperatureInterpolator"]
+
+# Viešas pavadinimas -> modulis, kuriame jis apibrėžtas
+_LAZY_ATTRIBUTES = {
+    "WeatherAPI": ".weather_api",
+    "WeatherAnalyzer": ".data_analysis",
+    "WeatherVisualizer": ".visualization",
+    "TemperatureInterpolator": ".interpolation",
+}
+
+
+def __getattr__(name: str):
+    """
+    Importuoja klasės modulį pirmo kreipimosi metu ir išsaugo rezultatą
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
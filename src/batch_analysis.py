@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Daugelio vietovių analizė procesų telkinyje
+
+Kiekvienos vietovės ataskaita (generate_summary_report, calculate_correlations)
+skaičiuojama atskirame procese. Duomenys darbuotojams perduodami ne DataFrame
+serializacija: failai - keliu (darbuotojas juos skaito dalimis), o atmintyje
+esantys DataFrame - per bendrą atmintį (multiprocessing.shared_memory), kurią
+darbuotojas prijungia be kopijavimo.
+
+Paleidimas:
+    python -m src.batch_analysis vilnius=data/vilnius.csv kaunas=data/kaunas.parquet --workers 8
+"""
+import argparse
+import gc
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Optional, Dict, Any, List, Mapping, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .data_analysis import WeatherAnalyzer
+    from .chunked_analysis import ChunkedWeatherAnalyzer, iter_frame_chunks
+except ImportError:
+    from data_analysis import WeatherAnalyzer
+    from chunked_analysis import ChunkedWeatherAnalyzer, iter_frame_chunks
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SharedFrame:
+    """
+    DataFrame skaitinių stulpelių aprašas bendroje atmintyje
+
+    Bloke laikomas int64 laiko indeksas (ns) ir po jo float64 stulpelių matrica
+    (eilutėmis), todėl procesui perduodamas tik šis mažas aprašas.
+    """
+    name: str
+    rows: int
+    columns: List[str]
+    tz: Optional[str]
+    index_name: Optional[str] = None
+
+    @classmethod
+    def create(cls, df: pd.DataFrame) -> Tuple['SharedFrame', shared_memory.SharedMemory]:
+        """
+        Nukopijuoja DataFrame skaitinius stulpelius į naują bendros atminties bloką
+
+        Args:
+            df (pd.DataFrame): Duomenys su DatetimeIndex
+
+        Returns:
+            Tuple[SharedFrame, SharedMemory]: Aprašas ir blokas (kūrėjas jį uždaro ir pašalina)
+        """
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("Bendrai atminčiai reikalingas DatetimeIndex")
+        columns = list(df.select_dtypes(include=[np.number]).columns)
+        rows = len(df)
+        block = shared_memory.SharedMemory(create=True, size=max(1, rows * (len(columns) + 1) * 8))
+        descriptor = cls(name=block.name, rows=rows, columns=columns,
+                         tz=str(df.index.tz) if df.index.tz is not None else None,
+                         index_name=df.index.name)
+        try:
+            index, values = descriptor._arrays(block)
+            index[:] = df.index.asi8
+            values[:] = df[columns].to_numpy(dtype=np.float64)
+        except BaseException:
+            # Blokas dar negrąžintas kvietėjui, todėl jį pašalina pats create()
+            index = values = None
+            block.close()
+            block.unlink()
+            raise
+        return descriptor, block
+
+    def _arrays(self, block: shared_memory.SharedMemory) -> Tuple[np.ndarray, np.ndarray]:
+        index = np.ndarray((self.rows,), dtype=np.int64, buffer=block.buf)
+        values = np.ndarray((self.rows, len(self.columns)), dtype=np.float64,
+                            buffer=block.buf, offset=self.rows * 8)
+        return index, values
+
+    def attach(self) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+        """
+        Prijungia bloką ir grąžina DataFrame, kurio stulpeliai rodo į bendrą atmintį
+
+        Returns:
+            Tuple[DataFrame, SharedMemory]: Duomenys ir blokas (uždaryti baigus darbą)
+        """
+        try:
+            block = shared_memory.SharedMemory(name=self.name, track=False)
+        except TypeError:
+            # Python < 3.13: prijungtas blokas neturi būti pašalintas darbuotojui baigus darbą
+            from multiprocessing import resource_tracker
+            block = shared_memory.SharedMemory(name=self.name)
+            resource_tracker.unregister(block._name, 'shared_memory')
+        index, values = self._arrays(block)
+        time_index = pd.DatetimeIndex(index.view('datetime64[ns]'), name=self.index_name)
+        if self.tz is not None:
+            time_index = time_index.tz_localize('UTC').tz_convert(self.tz)
+        frame = pd.DataFrame(values, index=time_index, columns=self.columns, copy=False)
+        return frame, block
+
+
+DataRef = Union[str, os.PathLike, SharedFrame, None]
+
+
+def _load(ref: DataRef, chunksize: int) -> Tuple[Optional[pd.DataFrame], Optional[shared_memory.SharedMemory]]:
+    """
+    Prognozė įkeliama į atmintį (iš failo ar bendros atminties)
+    """
+    if ref is None:
+        return None, None
+    if isinstance(ref, SharedFrame):
+        return ref.attach()
+    chunks = list(iter_frame_chunks(ref, chunksize))
+    return (pd.concat(chunks) if chunks else pd.DataFrame()), None
+
+
+def analyze_place(place: str, historical: DataRef, forecast: DataRef = None,
+                  chunksize: int = 100_000) -> Dict[str, Any]:
+    """
+    Vienos vietovės analizė (vykdoma darbuotojo procese)
+
+    Args:
+        place (str): Vietovės kodas
+        historical: Istorinių duomenų failas/katalogas arba SharedFrame
+        forecast: Prognozės failas arba SharedFrame
+        chunksize (int): Eilučių skaičius dalyje, skaitant failus
+
+    Returns:
+        Dict: vieta, ataskaita, koreliacijos (žodynas)
+
+    Raises:
+        ValueError: Jei ataskaita tuščia (analizė nepavyko)
+    """
+    blocks = []
+    try:
+        forecast_data, block = _load(forecast, chunksize)
+        blocks.append(block)
+        if isinstance(historical, SharedFrame):
+            historical_data, block = historical.attach()
+            blocks.append(block)
+            analyzer = WeatherAnalyzer(historical_data, forecast_data)
+        else:
+            if not os.path.exists(historical):
+                raise FileNotFoundError(f"Duomenų šaltinis nerastas: {historical}")
+            analyzer = ChunkedWeatherAnalyzer(historical, forecast_data, chunksize=chunksize)
+        report = analyzer.generate_summary_report()
+        if not report:
+            # WeatherAnalyzer klaidą tik registruoja ir grąžina tuščią žodyną
+            raise ValueError(f"Nepavyko sugeneruoti {place} ataskaitos")
+        correlations = analyzer.calculate_correlations()
+        return {
+            'vieta': place,
+            'ataskaita': report,
+            'koreliacijos': correlations.to_dict() if correlations is not None else None,
+        }
+    finally:
+        # DataFrame rodo į bloką, todėl jis uždaromas tik atlaisvinus nuorodas
+        analyzer = historical_data = forecast_data = None
+        gc.collect()
+        for block in blocks:
+            if block is not None:
+                block.close()
+
+
+def run_batch(sources: Mapping[str, Any], max_workers: Optional[int] = None,
+              chunksize: int = 100_000) -> Dict[str, Any]:
+    """
+    Analizuoja daugelį vietovių procesų telkinyje ir sujungia rezultatus
+
+    Args:
+        sources (Mapping): Vietovės kodas -> istorinių duomenų šaltinis (failo kelias,
+            Parquet katalogas ar DataFrame) arba {'historical': ..., 'forecast': ...}.
+            DataFrame perduodami per bendrą atmintį - tik skaitiniai stulpeliai
+            (float64); tekstiniai stulpeliai (pvz. conditionCode) darbuotojo
+            analizėje nedalyvauja.
+        max_workers (int, optional): Procesų skaičius (numatytasis - CPU branduolių; 1 - be telkinio)
+        chunksize (int): Eilučių skaičius dalyje, skaitant failus
+
+    Returns:
+        Dict: analizės_data, vietovių_skaičius, vietovės {vieta: ataskaita},
+            koreliacijos {vieta: matrica}, klaidos {vieta: klaidos tekstas}
+    """
+    blocks: List[shared_memory.SharedMemory] = []
+
+    def reference(value):
+        if value is None or isinstance(value, (str, os.PathLike)):
+            return value
+        if isinstance(value, pd.DataFrame):
+            descriptor, block = SharedFrame.create(value)
+            blocks.append(block)
+            return descriptor
+        raise ValueError(f"Nepalaikomas duomenų šaltinis: {type(value).__name__}")
+
+    combined = {
+        'analizės_data': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'vietovių_skaičius': len(sources),
+        'vietovės': {},
+        'koreliacijos': {},
+        'klaidos': {},
+    }
+    try:
+        jobs = {}
+        for place, source in sources.items():
+            try:
+                if isinstance(source, Mapping):
+                    jobs[place] = (reference(source.get('historical')), reference(source.get('forecast')))
+                else:
+                    jobs[place] = (reference(source), None)
+            except Exception as e:
+                combined['klaidos'][place] = str(e)
+
+        if max_workers == 1:
+            outcomes = {}
+            for place, (historical, forecast) in jobs.items():
+                try:
+                    outcomes[place] = analyze_place(place, historical, forecast, chunksize)
+                except Exception as e:
+                    outcomes[place] = e
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {place: pool.submit(analyze_place, place, historical, forecast, chunksize)
+                           for place, (historical, forecast) in jobs.items()}
+                outcomes = {}
+                for place, future in futures.items():
+                    try:
+                        outcomes[place] = future.result()
+                    except Exception as e:
+                        outcomes[place] = e
+
+        for place in sources:
+            outcome = outcomes.get(place) if place not in combined['klaidos'] else None
+            if isinstance(outcome, Exception):
+                logger.error(f"Klaida analizuojant {place}: {outcome}")
+                combined['klaidos'][place] = str(outcome)
+            elif outcome is not None:
+                combined['vietovės'][place] = outcome['ataskaita']
+                combined['koreliacijos'][place] = outcome['koreliacijos']
+
+        logger.info(f"Išanalizuota vietovių: {len(combined['vietovės'])}, "
+                    f"klaidų: {len(combined['klaidos'])}")
+        return combined
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Daugelio vietovių oro duomenų analizė procesų telkinyje")
+    parser.add_argument('sources', nargs='+', help="vieta=kelias (CSV, Parquet failas ar katalogas)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--output', default='data/batch_analysis.json')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    sources = {}
+    for item in args.sources:
+        place, _, path = item.partition('=')
+        if not path:
+            parser.error(f"Šaltinis turi būti vieta=kelias: {item}")
+        sources[place] = path
+
+    result = run_batch(sources, max_workers=args.workers, chunksize=args.chunksize)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+    print(f"Ataskaita išsaugota: {args.output} ({len(result['vietovės'])} vietovių, "
+          f"{len(result['klaidos'])} klaidų)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+Analizė dalimis (out-of-core) daugiamečiams CSV ir Parquet archyvams
+
+ChunkedWeatherAnalyzer turi tuos pačius metodus kaip WeatherAnalyzer, bet
+istorinių duomenų į atmintį neįkelia: šaltinis (CSV failas, Parquet failas ar
+katalogas, DataFrame dalių iteratorius) perskaitomas vienu praėjimu, kaupiant
+tik srautinę statistiką, dienų sumas ir koreliacijos sumas. Atmintyje laikoma
+viena dalis ir paskutinių 365 dienų eilutės metiniams vidurkiams.
+
+Paleidimas:
+    python -m src.chunked_analysis data/historical_data.csv --forecast data/forecast_data.csv
+"""
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union, Callable
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .data_analysis import WeatherAnalyzer, frame_fingerprint, REPORT_SECTIONS
+    from .streaming_stats import StreamingAnalysis, RunningStats
+    from .rolling_stats import daily_totals
+    from .correlation import IncrementalCorrelation
+    from .extremes import TopKExtremes
+    from .forecast_parser import FORECAST_COLUMN_MAPPING
+    from .observation_store import OBSERVATION_COLUMN_MAPPING
+except ImportError:
+    from data_analysis import WeatherAnalyzer, frame_fingerprint, REPORT_SECTIONS
+    from streaming_stats import StreamingAnalysis, RunningStats
+    from rolling_stats import daily_totals
+    from correlation import IncrementalCorrelation
+    from extremes import TopKExtremes
+    from forecast_parser import FORECAST_COLUMN_MAPPING
+    from observation_store import OBSERVATION_COLUMN_MAPPING
+
+logger = logging.getLogger(__name__)
+
+# Laiko stulpeliai pagal pirmenybę: UTC (vienareikšmiai), tada vietinis laikas su poslinkiu
+UTC_TIME_COLUMNS = ('observationTimeUtc', 'forecastTimeUtc')
+LOCAL_TIME_COLUMNS = ('observationTimeLocal', 'forecastTimeLocal', 'observationTime', 'forecastTime')
+
+COLUMN_MAPPING = {**FORECAST_COLUMN_MAPPING, **OBSERVATION_COLUMN_MAPPING}
+
+# Kiek dalių dienų sumų kaupiama prieš jas sutraukiant
+_TOTALS_COMPACT_EVERY = 64
+
+ChunkSource = Union[str, os.PathLike, pd.DataFrame, Iterable[pd.DataFrame],
+                    Callable[[], Iterable[pd.DataFrame]]]
+
+
+def normalize_chunk(df: pd.DataFrame, tz='Europe/Vilnius') -> pd.DataFrame:
+    """
+    Paverčia nuskaitytą dalį į WeatherAnalyzer formatą
+
+    Laiko indeksas sudaromas iš UTC arba vietinio laiko stulpelio (jei indeksas
+    dar ne DatetimeIndex), API stulpeliai pervadinami lietuviškai.
+
+    Args:
+        df (pd.DataFrame): Nuskaityta dalis
+        tz: Vietinė laiko zona
+
+    Returns:
+        pd.DataFrame: Dalis su vietinio laiko DatetimeIndex
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        for column in UTC_TIME_COLUMNS + LOCAL_TIME_COLUMNS:
+            if column in df.columns:
+                index = pd.DatetimeIndex(pd.to_datetime(df[column], utc=True))
+                df = df.set_axis(index.tz_convert(tz).rename(column), axis=0)
+                break
+        else:
+            index = _first_column_index(df, tz)
+            if index is None:
+                raise ValueError(f"Dalyje nėra laiko stulpelio: {list(df.columns)}")
+            df = df.iloc[:, 1:].set_axis(index, axis=0)
+    elif df.index.tz is None:
+        df = df.tz_localize(tz, ambiguous='NaT', nonexistent='NaT')
+
+    df = df.rename(columns=COLUMN_MAPPING)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
+def _first_column_index(df: pd.DataFrame, tz) -> Optional[pd.DatetimeIndex]:
+    """
+    Laiko indeksas iš pirmo tekstinio stulpelio (pvz. 'Unnamed: 0' po df.to_csv())
+
+    Returns:
+        pd.DatetimeIndex: Vietinio laiko indeksas arba None, jei stulpelis ne laikas
+    """
+    if df.columns.empty or df.iloc[:, 0].dtype != object:
+        return None
+    column = df.columns[0]
+    text = df.iloc[:, 0].astype(str)
+    # Su poslinkiu (+03:00, Z) - vienareikšmis laikas, be jo - vietinis laikas
+    aware = bool(text.str.contains(r'(?:[+-]\d{2}:?\d{2}|Z)$').all())
+    try:
+        index = pd.DatetimeIndex(pd.to_datetime(text, utc=aware))
+    except (ValueError, TypeError):
+        return None
+    index = (index.tz_convert(tz) if aware
+             else index.tz_localize(tz, ambiguous='NaT', nonexistent='NaT'))
+    return index.rename(None if str(column).startswith('Unnamed') else column)
+
+
+def _parquet_files(path: str) -> List[str]:
+    if os.path.isfile(path):
+        return [path]
+    files = []
+    for directory, _, names in os.walk(path):
+        files.extend(os.path.join(directory, name) for name in names if name.endswith('.parquet'))
+    return sorted(files)
+
+
+def iter_frame_chunks(source: ChunkSource, chunksize: int = 100_000,
+                      tz='Europe/Vilnius') -> Iterator[pd.DataFrame]:
+    """
+    Iteruoja šaltinio dalis WeatherAnalyzer formatu
+
+    Args:
+        source: CSV failas, Parquet failas ar katalogas (pvz. place=.../month=...),
+            DataFrame, DataFrame iteratorius arba funkcija, grąžinanti iteratorių
+        chunksize (int): Eilučių skaičius dalyje (CSV ir Parquet)
+        tz: Vietinė laiko zona
+
+    Yields:
+        pd.DataFrame: Dalis su DatetimeIndex ir lietuviškais stulpeliais
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if os.path.isdir(path) or path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            for file_path in _parquet_files(path):
+                for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunksize):
+                    yield normalize_chunk(batch.to_pandas(), tz)
+        else:
+            with pd.read_csv(path, chunksize=chunksize, float_precision='round_trip') as reader:
+                for chunk in reader:
+                    yield normalize_chunk(chunk, tz)
+        return
+
+    if isinstance(source, pd.DataFrame):
+        chunks: Iterable[pd.DataFrame] = (source.iloc[start:start + chunksize]
+                                          for start in range(0, len(source), chunksize))
+    elif callable(source):
+        chunks = source()
+    else:
+        chunks = source
+    for chunk in chunks:
+        if chunk is not None and not chunk.empty:
+            yield normalize_chunk(chunk, tz)
+
+
+class ChunkedWeatherAnalyzer(WeatherAnalyzer):
+    """
+    WeatherAnalyzer, skaitantis istorinius duomenis dalimis iš failo ar iteratoriaus
+
+    Pirmas analizės metodo kvietimas vienu praėjimu apskaičiuoja visų metodų
+    kaupiklius; kiti metodai naudoja jų rezultatus. Kitam dienos langui ar
+    stulpelių rinkiniui (analyze_day_night) šaltinis perskaitomas dar kartą, todėl
+    vienkartinis iteratorius tinka tik numatytiesiems parametrams.
+    """
+
+    def __init__(self, source: ChunkSource, forecast_data=None, chunksize: int = 100_000,
+                 tz='Europe/Vilnius', cache_size: int = 32):
+        """
+        Inicializuoja ChunkedWeatherAnalyzer objektą
+
+        Args:
+            source: Istorinių duomenų šaltinis (žr. iter_frame_chunks); dalys
+                turi būti chronologine tvarka
+            forecast_data (pd.DataFrame | šaltinis, optional): Prognozė (įkeliama į atmintį)
+            chunksize (int): Eilučių skaičius dalyje
+            tz: Vietinė laiko zona
+            cache_size (int): Kiek analizės rezultatų įsiminti
+        """
+        self.source = source
+        self.chunksize = chunksize
+        self.tz = tz
+        self._scan_state: Optional[Dict[str, Any]] = None
+        self._one_shot = (not isinstance(source, (str, os.PathLike, pd.DataFrame, list, tuple))
+                          and not callable(source))
+        self._consumed = False
+        if forecast_data is not None and not isinstance(forecast_data, pd.DataFrame):
+            chunks = list(iter_frame_chunks(forecast_data, chunksize, tz))
+            forecast_data = pd.concat(chunks) if chunks else pd.DataFrame()
+        super().__init__(None, forecast_data, cache_size=cache_size)
+
+    def _source_fingerprint(self) -> Tuple:
+        if isinstance(self.source, (str, os.PathLike)):
+            path = os.fspath(self.source)
+            files = _parquet_files(path) if os.path.isdir(path) else [path]
+            return tuple((file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+                         for file_path in files if os.path.exists(file_path))
+        if isinstance(self.source, pd.DataFrame):
+            return frame_fingerprint(self.source)
+        return ('source', id(self.source))
+
+    def _fingerprints(self) -> Tuple:
+        return (self._source_fingerprint(), frame_fingerprint(self.forecast_data))
+
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Iteruoja istorinių duomenų dalis
+
+        Raises:
+            RuntimeError: Kai vienkartinis iteratorius jau perskaitytas
+        """
+        if self._one_shot:
+            if self._consumed:
+                raise RuntimeError("Vienkartinis dalių iteratorius jau perskaitytas")
+            self._consumed = True
+        return iter_frame_chunks(self.source, self.chunksize, self.tz)
+
+    def _forecast(self) -> Optional[pd.DataFrame]:
+        if self.forecast_data is None or self.forecast_data.empty:
+            return None
+        return self.forecast_data
+
+    def _scan(self) -> Dict[str, Any]:
+        """
+        Vienas praėjimas per šaltinį: srautinė statistika, dienų sumos ir koreliacijos sumos
+        """
+        fingerprint = self._fingerprints()
+        if self._scan_state is not None and self._scan_state['fingerprint'] == fingerprint:
+            return self._scan_state
+
+        forecast = self._forecast()
+        engine: Optional[StreamingAnalysis] = None
+        correlation: Optional[IncrementalCorrelation] = None
+        numeric: List[str] = []
+        sums: List[pd.DataFrame] = []
+        counts: List[pd.DataFrame] = []
+        rows = 0
+
+        for chunk in self.chunks():
+            if engine is None:
+                numeric = list(chunk.select_dtypes(include=[np.number]).columns)
+                common = numeric
+                if forecast is not None:
+                    common = [column for column in numeric if column in forecast.columns
+                              and pd.api.types.is_numeric_dtype(forecast[column])]
+                engine = StreamingAnalysis(
+                    extreme_columns=None if forecast is None else set(chunk.columns) & set(forecast.columns))
+                correlation = IncrementalCorrelation(common)
+
+            rows += len(chunk)
+            engine.update(chunk)
+            correlation.update(chunk)
+            chunk_sums, chunk_counts = daily_totals(chunk, numeric)
+            sums.append(chunk_sums)
+            counts.append(chunk_counts)
+            if len(sums) >= _TOTALS_COMPACT_EVERY:
+                sums = [pd.concat(sums).groupby(level=0).sum()]
+                counts = [pd.concat(counts).groupby(level=0).sum()]
+
+        if engine is not None and forecast is not None:
+            engine.update(forecast, historical=False)
+            correlation.update(forecast)
+
+        self._scan_state = {
+            'fingerprint': fingerprint,
+            'rows': rows,
+            'engine': engine or StreamingAnalysis(),
+            'correlation': correlation,
+            'sums': pd.concat(sums).groupby(level=0).sum() if sums else pd.DataFrame(),
+            'counts': pd.concat(counts).groupby(level=0).sum() if counts else pd.DataFrame(),
+        }
+        logger.info(f"Perskaityta {rows} istorinių įrašų dalimis")
+        return self._scan_state
+
+    def combine_data(self) -> pd.DataFrame:
+        """
+        Dalimis skaitomi duomenys nesujungiami į vieną DataFrame
+        """
+        logger.warning("ChunkedWeatherAnalyzer nesujungia duomenų atmintyje")
+        return pd.DataFrame()
+
+    def calculate_yearly_averages(self) -> Dict[str, float]:
+        try:
+            results = self._scan()['engine'].yearly_averages()
+            if not results:
+                logger.error("Nėra istorinių duomenų metinių vidurkių skaičiavimui")
+            return results
+        except Exception as e:
+            logger.error(f"Klaida skaičiuojant metinius vidurkius: {e}")
+            return {}
+
+    def _day_night_stats(self, columns: Optional[Iterable[str]], day_start: int,
+                         day_end: int) -> Dict[str, Tuple[RunningStats, RunningStats]]:
+        stats: Dict[str, Tuple[RunningStats, RunningStats]] = {}
+        wanted = None if columns is None else list(columns)
+        for chunk in self.chunks():
+            hours = np.asarray(chunk.index.hour)
+            if day_start < day_end:
+                day_mask = (hours >= day_start) & (hours < day_end)
+            else:
+                day_mask = (hours >= day_start) | (hours < day_end)
+            chunk_columns = (chunk.select_dtypes(include=[np.number]).columns if wanted is None
+                             else [column for column in wanted if column in chunk.columns])
+            for column in chunk_columns:
+                values = chunk[column].to_numpy(dtype=np.float64)
+                day, night = stats.setdefault(column, (RunningStats(), RunningStats()))
+                day.update(values[day_mask])
+                night.update(values[~day_mask])
+        return stats
+
+    @staticmethod
+    def _period_stats(stats: RunningStats) -> Dict[str, float]:
+        if stats.count == 0:
+            return {'vidutinė': np.nan, 'maksimali': np.nan, 'minimali': np.nan}
+        return {'vidutinė': round(stats.mean, 2), 'maksimali': round(stats.max, 2),
+                'minimali': round(stats.min, 2)}
+
+    def analyze_day_night(self, columns: Optional[Iterable[str]] = None,
+                          day_start: int = 8, day_end: int = 20) -> Dict[str, Dict[str, Any]]:
+        self._check_day_window(day_start, day_end)
+        try:
+            results = {}
+            for column, (day, night) in self._day_night_stats(columns, day_start, day_end).items():
+                column_results = {}
+                if day.rows:
+                    column_results['dienos'] = self._period_stats(day)
+                if night.rows:
+                    column_results['nakties'] = self._period_stats(night)
+                if 'dienos' in column_results and 'nakties' in column_results:
+                    column_results['skirtumas'] = round(
+                        column_results['dienos']['vidutinė'] - column_results['nakties']['vidutinė'], 2)
+                results[column] = column_results
+            return results
+        except Exception as e:
+            logger.error(f"Klaida analizuojant dienos/nakties duomenis: {e}")
+            return {}
+
+    def analyze_day_night_temperature(self, day_start: int = 8, day_end: int = 20) -> Dict[str, float]:
+        self._check_day_window(day_start, day_end)
+        try:
+            if (day_start, day_end) == (8, 20):
+                return self._scan()['engine'].day_night_temperature()
+            engine = StreamingAnalysis(day_start=day_start, day_end=day_end)
+            for chunk in self.chunks():
+                engine._update_day_night(chunk)
+                engine.historical_rows += len(chunk)
+            return engine.day_night_temperature()
+        except Exception as e:
+            logger.error(f"Klaida analizuojant dienos/nakties temperatūrą: {e}")
+            return {}
+
+    def calculate_correlations(self) -> Optional[pd.DataFrame]:
+        try:
+            correlation = self._scan()['correlation']
+            if correlation is None or len(correlation.columns) < 2:
+                logger.warning("Nepakanka skaitinių stulpelių koreliacijos analizei")
+                return None
+            return correlation.pearson()
+        except Exception as e:
+            logger.error(f"Klaida skaičiuojant koreliacijas: {e}")
+            return None
+
+    def find_extremes(self) -> Dict[str, Any]:
+        try:
+            return self._scan()['engine'].extremes()
+        except Exception as e:
+            logger.error(f"Klaida ieškant ekstremumų: {e}")
+            return {}
+
+    def find_top_extremes(self, k: int = 10, period: str = 'all',
+                          columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+        try:
+            forecast = self._forecast()
+            engine = TopKExtremes(k, period, columns)
+            historical_columns = set()
+            for chunk in self.chunks():
+                historical_columns.update(chunk.columns)
+                if forecast is not None:
+                    # Kaip combined_data: tik bendri istorinių ir prognozės stulpeliai
+                    chunk = chunk[[column for column in chunk.columns if column in forecast.columns]]
+                engine.update(chunk)
+            if engine.rows == 0:
+                logger.error("Nėra duomenų ekstremumų paieškai")
+                return None
+            if forecast is not None:
+                engine.update(forecast[[column for column in forecast.columns if column in historical_columns]])
+            return engine.result()
+        except Exception as e:
+            logger.error(f"Klaida ieškant top-{k} ekstremumų: {e}")
+            return None
+
+    def _daily_totals(self, columns: Optional[Iterable[str]]) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        state = self._scan()
+        sums, counts = state['sums'], state['counts']
+        if sums.empty:
+            logger.error("Nėra istorinių duomenų slenkančių vidurkių skaičiavimui")
+            return None
+        if columns is not None:
+            columns = [column for column in columns if column in sums.columns]
+            if not columns:
+                logger.error("Nėra stulpelių slenkančių vidurkių skaičiavimui")
+                return None
+            sums, counts = sums[columns], counts[columns]
+        return sums, counts
+
+    def generate_summary_report(self) -> Dict[str, Any]:
+        """
+        Generuoja ataskaitą (tokios pat struktūros kaip WeatherAnalyzer) vienu praėjimu
+
+        Returns:
+            Dict: Ataskaitos žodynas
+
+        Raises:
+            ValueError, OSError: Jei šaltinio nepavyksta perskaityti
+        """
+        try:
+            rows = self._scan()['rows']
+            forecast = self.forecast_data
+            report = {
+                'analizės_data': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'duomenų_kiekis': {'istoriniai': rows}
+            }
+            if forecast is not None:
+                report['duomenų_kiekis']['prognozės'] = len(forecast)
+                if rows and not forecast.empty:
+                    report['duomenų_kiekis']['bendras'] = rows + len(forecast)
+            for section, method in REPORT_SECTIONS.items():
+                report[section] = getattr(self, method)()
+            logger.info("Sugeneruota išsami analizės ataskaita (dalimis)")
+            return report
+        except Exception as e:
+            # Šaltinio skaitymo klaidos (failas, formatas) perduodamos kvietėjui
+            logger.error(f"Klaida generuojant ataskaitą: {e}")
+            raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oro duomenų analizė dalimis (CSV / Parquet)")
+    parser.add_argument('source', help="CSV failas, Parquet failas arba katalogas")
+    parser.add_argument('--forecast', help="Prognozės CSV ar Parquet")
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--output', help="Ataskaitos JSON failas (numatytasis - stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    analyzer = ChunkedWeatherAnalyzer(args.source, forecast_data=args.forecast,
+                                      chunksize=args.chunksize)
+    report = analyzer.generate_summary_report()
+    text = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Atnaujinama koreliacijos matrica
+
+IncrementalCorrelation kaupia poromis pilnų eilučių (kaip DataFrame.corr())
+pakankamas statistikas: kiekius, sumas, kvadratų ir sandaugų sumas. Naujų k
+eilučių paketas pridedamas per O(k·p²), Pearson matrica apskaičiuojama iš
+sumų per O(p²), o lygiagrečių procesų dalinius rezultatus galima sujungti.
+Apytikslė Spearman koreliacija skaičiuojama iš atsitiktinės eilučių imties
+(reservoir sampling).
+"""
+import copy
+from typing import Iterable, Optional, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalCorrelation:
+    """
+    Koreliacijos matricos kaupiklis
+
+    Reikšmės centruojamos pagal pirmo paketo stulpelių vidurkius, kad kvadratų
+    sumos neprarastų tikslumo (pvz. slėgimui ~1013 hPa).
+    """
+
+    def __init__(self, columns: Iterable[str], sample_size: int = 0, seed: Optional[int] = None):
+        """
+        Inicializuoja IncrementalCorrelation objektą
+
+        Args:
+            columns (Iterable[str]): Stulpeliai
+            sample_size (int): Eilučių imties dydis Spearman koreliacijai (0 - be imties)
+            seed (int, optional): Imties atsitiktinių skaičių generatoriaus sėkla
+        """
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.shift = np.full(size, np.nan)
+        self.n = np.zeros((size, size))
+        self.sx = np.zeros((size, size))
+        self.sxx = np.zeros((size, size))
+        self.sxy = np.zeros((size, size))
+        self.rows = 0
+        self.sample_size = sample_size
+        self.sample = np.empty((0, size))
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, sample_size: int = 0,
+                   seed: Optional[int] = None) -> 'IncrementalCorrelation':
+        """
+        Sukuria kaupiklį iš DataFrame skaitinių stulpelių
+
+        Args:
+            df (pd.DataFrame): Duomenys
+            sample_size (int): Žr. __init__
+            seed (int, optional): Žr. __init__
+
+        Returns:
+            IncrementalCorrelation: Kaupiklis su df eilutėmis
+        """
+        tracker = cls(df.select_dtypes(include=[np.number]).columns, sample_size, seed)
+        tracker.update(df)
+        return tracker
+
+    def _values(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if isinstance(data, pd.DataFrame):
+            return data.reindex(columns=self.columns).to_numpy(dtype=np.float64)
+        values = np.asarray(data, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != len(self.columns):
+            raise ValueError(f"Tikėtasi {len(self.columns)} stulpelių matricos")
+        return values
+
+    def update(self, data: Union[pd.DataFrame, np.ndarray]):
+        """
+        Prideda eilučių paketą
+
+        Args:
+            data: DataFrame (trūkstami stulpeliai laikomi NaN) arba matrica
+                tokia pačia stulpelių tvarka kaip columns
+        """
+        values = self._values(data)
+        if len(values) == 0:
+            return
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        # Stulpeliai be ankstesnių reikšmių neturi sumų, todėl jų centrą galima nustatyti dabar
+        unset = np.isnan(self.shift) & (counts > 0)
+        if unset.any():
+            self.shift[unset] = np.nansum(values[:, unset], axis=0) / counts[unset]
+
+        centered = values - self.shift
+        valid = ~np.isnan(centered)
+        mask = valid.astype(np.float64)
+        filled = np.where(valid, centered, 0.0)
+        self.n += mask.T @ mask
+        self.sx += filled.T @ mask
+        self.sxx += (filled * filled).T @ mask
+        self.sxy += filled.T @ filled
+
+        if self.sample_size > 0:
+            self._update_sample(values)
+        self.rows += len(values)
+
+    def _update_sample(self, values: np.ndarray):
+        free = max(self.sample_size - len(self.sample), 0)
+        if free:
+            self.sample = np.vstack([self.sample, values[:free]])
+        rest = values[free:]
+        if len(rest) == 0:
+            return
+        # Algoritmas R: eilutė t (0-based) pakeičia atsitiktinę vietą su tikimybe k/(t+1)
+        seen = self.rows + free + np.arange(len(rest))
+        slots = self._rng.integers(0, seen + 1)
+        keep = np.flatnonzero(slots < self.sample_size)
+        if len(keep) == 0:
+            return
+        # Ta pati vieta gali būti keičiama kelis kartus - lieka paskutinė eilutė
+        reversed_keep = keep[::-1]
+        _, last = np.unique(slots[reversed_keep], return_index=True)
+        chosen = reversed_keep[last]
+        self.sample[slots[chosen]] = rest[chosen]
+
+    def _rebase(self, shift: np.ndarray):
+        delta = self.shift - shift
+        delta[np.isnan(delta)] = 0.0
+        column = delta[:, None]
+        self.sxy += self.sx * delta[None, :] + column * self.sx.T + np.outer(delta, delta) * self.n
+        self.sxx += 2 * column * self.sx + column ** 2 * self.n
+        self.sx += column * self.n
+        self.shift = shift.copy()
+
+    def merge(self, other: 'IncrementalCorrelation') -> 'IncrementalCorrelation':
+        """
+        Sujungia kito kaupiklio (pvz. kito proceso) statistikas į šį
+
+        Args:
+            other (IncrementalCorrelation): Kaupiklis su tais pačiais stulpeliais
+
+        Returns:
+            IncrementalCorrelation: self
+        """
+        if other.columns != self.columns:
+            raise ValueError("Kaupiklių stulpeliai nesutampa")
+        shift = np.where(np.isnan(self.shift), other.shift, self.shift)
+        incoming = copy.deepcopy(other)
+        incoming._rebase(shift)
+        self._rebase(shift)
+        self.n += incoming.n
+        self.sx += incoming.sx
+        self.sxx += incoming.sxx
+        self.sxy += incoming.sxy
+
+        if self.sample_size > 0:
+            self._merge_sample(incoming)
+        self.rows += other.rows
+        return self
+
+    def _merge_sample(self, other: 'IncrementalCorrelation'):
+        total = self.rows + other.rows
+        size = min(self.sample_size, len(self.sample) + len(other.sample))
+        if total == 0 or size == 0:
+            return
+        # Iš kiekvienos imties imama proporcingai jos matytų eilučių skaičiui
+        own = self._rng.hypergeometric(self.rows, other.rows, size) if other.rows else size
+        own = min(own, len(self.sample))
+        theirs = min(size - own, len(other.sample))
+
+        def pick(sample: np.ndarray, count: int) -> np.ndarray:
+            return sample[self._rng.choice(len(sample), count, replace=False)]
+
+        self.sample = np.vstack([pick(self.sample, own), pick(other.sample, theirs)])
+
+    def pearson(self) -> pd.DataFrame:
+        """
+        Pearson koreliacijos matrica (poromis pilnos eilutės)
+
+        Returns:
+            pd.DataFrame: Matrica; poros su < 2 eilutėmis ar be sklaidos - NaN
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self.sxy - self.sx * self.sx.T / self.n
+            var_x = self.sxx - self.sx ** 2 / self.n
+            var_y = var_x.T
+            result = cov / np.sqrt(var_x * var_y)
+        result[(self.n < 2) | (var_x <= 0) | (var_y <= 0)] = np.nan
+        return pd.DataFrame(np.clip(result, -1.0, 1.0), index=self.columns, columns=self.columns)
+
+    def spearman(self) -> pd.DataFrame:
+        """
+        Apytikslė Spearman koreliacijos matrica iš eilučių imties
+
+        Returns:
+            pd.DataFrame: Matrica (tiksli, kol eilučių ne daugiau nei sample_size)
+        """
+        if self.sample_size <= 0:
+            raise ValueError("Spearman koreliacijai reikalingas sample_size > 0")
+        return pd.DataFrame(self.sample, columns=self.columns).corr(method='spearman')
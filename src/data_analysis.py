@@ -2,14 +2,104 @@
 """
 Oro duomenų analizės modulis
 """
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Hashable, Iterable, Union
 import logging
 
+try:
+    from .streaming_stats import StreamingAnalysis
+    from .rolling_stats import daily_totals, trailing_means, climate_trends, DEFAULT_WINDOWS
+    from .extremes import top_extremes
+    from .weekend_rain import weekly_weekend_rain, weekend_rain_report
+except ImportError:
+    from streaming_stats import StreamingAnalysis
+    from rolling_stats import daily_totals, trailing_means, climate_trends, DEFAULT_WINDOWS
+    from extremes import top_extremes
+    from weekend_rain import weekly_weekend_rain, weekend_rain_report
+
 logger = logging.getLogger(__name__)
 
+# Ataskaitos sekcija -> ją skaičiuojantis WeatherAnalyzer metodas
+REPORT_SECTIONS = {
+    'metiniai_vidurkiai': 'calculate_yearly_averages',
+    'dienos_nakties_analizė': 'analyze_day_night_temperature',
+    'savaitgalių_lietaus_prognozė': 'analyze_weekend_rain_forecast',
+    'ekstremaliuosius_rodikliai': 'find_extremes',
+}
+
+# Kiek eilučių imama pirštų atspaudo maišos reikšmei (tolygiai per visą lentelę)
+FINGERPRINT_SAMPLE_ROWS = 256
+
+
+def _float_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Grąžina stulpelį float64 tipu
+    
+    Kompaktiškos schemos (float32, uint8) stulpeliai skaičiuojami float64 tikslumu,
+    o float64 stulpeliai grąžinami nekopijuojant.
+    """
+    return df[column].astype(np.float64, copy=False)
+
+
+def frame_fingerprint(df: Optional[pd.DataFrame], full: bool = False) -> Optional[Tuple]:
+    """
+    Apskaičiuoja pigų DataFrame pirštų atspaudą rezultatų podėliui
+    
+    Atspaudą sudaro eilučių skaičius, stulpeliai, tipai, indekso ribos ir
+    tolygiai išrinktų eilučių (reikšmių ir indekso) maišos reikšmė.
+    
+    Args:
+        df (pd.DataFrame, optional): Duomenys
+        full (bool): Maišos reikšmė iš visų eilučių (aptinka bet kokį pakeitimą, O(n))
+        
+    Returns:
+        Tuple: Atspaudas arba None, jei duomenų nėra
+    """
+    if df is None:
+        return None
+    rows = len(df)
+    fingerprint = (rows, tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes))
+    if rows == 0:
+        return fingerprint
+    
+    if full or rows <= FINGERPRINT_SAMPLE_ROWS:
+        sample = df
+    else:
+        positions = np.linspace(0, rows - 1, FINGERPRINT_SAMPLE_ROWS).astype(np.int64)
+        sample = df.iloc[positions]
+    hashes = pd.util.hash_pandas_object(sample, index=True).to_numpy()
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+    return fingerprint + (df.index[0], df.index[-1], digest)
+
+
+def _memoized(method):
+    """
+    WeatherAnalyzer metodo rezultatą įsimena pagal duomenų atspaudus ir argumentus
+    
+    Grąžinama rezultato kopija, todėl kviečiantysis gali ją keisti nesugadindamas
+    podėlio. Tušti rezultatai (klaidos atveju) neįsimenami.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = self._cache_key(method.__name__, args, kwargs)
+        if key is None:
+            return method(self, *args, **kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = method(self, *args, **kwargs)
+        self._cache_put(key, result)
+        return result
+    
+    return wrapper
+
 
 class WeatherAnalyzer:
     """
@@ -17,14 +107,24 @@ class WeatherAnalyzer:
     """
     
     def __init__(self, historical_data: Optional[pd.DataFrame] = None, 
-                 forecast_data: Optional[pd.DataFrame] = None):
+                 forecast_data: Optional[pd.DataFrame] = None,
+                 cache_size: int = 32, strict_fingerprint: bool = False):
         """
         Inicializuoja WeatherAnalyzer objektą
         
         Args:
             historical_data (pd.DataFrame, optional): Istoriniai oro duomenys
             forecast_data (pd.DataFrame, optional): Prognozės duomenys
+            cache_size (int): Kiek analizės rezultatų įsiminti (0 - be podėlio)
+            strict_fingerprint (bool): Atspaudas iš visų eilučių, o ne iš imties
         """
+        self.cache_size = cache_size
+        self.strict_fingerprint = strict_fingerprint
+        self._results: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
         self.historical_data = historical_data
         self.forecast_data = forecast_data
         self.combined_data = None
@@ -32,6 +132,66 @@ class WeatherAnalyzer:
         if historical_data is not None and forecast_data is not None:
             self.combine_data()
             
+    def __setattr__(self, name: str, value: Any):
+        # Naujai priskirti duomenys panaikina įsimintus rezultatus
+        if name in ('historical_data', 'forecast_data', 'combined_data') and '_results' in self.__dict__:
+            self.invalidate_cache()
+        super().__setattr__(name, value)
+        
+    def _fingerprints(self) -> Tuple[Hashable, ...]:
+        return tuple(frame_fingerprint(frame, self.strict_fingerprint)
+                     for frame in (self.historical_data, self.forecast_data, self.combined_data))
+        
+    def _cache_key(self, name: str, args: Tuple = (), kwargs: Optional[Dict] = None,
+                   fingerprints: Optional[Tuple] = None) -> Optional[Tuple]:
+        if self.cache_size <= 0:
+            return None
+        key = (name, args, tuple(sorted((kwargs or {}).items())),
+               fingerprints if fingerprints is not None else self._fingerprints())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+        
+    def _cache_get(self, key: Tuple) -> Any:
+        with self._cache_lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self._cache_hits += 1
+                return copy.deepcopy(self._results[key])
+            self._cache_misses += 1
+            return None
+            
+    def _cache_put(self, key: Optional[Tuple], result: Any):
+        if key is None or result is None or (isinstance(result, dict) and not result):
+            return
+        with self._cache_lock:
+            self._results[key] = copy.deepcopy(result)
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+                
+    def invalidate_cache(self):
+        """
+        Išvalo įsimintus analizės rezultatus
+        
+        Reikalinga tik pakeitus duomenis vietoje (pvz. df.loc[...] = ...) eilutėse,
+        kurios nepateko į atspaudo imtį; priskyrus naujus duomenis podėlis išvalomas automatiškai.
+        """
+        with self._cache_lock:
+            self._results.clear()
+            
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Grąžina podėlio statistiką
+        
+        Returns:
+            Dict: hits, misses, size, max_size
+        """
+        with self._cache_lock:
+            return {'hits': self._cache_hits, 'misses': self._cache_misses,
+                    'size': len(self._results), 'max_size': self.cache_size}
+            
     def combine_data(self) -> pd.DataFrame:
         """
         Sujungia istorinius ir prognozės duomenis
@@ -73,6 +233,7 @@ class WeatherAnalyzer:
             logger.error(f"Klaida sujungiant duomenis: {e}")
             return pd.DataFrame()
             
+    @_memoized
     def calculate_yearly_averages(self) -> Dict[str, float]:
         """
         Apskaičiuoja metinius vidurkius
@@ -100,19 +261,19 @@ class WeatherAnalyzer:
             
             # Apskaičiuojame vidurkius
             if 'temperatura' in yearly_data.columns:
-                avg_temp = yearly_data['temperatura'].mean()
+                avg_temp = _float_column(yearly_data, 'temperatura').mean()
                 results['vidutinė_metų_temperatūra'] = round(avg_temp, 2)
                 
             if 'dregme' in yearly_data.columns:
-                avg_humidity = yearly_data['dregme'].mean()
+                avg_humidity = _float_column(yearly_data, 'dregme').mean()
                 results['vidutinė_metų_drėgmė'] = round(avg_humidity, 2)
                 
             if 'vejo_greitis' in yearly_data.columns:
-                avg_wind = yearly_data['vejo_greitis'].mean()
+                avg_wind = _float_column(yearly_data, 'vejo_greitis').mean()
                 results['vidutinis_vėjo_greitis'] = round(avg_wind, 2)
                 
             if 'slegimasJuros' in yearly_data.columns:
-                avg_pressure = yearly_data['slegimasJuros'].mean()
+                avg_pressure = _float_column(yearly_data, 'slegimasJuros').mean()
                 results['vidutinis_slėgimas'] = round(avg_pressure, 2)
                 
             logger.info(f"Apskaičiuoti metiniai vidurkiai: {len(results)} parametrų")
@@ -122,118 +283,248 @@ class WeatherAnalyzer:
             logger.error(f"Klaida skaičiuojant metinius vidurkius: {e}")
             return {}
             
-    def analyze_day_night_temperature(self) -> Dict[str, float]:
+    @staticmethod
+    def _check_day_window(day_start: int, day_end: int):
+        if not (0 <= day_start <= 24 and 0 <= day_end <= 24) or day_start == day_end:
+            raise ValueError(f"Netinkamas dienos langas: {day_start}-{day_end}")
+            
+    def _day_mask(self, day_start: int, day_end: int) -> np.ndarray:
         """
-        Analizuoja dienos ir nakties temperatūros skirtumus
+        Dienos valandų kaukė tiesiai iš indekso (be DataFrame kopijos)
+        
+        Jei day_start > day_end, langas eina per vidurnaktį (pvz. 22-6).
+        """
+        hours = np.asarray(self.historical_data.index.hour)
+        if day_start < day_end:
+            return (hours >= day_start) & (hours < day_end)
+        return (hours >= day_start) | (hours < day_end)
+        
+    @staticmethod
+    def _masked_stats(values: np.ndarray, mask: np.ndarray) -> Dict[str, float]:
+        """
+        Vidurkis, maksimumas ir minimumas pagal kaukę, nekopijuojant reikšmių
+        """
+        valid = mask & ~np.isnan(values)
+        count = np.count_nonzero(valid)
+        if count == 0:
+            return {'vidutinė': np.nan, 'maksimali': np.nan, 'minimali': np.nan}
+        return {
+            'vidutinė': round(float(np.sum(values, where=valid)) / count, 2),
+            'maksimali': round(float(np.max(values, where=valid, initial=-np.inf)), 2),
+            'minimali': round(float(np.min(values, where=valid, initial=np.inf)), 2),
+        }
+        
+    def _daily_totals(self, columns: Optional[Iterable[str]]) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        if self.historical_data is None or self.historical_data.empty:
+            logger.error("Nėra istorinių duomenų slenkančių vidurkių skaičiavimui")
+            return None
+        if columns is None:
+            columns = self.historical_data.select_dtypes(include=[np.number]).columns
+        columns = [column for column in columns if column in self.historical_data.columns]
+        if not columns:
+            logger.error("Nėra stulpelių slenkančių vidurkių skaičiavimui")
+            return None
+        return daily_totals(self.historical_data, columns)
         
+    @_memoized
+    def rolling_averages(self, windows: Iterable[int] = DEFAULT_WINDOWS,
+                         columns: Optional[Iterable[str]] = None,
+                         min_coverage: float = 0.0) -> Optional[pd.DataFrame]:
+        """
+        Apskaičiuoja slenkančių langų vidurkius kiekvienai dienai
+        
+        Skaičiuojama per dienų sumų prefiksus (O(n)); trūkstamos dienos ir NaN
+        reikšmės į vidurkį neįtraukiamos.
+        
+        Args:
+            windows (Iterable[int]): Langų ilgiai dienomis (numatytieji 365, 30, 7)
+            columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+            min_coverage (float): Mažiausia lango dienų su duomenimis dalis (0-1)
+            
         Returns:
-            Dict: Dienos ir nakties temperatūrų analizė
+            pd.DataFrame: Dienų indeksas, stulpeliai '{stulpelis}_{langas}d'
         """
         try:
-            if self.historical_data is None or self.historical_data.empty:
-                logger.error("Nėra duomenų dienos/nakties analizei")
-                return {}
-                
-            if 'temperatura' not in self.historical_data.columns:
-                logger.error("Nėra temperatūros duomenų")
-                return {}
-                
-            # Išskiriame valandas
-            df_with_hours = self.historical_data.copy()
-            df_with_hours['valanda'] = df_with_hours.index.hour
+            totals = self._daily_totals(columns)
+            if totals is None:
+                return None
+            result = trailing_means(*totals, windows=windows, min_coverage=min_coverage)
+            logger.info(f"Apskaičiuoti slenkantys vidurkiai: {len(result)} dienų")
+            return result
             
-            # Dienos laikas: 8:00-20:00
-            day_mask = (df_with_hours['valanda'] >= 8) & (df_with_hours['valanda'] < 20)
-            night_mask = ~day_mask
+        except Exception as e:
+            logger.error(f"Klaida skaičiuojant slenkančius vidurkius: {e}")
+            return None
             
-            day_temp = df_with_hours[day_mask]['temperatura']
-            night_temp = df_with_hours[night_mask]['temperatura']
+    @_memoized
+    def calculate_climate_trends(self, window: int = 30,
+                                 columns: Optional[Iterable[str]] = None,
+                                 min_coverage: float = 0.0) -> Optional[pd.DataFrame]:
+        """
+        Apskaičiuoja kiekvienos dienos metinį ir mėnesio pokytį
+        
+        Args:
+            window (int): Lyginamo slenkančio lango ilgis dienomis
+            columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+            min_coverage (float): Mažiausia lango dienų su duomenimis dalis (0-1)
             
-            results = {}
+        Returns:
+            pd.DataFrame: '{stulpelis}_{langas}d', '{stulpelis}_metinis_pokytis'
+                (prieš 365 dienas), '{stulpelis}_mėnesio_pokytis' (prieš 30 dienų)
+        """
+        try:
+            totals = self._daily_totals(columns)
+            if totals is None:
+                return None
+            return climate_trends(*totals, window=window, min_coverage=min_coverage)
+            
+        except Exception as e:
+            logger.error(f"Klaida skaičiuojant klimato tendencijas: {e}")
+            return None
+            
+    @_memoized
+    def analyze_day_night(self, columns: Optional[Iterable[str]] = None,
+                          day_start: int = 8, day_end: int = 20) -> Dict[str, Dict[str, Any]]:
+        """
+        Dienos ir nakties statistika keliems stulpeliams vienu metu
+        
+        Valandų kaukė skaičiuojama vieną kartą iš indekso, o stulpelių masyvai
+        redukuojami pagal ją (np.sum/np.max su where=) - DataFrame nekopijuojamas.
+        
+        Args:
+            columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+            day_start (int): Dienos pradžios valanda (imtinai)
+            day_end (int): Dienos pabaigos valanda (neimtinai)
             
-            if not day_temp.empty:
-                results['vidutinė_dienos_temperatūra'] = round(day_temp.mean(), 2)
-                results['maksimali_dienos_temperatūra'] = round(day_temp.max(), 2)
-                results['minimali_dienos_temperatūra'] = round(day_temp.min(), 2)
+        Returns:
+            Dict: stulpelis -> {'dienos': {vidutinė, maksimali, minimali},
+                'nakties': {...}, 'skirtumas': vidurkių skirtumas}
                 
-            if not night_temp.empty:
-                results['vidutinė_nakties_temperatūra'] = round(night_temp.mean(), 2)
-                results['maksimali_nakties_temperatūra'] = round(night_temp.max(), 2)
-                results['minimali_nakties_temperatūra'] = round(night_temp.min(), 2)
+        Raises:
+            ValueError: Kai netinkamas dienos langas
+        """
+        self._check_day_window(day_start, day_end)
+        if self.historical_data is None or self.historical_data.empty:
+            logger.error("Nėra duomenų dienos/nakties analizei")
+            return {}
+            
+        try:
+            day_mask = self._day_mask(day_start, day_end)
+            night_mask = ~day_mask
+            if columns is None:
+                columns = self.historical_data.select_dtypes(include=[np.number]).columns
+                
+            results = {}
+            for column in columns:
+                if column not in self.historical_data.columns:
+                    logger.warning(f"Nėra stulpelio {column} dienos/nakties analizei")
+                    continue
+                values = self.historical_data[column].to_numpy(dtype=np.float64, copy=False)
                 
-            if 'vidutinė_dienos_temperatūra' in results and 'vidutinė_nakties_temperatūra' in results:
-                temp_diff = results['vidutinė_dienos_temperatūra'] - results['vidutinė_nakties_temperatūra']
-                results['dienos_nakties_skirtumas'] = round(temp_diff, 2)
+                column_results = {}
+                if day_mask.any():
+                    column_results['dienos'] = self._masked_stats(values, day_mask)
+                if night_mask.any():
+                    column_results['nakties'] = self._masked_stats(values, night_mask)
+                if 'dienos' in column_results and 'nakties' in column_results:
+                    column_results['skirtumas'] = round(
+                        column_results['dienos']['vidutinė'] - column_results['nakties']['vidutinė'], 2)
+                results[column] = column_results
                 
-            logger.info("Atlikta dienos/nakties temperatūros analizė")
+            logger.info(f"Atlikta dienos/nakties analizė: {len(results)} stulpelių")
             return results
             
         except Exception as e:
-            logger.error(f"Klaida analizuojant dienos/nakties temperatūrą: {e}")
+            logger.error(f"Klaida analizuojant dienos/nakties duomenis: {e}")
+            return {}
+            
+    @_memoized
+    def analyze_day_night_temperature(self, day_start: int = 8, day_end: int = 20) -> Dict[str, float]:
+        """
+        Analizuoja dienos ir nakties temperatūros skirtumus
+        
+        Args:
+            day_start (int): Dienos pradžios valanda (imtinai, numatytoji 8:00)
+            day_end (int): Dienos pabaigos valanda (neimtinai, numatytoji 20:00)
+        
+        Returns:
+            Dict: Dienos ir nakties temperatūrų analizė
+        """
+        self._check_day_window(day_start, day_end)
+        if self.historical_data is None or self.historical_data.empty:
+            logger.error("Nėra duomenų dienos/nakties analizei")
             return {}
             
-    def analyze_weekend_rain_forecast(self) -> Dict[str, Any]:
+        if 'temperatura' not in self.historical_data.columns:
+            logger.error("Nėra temperatūros duomenų")
+            return {}
+            
+        analysis = WeatherAnalyzer.analyze_day_night.__wrapped__(
+            self, ['temperatura'], day_start, day_end).get('temperatura', {})
+        
+        results = {}
+        for period in ('dienos', 'nakties'):
+            if period in analysis:
+                for stat, value in analysis[period].items():
+                    results[f'{stat}_{period}_temperatūra'] = value
+        # Raktų tvarka kaip ankstesnėje versijoje
+        results = {key: results[key] for key in (
+            'vidutinė_dienos_temperatūra', 'maksimali_dienos_temperatūra', 'minimali_dienos_temperatūra',
+            'vidutinė_nakties_temperatūra', 'maksimali_nakties_temperatūra', 'minimali_nakties_temperatūra',
+        ) if key in results}
+        if 'skirtumas' in analysis:
+            results['dienos_nakties_skirtumas'] = analysis['skirtumas']
+            
+        logger.info("Atlikta dienos/nakties temperatūros analizė")
+        return results
+            
+    @_memoized
+    def analyze_weekend_rain_forecast(self, as_frame: bool = False) -> Union[Dict[str, Any], pd.DataFrame, None]:
         """
         Analizuoja savaitgalių lietaus prognozes
         
+        Savaitgalis (šeštadienis ir sekmadienis kartu) identifikuojamas ISO metais ir
+        savaitės numeriu, rodikliai skaičiuojami vektoriškai (src.weekend_rain).
+        Prognozė su 'vieta' indekso lygiu analizuojama kiekvienai vietovei.
+        
+        Args:
+            as_frame (bool): Grąžinti lentelę (po eilutę kiekvienam savaitgaliui)
+            
         Returns:
-            Dict: Savaitgalių lietaus prognozės analizė
+            Dict: Savaitgalių lietaus prognozės analizė; kelioms vietovėms - {vieta: analizė}.
+                as_frame=True - pd.DataFrame (žr. weekly_weekend_rain)
         """
         try:
             if self.forecast_data is None or self.forecast_data.empty:
                 logger.error("Nėra prognozės duomenų savaitgalių analizei")
-                return {}
+                return None if as_frame else {}
                 
             if 'krituliai' not in self.forecast_data.columns:
                 logger.error("Nėra kritulių duomenų prognozėse")
-                return {}
+                return None if as_frame else {}
                 
-            # Išskiriame savaitgalius (šeštadienis=5, sekmadienis=6)
-            df_weekends = self.forecast_data[
-                self.forecast_data.index.dayofweek.isin([5, 6])
-            ].copy()
-            
-            if df_weekends.empty:
+            table = weekly_weekend_rain(self.forecast_data)
+            if as_frame:
+                return table
+                
+            if table.empty:
                 logger.warning("Nėra savaitgalių duomenų prognozėse")
                 return {'savaitgalių_skaičius': 0}
                 
-            # Suskaidome pagal savaitgalius
-            df_weekends['savaitgalio_data'] = df_weekends.index.date
-            weekend_groups = df_weekends.groupby('savaitgalio_data')
-            
-            total_weekends = len(weekend_groups)
-            rainy_weekends = 0
-            weekend_details = []
-            
-            for date, group in weekend_groups:
-                # Tikrinome ar yra lietaus (krituliai > 0)
-                has_rain = (group['krituliai'] > 0).any()
-                if has_rain:
-                    rainy_weekends += 1
-                    
-                avg_precipitation = group['krituliai'].mean()
-                weekend_details.append({
-                    'data': str(date),
-                    'lietaus_prognozė': has_rain,
-                    'vidutiniai_krituliai': round(avg_precipitation, 2)
-                })
+            if isinstance(self.forecast_data.index, pd.MultiIndex):
+                results = {place: weekend_rain_report(weekends)
+                           for place, weekends in table.groupby('vieta', sort=False)}
+            else:
+                results = weekend_rain_report(table)
                 
-            rain_percentage = (rainy_weekends / total_weekends * 100) if total_weekends > 0 else 0
-            
-            results = {
-                'savaitgalių_skaičius': total_weekends,
-                'savaitgaliai_su_lietumi': rainy_weekends,
-                'lietaus_tikimybė_procentais': round(rain_percentage, 1),
-                'savaitgalių_detalizacija': weekend_details
-            }
-            
-            logger.info(f"Analizuoti {total_weekends} savaitgaliai, {rainy_weekends} su lietumi")
+            logger.info(f"Analizuoti {len(table)} savaitgaliai, {int(table['lietus'].sum())} su lietumi")
             return results
             
         except Exception as e:
             logger.error(f"Klaida analizuojant savaitgalių prognozes: {e}")
-            return {}
+            return None if as_frame else {}
             
+    @_memoized
     def calculate_correlations(self) -> Optional[pd.DataFrame]:
         """
         Apskaičiuoja oro parametrų koreliacijas
@@ -264,6 +555,7 @@ class WeatherAnalyzer:
             logger.error(f"Klaida skaičiuojant koreliacijas: {e}")
             return None
             
+    @_memoized
     def find_extremes(self) -> Dict[str, Any]:
         """
         Suranda ekstremaliuosius oro rodiklius
@@ -282,37 +574,40 @@ class WeatherAnalyzer:
             
             # Temperatūros ekstremumas
             if 'temperatura' in data_to_analyze.columns:
-                temp_max_idx = data_to_analyze['temperatura'].idxmax()
-                temp_min_idx = data_to_analyze['temperatura'].idxmin()
+                temperature = _float_column(data_to_analyze, 'temperatura')
+                temp_max_idx = temperature.idxmax()
+                temp_min_idx = temperature.idxmin()
                 
                 results['aukščiausia_temperatūra'] = {
-                    'reikšmė': round(data_to_analyze.loc[temp_max_idx, 'temperatura'], 2),
+                    'reikšmė': round(temperature.loc[temp_max_idx], 2),
                     'data': str(temp_max_idx)
                 }
                 results['žemiausia_temperatūra'] = {
-                    'reikšmė': round(data_to_analyze.loc[temp_min_idx, 'temperatura'], 2),
+                    'reikšmė': round(temperature.loc[temp_min_idx], 2),
                     'data': str(temp_min_idx)
                 }
                 
             # Vėjo greičio ekstremumas
             if 'vejo_greitis' in data_to_analyze.columns:
-                wind_max_idx = data_to_analyze['vejo_greitis'].idxmax()
+                wind = _float_column(data_to_analyze, 'vejo_greitis')
+                wind_max_idx = wind.idxmax()
                 results['didžiausias_vėjo_greitis'] = {
-                    'reikšmė': round(data_to_analyze.loc[wind_max_idx, 'vejo_greitis'], 2),
+                    'reikšmė': round(wind.loc[wind_max_idx], 2),
                     'data': str(wind_max_idx)
                 }
                 
             # Slėgimo ekstremumas
             if 'slegimasJuros' in data_to_analyze.columns:
-                pressure_max_idx = data_to_analyze['slegimasJuros'].idxmax()
-                pressure_min_idx = data_to_analyze['slegimasJuros'].idxmin()
+                pressure = _float_column(data_to_analyze, 'slegimasJuros')
+                pressure_max_idx = pressure.idxmax()
+                pressure_min_idx = pressure.idxmin()
                 
                 results['aukščiausias_slėgimas'] = {
-                    'reikšmė': round(data_to_analyze.loc[pressure_max_idx, 'slegimasJuros'], 2),
+                    'reikšmė': round(pressure.loc[pressure_max_idx], 2),
                     'data': str(pressure_max_idx)
                 }
                 results['žemiausias_slėgimas'] = {
-                    'reikšmė': round(data_to_analyze.loc[pressure_min_idx, 'slegimasJuros'], 2),
+                    'reikšmė': round(pressure.loc[pressure_min_idx], 2),
                     'data': str(pressure_min_idx)
                 }
                 
@@ -322,11 +617,90 @@ class WeatherAnalyzer:
         except Exception as e:
             logger.error(f"Klaida ieškant ekstremumų: {e}")
             return {}
+
+    @_memoized
+    def find_top_extremes(self, k: int = 10, period: str = 'all',
+                          columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Suranda k didžiausių ir mažiausių kiekvieno parametro reikšmių kiekvienam laikotarpiui
+
+        Duomenys tie patys kaip find_extremes (sujungti, jei yra prognozė).
+
+        Args:
+            k (int): Reikšmių skaičius
+            period (str): 'all', 'day', 'month', 'season' arba 'year' (vietinis laikas)
+            columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+
+        Returns:
+            pd.DataFrame: vieta, stulpelis, kryptis, laikotarpis, rangas, reikšmė, data
+        """
+        try:
+            data_to_analyze = self.combined_data if self.combined_data is not None else self.historical_data
+
+            if data_to_analyze is None or data_to_analyze.empty:
+                logger.error("Nėra duomenų ekstremumų paieškai")
+                return None
+
+            result = top_extremes(data_to_analyze, k, period, columns)
+            logger.info(f"Rasta top-{k} ekstremumų: {len(result)} reikšmių")
+            return result
+
+        except Exception as e:
+            logger.error(f"Klaida ieškant top-{k} ekstremumų: {e}")
+            return None
+
+    def _report_sections(self) -> Dict[str, Any]:
+        """
+        Apskaičiuoja ataskaitos sekcijas vienu praėjimu per duomenų masyvus
+        
+        Istoriniai duomenys (metiniai vidurkiai, dienos/naktis, ekstremumai) ir
+        prognozė (ekstremumai, kaip combined_data, ir savaitgalių lietus) perskaitomi
+        po vieną kartą vienu StreamingAnalysis. Jau įsiminti rezultatai
+        neperskaičiuojami, o nauji įrašomi į podėlį atskiriems metodams.
+        """
+        # Be podėlio atspaudai nereikalingi (jų maiša - brangiausia dalis mažoms lentelėms)
+        fingerprints = self._fingerprints() if self.cache_size > 0 else None
+        keys = {section: self._cache_key(method, fingerprints=fingerprints)
+                for section, method in REPORT_SECTIONS.items()}
+        sections = {section: self._cache_get(key) if key is not None else None
+                    for section, key in keys.items()}
+        if all(value is not None for value in sections.values()):
+            return sections
             
+        try:
+            engine = StreamingAnalysis(
+                extreme_columns=None if self.combined_data is None else self.combined_data.columns)
+            if self.historical_data is not None:
+                engine.update(self.historical_data)
+            if self.forecast_data is not None:
+                engine.update(self.forecast_data, historical=False,
+                              extremes=self.combined_data is not None)
+            computed = {
+                'metiniai_vidurkiai': engine.yearly_averages(),
+                'dienos_nakties_analizė': engine.day_night_temperature(),
+                'savaitgalių_lietaus_prognozė': engine.weekend_rain(),
+                'ekstremaliuosius_rodikliai': engine.extremes(),
+            }
+        except Exception as e:
+            # Pvz. ne laiko indeksas - atskiri metodai patys praneš klaidą
+            logger.warning(f"Vieno praėjimo ataskaita nepavyko, naudojami atskiri metodai: {e}")
+            computed = {section: getattr(WeatherAnalyzer, REPORT_SECTIONS[section]).__wrapped__(self)
+                        for section, value in sections.items() if value is None}
+        for section, value in computed.items():
+            if sections[section] is None:
+                self._cache_put(keys[section], value)
+                sections[section] = value
+                
+        return sections
+        
     def generate_summary_report(self) -> Dict[str, Any]:
         """
         Generuoja išsamią duomenų analizės ataskaitą
         
+        Sekcijos sutampa su calculate_yearly_averages(), analyze_day_night_temperature(),
+        analyze_weekend_rain_forecast() ir find_extremes() rezultatais, bet
+        skaičiuojamos vienu praėjimu (žr. benchmarks/bench_summary_report.py).
+        
         Returns:
             Dict: Ataskaitos žodynas
         """
@@ -347,14 +721,11 @@ class WeatherAnalyzer:
                 report['duomenų_kiekis']['bendras'] = len(self.combined_data)
                 
             # Pridedame analizės rezultatus
-            report['metiniai_vidurkiai'] = self.calculate_yearly_averages()
-            report['dienos_nakties_analizė'] = self.analyze_day_night_temperature()
-            report['savaitgalių_lietaus_prognozė'] = self.analyze_weekend_rain_forecast()
-            report['ekstremaliuosius_rodikliai'] = self.find_extremes()
+            report.update(self._report_sections())
             
             logger.info("Sugeneruota išsami analizės ataskaita")
             return report
             
         except Exception as e:
             logger.error(f"Klaida generuojant ataskaitą: {e}")
-            return {}
\ No newline at end of file
+            return {}
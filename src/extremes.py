@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Srautiniai top-k ekstremumai pagal kintamąjį, laikotarpį ir vietovę
+
+Kiekvienai grupei (vietovė, laikotarpis, stulpelis, kryptis) laikoma ne daugiau
+kaip k geriausių reikšmių su laiko žymėmis. Nauja duomenų dalis pirmiausia
+sutraukiama iki k kandidatų kiekvienai grupei (np.lexsort), tada sujungiama su
+sukauptomis reikšmėmis ir vėl apkarpoma iki k - taip veikia k dydžio krūva, bet
+be Python ciklo per eilutes. Vienodos reikšmės rikiuojamos pagal laiką
+(ankstesnė pirmiau, kaip idxmax/idxmin).
+"""
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .weekend_rain import split_place_index
+except ImportError:
+    from weekend_rain import split_place_index
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ('all', 'day', 'month', 'season', 'year')
+
+# Meteorologiniai sezonai: gruodis priskiriamas kitų metų žiemai
+SEASONS = ('žiema', 'pavasaris', 'vasara', 'ruduo')
+
+# Kryptis -> pavadinimas rezultate
+DIRECTIONS = {'max': 'didžiausios', 'min': 'mažiausios'}
+
+TOP_EXTREMES_COLUMNS = ['vieta', 'stulpelis', 'kryptis', 'laikotarpis', 'rangas', 'reikšmė', 'data']
+
+
+def period_codes(index: pd.DatetimeIndex, period: str) -> np.ndarray:
+    """
+    Vietinio laiko laikotarpio numeris kiekvienai eilutei
+
+    Args:
+        index (pd.DatetimeIndex): Laiko indeksas
+        period (str): 'all', 'day', 'month', 'season' arba 'year'
+
+    Returns:
+        np.ndarray: int64 numeriai (didėja chronologiškai)
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Nežinomas laikotarpis: {period} (galimi: {', '.join(PERIODS)})")
+    if period == 'all':
+        return np.zeros(len(index), dtype=np.int64)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    values = index.values
+    if period == 'day':
+        return values.astype('datetime64[D]').astype(np.int64)
+    if period == 'year':
+        return values.astype('datetime64[Y]').astype(np.int64)
+    months = values.astype('datetime64[M]').astype(np.int64)
+    if period == 'month':
+        return months
+    # Mėnesiai nuo 1970-01: (gruodis, sausis, vasaris) -> tas pats numeris
+    return (months + 1) // 3
+
+
+def period_label(code: int, period: str) -> str:
+    """
+    Laikotarpio numerio pavadinimas ('2024-01-05', '2024-01', '2024 žiema', '2024', 'visas')
+    """
+    if period == 'all':
+        return 'visas'
+    if period == 'season':
+        return f"{1970 + code // 4} {SEASONS[code % 4]}"
+    unit = {'day': 'D', 'month': 'M', 'year': 'Y'}[period]
+    return str(np.datetime64(int(code), unit))
+
+
+def _top_k(places: np.ndarray, codes: np.ndarray, values: np.ndarray, times: np.ndarray,
+           k: int, direction: str) -> Tuple[np.ndarray, ...]:
+    """
+    Palieka po k geriausių kiekvienos (vietovė, laikotarpis) grupės eilučių
+
+    Rezultatas surikiuotas pagal vietovę, laikotarpį ir vietą eilėje.
+    """
+    ordered = values if direction == 'min' else -values
+    order = np.lexsort((times, ordered, codes, places))
+    places, codes, values, times = places[order], codes[order], values[order], times[order]
+    if len(order) == 0:
+        return places, codes, values, times
+    starts = np.flatnonzero(np.r_[True, (places[1:] != places[:-1]) | (codes[1:] != codes[:-1])])
+    sizes = np.diff(np.r_[starts, len(order)])
+    rank = np.arange(len(order)) - np.repeat(starts, sizes)
+    keep = rank < k
+    return places[keep], codes[keep], values[keep], times[keep]
+
+
+class TopKExtremes:
+    """
+    Srautinis k didžiausių ir mažiausių reikšmių kaupiklis
+    """
+
+    def __init__(self, k: int = 10, period: str = 'all', columns: Optional[Iterable[str]] = None,
+                 directions: Iterable[str] = ('max', 'min')):
+        """
+        Inicializuoja TopKExtremes objektą
+
+        Args:
+            k (int): Kiek reikšmių laikyti kiekvienai grupei
+            period (str): Laikotarpis: 'all', 'day', 'month', 'season' arba 'year'
+            columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+            directions (Iterable[str]): 'max' ir (arba) 'min'
+        """
+        if k < 1:
+            raise ValueError("k turi būti teigiamas")
+        if period not in PERIODS:
+            raise ValueError(f"Nežinomas laikotarpis: {period} (galimi: {', '.join(PERIODS)})")
+        self.directions = list(directions)
+        if any(direction not in DIRECTIONS for direction in self.directions):
+            raise ValueError("Kryptis turi būti 'max' arba 'min'")
+        self.k = k
+        self.period = period
+        self.columns = None if columns is None else list(columns)
+        self.tz = None
+        self.rows = 0
+        self._places: List[str] = []
+        self._place_ids: Dict[str, int] = {}
+        # (stulpelis, kryptis) -> (vietovės nr., laikotarpis, reikšmė, laikas ns)
+        self._state: Dict[Tuple[str, str], Tuple[np.ndarray, ...]] = {}
+
+    def _place_numbers(self, places: np.ndarray) -> np.ndarray:
+        # Vietovės numeruojamos pirmo pasirodymo tvarka
+        inverse, unique = pd.factorize(places.astype(str))
+        for place in unique:
+            if place not in self._place_ids:
+                self._place_ids[place] = len(self._places)
+                self._places.append(place)
+        mapping = np.array([self._place_ids[place] for place in unique], dtype=np.int64)
+        return mapping[inverse]
+
+    def _merge_state(self, key: Tuple[str, str], candidates: Tuple[np.ndarray, ...]):
+        current = self._state.get(key)
+        if current is not None:
+            candidates = tuple(np.concatenate(pair) for pair in zip(current, candidates))
+        self._state[key] = _top_k(*candidates, self.k, key[1])
+
+    def update(self, chunk: pd.DataFrame, place: str = '') -> 'TopKExtremes':
+        """
+        Prideda duomenų dalį
+
+        Args:
+            chunk (pd.DataFrame): DatetimeIndex arba MultiIndex su 'vieta' lygiu
+            place (str): Vietovės kodas, kai indekse nėra vietovės lygio
+
+        Returns:
+            TopKExtremes: self
+        """
+        if chunk is None or chunk.empty:
+            return self
+        places, times = split_place_index(chunk.index, place)
+        if self.tz is None and times.tz is not None:
+            self.tz = times.tz
+        place_numbers = self._place_numbers(places)
+        codes = period_codes(times, self.period)
+        stamps = times.asi8
+
+        columns = (chunk.select_dtypes(include=[np.number]).columns if self.columns is None
+                   else [column for column in self.columns if column in chunk.columns])
+        for column in columns:
+            values = chunk[column].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            if not valid.any():
+                continue
+            selected = (place_numbers[valid], codes[valid], values[valid], stamps[valid])
+            for direction in self.directions:
+                # Pirma apkarpoma pati dalis, kad sujungimas būtų su ne daugiau kaip k kandidatų grupei
+                self._merge_state((column, direction), _top_k(*selected, self.k, direction))
+        self.rows += len(chunk)
+        return self
+
+    def merge(self, other: 'TopKExtremes') -> 'TopKExtremes':
+        """
+        Sujungia kito kaupiklio (pvz. kito proceso ar vietovės) rezultatus
+
+        Args:
+            other (TopKExtremes): Kaupiklis su tuo pačiu k ir laikotarpiu
+
+        Returns:
+            TopKExtremes: self
+        """
+        if other.k != self.k or other.period != self.period:
+            raise ValueError("Kaupiklių k ir laikotarpis turi sutapti")
+        if self.tz is None:
+            self.tz = other.tz
+        mapping = self._place_numbers(np.asarray(other._places, dtype=object))
+        for key, (places, codes, values, times) in other._state.items():
+            if key[1] in self.directions:
+                self._merge_state(key, (mapping[places], codes, values, times))
+        self.rows += other.rows
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """
+        Rezultatas lentele
+
+        Returns:
+            pd.DataFrame: vieta, stulpelis, kryptis, laikotarpis, rangas (1..k),
+                reikšmė, data (po eilutę kiekvienai reikšmei)
+        """
+        frames = []
+        for (column, direction), (places, codes, values, times) in self._state.items():
+            if len(values) == 0:
+                continue
+            starts = np.flatnonzero(np.r_[True, (places[1:] != places[:-1]) | (codes[1:] != codes[:-1])])
+            rank = np.arange(len(values)) - np.repeat(starts, np.diff(np.r_[starts, len(values)]))
+            labels = {code: period_label(code, self.period) for code in np.unique(codes).tolist()}
+            stamps = pd.to_datetime(times, utc=self.tz is not None)
+            frames.append(pd.DataFrame({
+                'vieta': np.asarray(self._places, dtype=object)[places],
+                'stulpelis': column,
+                'kryptis': DIRECTIONS[direction],
+                'laikotarpis': [labels[code] for code in codes.tolist()],
+                'rangas': rank + 1,
+                'reikšmė': values,
+                'data': stamps.tz_convert(self.tz) if self.tz is not None else stamps,
+                '_laikotarpis': codes,
+                '_vieta': places,
+            }))
+        if not frames:
+            return pd.DataFrame(columns=TOP_EXTREMES_COLUMNS)
+        table = pd.concat(frames, ignore_index=True)
+        table['_stulpelis'] = pd.factorize(table['stulpelis'])[0]
+        table = table.sort_values(['_vieta', '_stulpelis', 'kryptis', '_laikotarpis', 'rangas'],
+                                  kind='stable')
+        return table[TOP_EXTREMES_COLUMNS].reset_index(drop=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Rezultatas žodynu: {vieta: {stulpelis: {laikotarpis: {kryptis: [{'reikšmė', 'data'}]}}}}
+        """
+        results: Dict[str, Any] = {}
+        for row in self.result().itertuples(index=False):
+            entries = (results.setdefault(row.vieta, {}).setdefault(row.stulpelis, {})
+                       .setdefault(row.laikotarpis, {}).setdefault(row.kryptis, []))
+            entries.append({'reikšmė': round(row.reikšmė, 2), 'data': str(row.data)})
+        return results
+
+
+def top_extremes(data: Union[pd.DataFrame, Mapping[str, pd.DataFrame]], k: int = 10,
+                 period: str = 'all', columns: Optional[Iterable[str]] = None,
+                 directions: Iterable[str] = ('max', 'min')) -> pd.DataFrame:
+    """
+    k didžiausių ir mažiausių reikšmių lentelė vienai ar kelioms vietovėms
+
+    Args:
+        data: DataFrame (MultiIndex su 'vieta' lygiu - kelios vietovės) arba
+            vietovės kodas -> DataFrame
+        k (int): Reikšmių skaičius kiekvienai grupei
+        period (str): 'all', 'day', 'month', 'season' arba 'year'
+        columns (Iterable[str], optional): Stulpeliai (numatytieji - visi skaitiniai)
+        directions (Iterable[str]): 'max' ir (arba) 'min'
+
+    Returns:
+        pd.DataFrame: Žr. TopKExtremes.result()
+    """
+    engine = TopKExtremes(k, period, columns, directions)
+    if isinstance(data, pd.DataFrame):
+        engine.update(data)
+    else:
+        for place, df in data.items():
+            engine.update(df, place)
+    return engine.result()
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+Prognozių archyvas: kiekvienas prognozės leidimas saugomas atskiru Parquet failu
+
+Katalogų struktūra:
+    data/forecast_archive/place=vilnius/month=2025-08/20250807T190000.parquet
+
+Failo pavadinimas - forecastCreationTimeUtc, todėl jau išsaugotas leidimas
+praleidžiamas netikrinant turinio, o užklausa laiko intervalui skaito tik
+reikalingų mėnesių katalogus ir leidimus.
+"""
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Union
+import logging
+
+import pandas as pd
+
+try:
+    from .forecast_parser import (parse_forecast_timestamps, apply_compact_schema,
+                                  TIME_COLUMN, INDEX_NAME)
+except ImportError:
+    from forecast_parser import (parse_forecast_timestamps, apply_compact_schema,
+                                 TIME_COLUMN, INDEX_NAME)
+
+logger = logging.getLogger(__name__)
+
+CREATION_COLUMN = 'forecastCreationTimeUtc'
+FILE_TIME_FORMAT = '%Y%m%dT%H%M%S'
+FILE_PATTERN = re.compile(r'^(\d{8}T\d{6})\.parquet$')
+
+
+def _utc(value: Union[str, datetime, pd.Timestamp]) -> pd.Timestamp:
+    """
+    Paverčia laiką į UTC pd.Timestamp (laikas be zonos laikomas UTC)
+    """
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+class ForecastArchive:
+    """
+    Tik papildomas (append-only) prognozių leidimų archyvas Parquet formatu,
+    skaidytas pagal vietovę ir leidimo mėnesį
+    """
+
+    # long-term prognozė siekia ~10 dienų į priekį
+    MAX_HORIZON = timedelta(days=11)
+
+    def __init__(self, root: str = "data/forecast_archive", compression: str = 'zstd',
+                 compact: bool = False):
+        """
+        Inicializuoja ForecastArchive objektą
+
+        Args:
+            root (str): Archyvo katalogas
+            compression (str): Parquet suspaudimo algoritmas
+            compact (bool): Saugoti kompaktiškais tipais (float32, category) - mažesni
+                failai, bet prarandamas tikslumas; numatytai saugoma pilnu tikslumu
+        """
+        self.root = root
+        self.compression = compression
+        self.compact = compact
+
+    def _place_dir(self, place: str) -> str:
+        return os.path.join(self.root, f"place={place}")
+
+    def _path(self, place: str, created: pd.Timestamp) -> str:
+        return os.path.join(self._place_dir(place), f"month={created:%Y-%m}",
+                            f"{created.strftime(FILE_TIME_FORMAT)}.parquet")
+
+    def contains(self, place: str, created: Union[str, datetime]) -> bool:
+        """
+        Tikrina, ar leidimas jau archyve
+
+        Args:
+            place (str): Vietovės kodas
+            created (str | datetime): forecastCreationTimeUtc
+
+        Returns:
+            bool: True, jei leidimas išsaugotas
+        """
+        return os.path.exists(self._path(place, _utc(created)))
+
+    def append(self, df: pd.DataFrame, place: Optional[str] = None,
+               created: Optional[Union[str, datetime]] = None) -> bool:
+        """
+        Išsaugo vieną prognozės leidimą (jei jo dar nėra)
+
+        Vietovė ir leidimo laikas imami iš df.attrs, jei nenurodyti.
+
+        Args:
+            df (pd.DataFrame): get_forecast_data() rezultatas
+            place (str, optional): Vietovės kodas
+            created (str | datetime, optional): forecastCreationTimeUtc
+
+        Returns:
+            bool: True, jei leidimas įrašytas; False, jei praleistas
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if df is None or df.empty:
+            logger.warning("Tuščia prognozė neišsaugoma")
+            return False
+
+        place = place or df.attrs.get('place')
+        created = created or df.attrs.get(CREATION_COLUMN)
+        if not place or not created:
+            raise ValueError("Nenurodyta vietovė arba forecastCreationTimeUtc")
+
+        created = _utc(created)
+        path = self._path(place, created)
+        if os.path.exists(path):
+            logger.debug(f"Leidimas {place} {created} jau archyve - praleidžiama")
+            return False
+
+        frame = df.reset_index(drop=True)
+        if self.compact:
+            frame = apply_compact_schema(frame)
+        frame.insert(0, CREATION_COLUMN, pd.Series(created, index=frame.index))
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, path)
+
+        logger.info(f"Archyvuotas leidimas {place} {created:%Y-%m-%d %H:%M} ({len(frame)} įrašų)")
+        return True
+
+    def append_payload(self, payload: Dict[str, Any], place: Optional[str] = None,
+                       tz='Europe/Vilnius') -> bool:
+        """
+        Išsaugo visą long-term atsakymą (be dienų ribos)
+
+        Args:
+            payload (Dict): meteo.lt long-term atsakymas
+            place (str, optional): Vietovės kodas (numatytasis - iš atsakymo)
+            tz: Vietinė laiko zona indeksui
+
+        Returns:
+            bool: True, jei leidimas įrašytas
+        """
+        if not payload or not payload.get('forecastTimestamps'):
+            logger.error("Netinkamas prognozės atsakymas archyvui")
+            return False
+        place = place or (payload.get('place') or {}).get('code')
+        created = payload.get(CREATION_COLUMN)
+        if created and self.contains(place, created):
+            return False
+        df = parse_forecast_timestamps(payload['forecastTimestamps'], tz)
+        return self.append(df, place, created)
+
+    def capture(self, api) -> bool:
+        """
+        Išsaugo dabartinį API objekto vietovės prognozės leidimą
+
+        Args:
+            api (WeatherAPI): API objektas
+
+        Returns:
+            bool: True, jei leidimas naujas ir įrašytas
+        """
+        return self.append_payload(api._get_forecast_payload(), api.location_code,
+                                   api.lithuania_tz)
+
+    def runs(self, place: str, start: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> List[pd.Timestamp]:
+        """
+        Grąžina archyvuotų leidimų laikus, neskaitant failų turinio
+
+        Args:
+            place (str): Vietovės kodas
+            start (datetime, optional): Ankstyviausias leidimo laikas
+            end (datetime, optional): Vėliausias leidimo laikas
+
+        Returns:
+            List[pd.Timestamp]: Surūšiuoti forecastCreationTimeUtc
+        """
+        return [created for created, _ in self._files(place, start, end)]
+
+    def _files(self, place: str, start: Optional[datetime] = None,
+               end: Optional[datetime] = None) -> List[tuple]:
+        """
+        Suranda leidimų failus intervale - skaitomi tik reikalingų mėnesių katalogai
+        """
+        place_dir = self._place_dir(place)
+        if not os.path.isdir(place_dir):
+            return []
+
+        start = _utc(start) if start is not None else None
+        end = _utc(end) if end is not None else None
+        first_month = f"month={start:%Y-%m}" if start is not None else None
+        last_month = f"month={end:%Y-%m}" if end is not None else None
+
+        files = []
+        for month_dir in sorted(os.listdir(place_dir)):
+            if first_month and month_dir < first_month:
+                continue
+            if last_month and month_dir > last_month:
+                continue
+            directory = os.path.join(place_dir, month_dir)
+            for name in os.listdir(directory):
+                match = FILE_PATTERN.match(name)
+                if not match:
+                    continue
+                created = pd.Timestamp(datetime.strptime(match.group(1), FILE_TIME_FORMAT),
+                                       tz='UTC')
+                if start is not None and created < start:
+                    continue
+                if end is not None and created > end:
+                    continue
+                files.append((created, os.path.join(directory, name)))
+        return sorted(files)
+
+    def load(self, place: str, start: Optional[datetime] = None,
+             end: Optional[datetime] = None, latest: bool = False,
+             tz='Europe/Vilnius') -> pd.DataFrame:
+        """
+        Nuskaito prognozes, kurių forecastTimeUtc patenka į [start, end)
+
+        Skaitomi tik leidimai, sukurti ne anksčiau nei start - MAX_HORIZON ir ne
+        vėliau nei end.
+
+        Args:
+            place (str): Vietovės kodas
+            start (datetime, optional): Pradžios laikas (be zonos - UTC)
+            end (datetime, optional): Pabaigos laikas, neimtinai
+            latest (bool): Kiekvienam laikui palikti tik vėliausio leidimo prognozę
+            tz: Vietinė laiko zona indeksui
+
+        Returns:
+            pd.DataFrame: Prognozės su forecastCreationTimeUtc stulpeliu
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        start = _utc(start) if start is not None else None
+        end = _utc(end) if end is not None else None
+        files = self._files(place, start - self.MAX_HORIZON if start is not None else None, end)
+        if not files:
+            return pd.DataFrame()
+
+        table = pa.concat_tables([pq.read_table(path) for _, path in files],
+                                 promote_options='default')
+        df = table.to_pandas()
+
+        times = df[TIME_COLUMN]
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times < end
+        if not mask.all():
+            df = df[mask.to_numpy()]
+
+        if latest:
+            df = (df.sort_values([TIME_COLUMN, CREATION_COLUMN], kind='stable')
+                    .drop_duplicates(TIME_COLUMN, keep='last'))
+        else:
+            df = df.sort_values([CREATION_COLUMN, TIME_COLUMN], kind='stable')
+
+        df.index = pd.DatetimeIndex(df[TIME_COLUMN]).tz_convert(tz).rename(INDEX_NAME)
+        return df
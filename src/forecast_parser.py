@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Greitas stulpelinis meteo.lt prognozės (forecastTimestamps) analizatorius
+"""
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from typing import Optional, Dict, Any, List
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# API stulpelių pavadinimai -> lietuviški pavadinimai
+FORECAST_COLUMN_MAPPING = {
+    'airTemperature': 'temperatura',
+    'relativeHumidity': 'dregme',
+    'windSpeed': 'vejo_greitis',
+    'seaLevelPressure': 'slegimasJuros',
+    'totalPrecipitation': 'krituliai'
+}
+
+TIME_COLUMN = 'forecastTimeUtc'
+INDEX_NAME = 'forecastTimeLocal'
+
+# Kompaktiška stulpelių tipų schema (po pervadinimo lietuviškai)
+COMPACT_SCHEMA = {
+    'temperatura': 'float32',
+    'feelsLikeTemperature': 'float32',
+    'vejo_greitis': 'float32',
+    'windGust': 'float32',
+    'slegimasJuros': 'float32',
+    'krituliai': 'float32',
+    'windDirection': 'uint16',
+    'cloudCover': 'uint8',
+    'dregme': 'uint8',
+    'conditionCode': 'category',
+}
+
+
+def _column_array(values: List[Any]) -> np.ndarray:
+    """
+    Paverčia vieno stulpelio reikšmes į tipizuotą NumPy masyvą
+
+    Tipai parenkami taip pat kaip pd.DataFrame(records): sveikieji skaičiai -> int64,
+    mišrūs arba su trūkstamomis reikšmėmis -> float64, tekstas -> object.
+    """
+    arr = np.array(values)
+    kind = arr.dtype.kind
+
+    if kind in 'iufb':
+        return arr
+    if kind == 'O':
+        # Skaičiai su None -> float64 su NaN
+        if all(v is None or (isinstance(v, (int, float)) and not isinstance(v, bool))
+               for v in values):
+            return np.array(values, dtype=np.float64)
+        return np.array(values, dtype=object)
+
+    # Tekstas (ar tekstas su skaičiais) paliekamas Python objektais
+    return np.array(values, dtype=object)
+
+
+def _compact_array(arr, dtype: str):
+    """
+    Paverčia stulpelį į kompaktišką tipą
+
+    Sveikųjų skaičių tipas taikomas tik tada, kai visos reikšmės sveikos, be NaN ir
+    telpa į tipo ribas - kitu atveju naudojamas float32.
+    """
+    if dtype == 'category':
+        return pd.Categorical(arr)
+
+    arr = np.asarray(arr)
+    if arr.dtype.kind not in 'iufb':
+        arr = arr.astype(np.float64)
+
+    target = np.dtype(dtype)
+    if target.kind in 'iu':
+        info = np.iinfo(target)
+        if arr.dtype.kind == 'f':
+            valid = (not np.isnan(arr).any()) and bool(np.all(np.mod(arr, 1) == 0))
+        else:
+            valid = True
+        if valid and (arr.size == 0 or (arr.min() >= info.min and arr.max() <= info.max)):
+            return arr.astype(target)
+        return arr.astype(np.float32)
+
+    return arr.astype(target)
+
+
+def apply_compact_schema(df: pd.DataFrame,
+                         schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Pritaiko kompaktišką tipų schemą prognozės ar stebėjimų DataFrame
+
+    Args:
+        df (pd.DataFrame): Duomenys lietuviškais stulpelių pavadinimais
+        schema (Dict, optional): Stulpelis -> tipas (numatytoji COMPACT_SCHEMA)
+
+    Returns:
+        pd.DataFrame: Naujas DataFrame su kompaktiškais tipais
+    """
+    schema = COMPACT_SCHEMA if schema is None else schema
+    converted = {
+        column: (_compact_array(df[column].to_numpy(), schema[column])
+                 if column in schema else df[column])
+        for column in df.columns
+    }
+    return pd.DataFrame(converted, index=df.index, copy=False)
+
+
+def _parse_utc_timestamps(values: List[str]) -> np.ndarray:
+    """
+    Fiksuoto formato ('YYYY-MM-DD HH:MM:SS') UTC laikų analizė be pd.to_datetime
+    """
+    if not all(len(value) == 19 and value[10] == ' ' for value in values):
+        raise ValueError("Laikas ne 'YYYY-MM-DD HH:MM:SS' formato")
+    parsed = np.array(values, dtype='datetime64[s]')
+    return parsed.astype('datetime64[ns]')
+
+
+def _extract_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Transponuoja įrašų sąrašą į stulpelius nekuriant tarpinių eilučių žodynų
+    """
+    keys = list(dict.fromkeys(chain.from_iterable(records)))
+    width = len(keys)
+
+    if all(len(record) == width for record in records):
+        getter = itemgetter(*keys)
+        try:
+            rows = list(map(getter, records))
+        except KeyError:
+            rows = None
+        if rows is not None:
+            if width == 1:
+                return {keys[0]: rows}
+            return dict(zip(keys, map(list, zip(*rows))))
+
+    # Lėtesnis kelias, kai dalis įrašų neturi kai kurių laukų
+    return {key: [record.get(key) for record in records] for key in keys}
+
+
+def parse_forecast_timestamps(records: List[Dict[str, Any]], tz,
+                              cutoff: Optional[datetime] = None,
+                              compact: bool = False) -> pd.DataFrame:
+    """
+    Paverčia forecastTimestamps sąrašą į prognozės DataFrame stulpeliniu būdu
+
+    Rezultatas identiškas pd.DataFrame(records) + pd.to_datetime keliui: tie patys
+    lietuviški stulpeliai, forecastTimeUtc stulpelis UTC laiku ir vietinio laiko indeksas.
+
+    Args:
+        records (List[Dict]): forecastTimestamps įrašai
+        tz: Vietinė laiko zona
+        cutoff (datetime, optional): Paskutinis įtraukiamas vietinis laikas
+        compact (bool): Ar taikyti kompaktišką tipų schemą (COMPACT_SCHEMA)
+
+    Returns:
+        pd.DataFrame: Prognozės duomenys
+    """
+    if not records:
+        return pd.DataFrame(records)
+
+    columns = _extract_columns(records)
+
+    try:
+        utc_values = _parse_utc_timestamps(columns[TIME_COLUMN])
+    except (KeyError, ValueError, TypeError) as e:
+        logger.debug(f"Greitas laiko formatas netiko ({e}), naudojamas pandas kelias")
+        return parse_forecast_timestamps_pandas(records, tz, cutoff, compact)
+
+    keep = None
+    if cutoff is not None:
+        cutoff_ts = pd.Timestamp(cutoff)
+        if cutoff_ts.tzinfo is None:
+            cutoff_ts = cutoff_ts.tz_localize(tz)
+        cutoff_ns = cutoff_ts.tz_convert('UTC').value
+        keep = utc_values.view(np.int64) <= cutoff_ns
+        utc_values = utc_values[keep]
+
+    utc_index = pd.DatetimeIndex(utc_values).tz_localize('UTC')
+    local_index = utc_index.tz_convert(tz).rename(INDEX_NAME)
+
+    data = {}
+    for key, values in columns.items():
+        if key == TIME_COLUMN:
+            data[key] = utc_index
+            continue
+        arr = _column_array(values)
+        if keep is not None:
+            arr = arr[keep]
+        name = FORECAST_COLUMN_MAPPING.get(key, key)
+        if compact and name in COMPACT_SCHEMA:
+            arr = _compact_array(arr, COMPACT_SCHEMA[name])
+        data[name] = arr
+
+    return pd.DataFrame(data, index=local_index, copy=False)
+
+
+def parse_forecast_timestamps_pandas(records: List[Dict[str, Any]], tz,
+                                     cutoff: Optional[datetime] = None,
+                                     compact: bool = False) -> pd.DataFrame:
+    """
+    Atsarginis (ir palyginimui naudojamas) analizatorius per pd.DataFrame(records)
+
+    Args:
+        records (List[Dict]): forecastTimestamps įrašai
+        tz: Vietinė laiko zona
+        cutoff (datetime, optional): Paskutinis įtraukiamas vietinis laikas
+        compact (bool): Ar taikyti kompaktišką tipų schemą
+
+    Returns:
+        pd.DataFrame: Prognozės duomenys
+    """
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+
+    df[TIME_COLUMN] = pd.to_datetime(df[TIME_COLUMN], utc=True)
+    df[INDEX_NAME] = df[TIME_COLUMN].dt.tz_convert(tz)
+
+    if cutoff is not None:
+        df = df[df[INDEX_NAME] <= cutoff]
+
+    df.set_index(INDEX_NAME, inplace=True)
+    df = df.rename(columns=FORECAST_COLUMN_MAPPING)
+    return apply_compact_schema(df) if compact else df
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Foninis prognozių atnaujinimo planuoklis, laikantis iš anksto išanalizuotas
+prognozes atmintyje
+
+Kiekviena vietovė tikrinama pagal paskutinio modelio leidimo laiką
+(forecastCreationTimeUtc): kitas tikrinimas planuojamas leidimas + run_interval
++ publish_delay. Jei naujas leidimas dar nepaskelbtas, bandoma kas retry_interval.
+Vietovių užklausos išskaidomos per spread sekundžių ir papildomai atsitiktinai
+paslenkamos (jitter), kad šimtai vietovių nebūtų užklausiamos tą pačią sekundę.
+
+Paleidimas:
+    python -m src.forecast_scheduler vilnius kaunas klaipeda --archive data/forecast_archive
+"""
+import argparse
+import heapq
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Callable
+import logging
+
+import pandas as pd
+
+try:
+    from .forecast_parser import parse_forecast_timestamps
+except ImportError:
+    from forecast_parser import parse_forecast_timestamps
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmForecast:
+    """
+    Vienos vietovės paskutinis prognozės leidimas, jau paverstas DataFrame
+    """
+    place: str
+    created: str
+    payload: Dict[str, Any]
+    frame: pd.DataFrame
+    fetched_at: float
+
+    def age(self, now: float) -> float:
+        """
+        Leidimo amžius sekundėmis pagal forecastCreationTimeUtc (jei jo nėra - pagal parsiuntimo laiką)
+        """
+        created = _creation_seconds(self.created)
+        return now - (created if created is not None else self.fetched_at)
+
+
+def _creation_seconds(created: str) -> Optional[float]:
+    """
+    forecastCreationTimeUtc ('YYYY-MM-DD HH:MM:SS') -> UNIX sekundės
+    """
+    try:
+        moment = datetime.strptime(created, '%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return None
+    return moment.replace(tzinfo=timezone.utc).timestamp()
+
+
+class ForecastScheduler:
+    """
+    Periodiškai atnaujina vietovių prognozes ir laiko jas paruoštas WeatherAPI
+
+    WeatherAPI(warm_cache=scheduler) prognozę ima iš šio objekto be tinklo
+    užklausos ir be pakartotinės analizės.
+    """
+
+    def __init__(self, api, places: Iterable[str],
+                 run_interval: float = 3600, publish_delay: float = 600,
+                 retry_interval: float = 900, spread: float = 300, jitter: float = 30,
+                 archive=None, clock: Callable[[], float] = time.time,
+                 rng: Optional[random.Random] = None):
+        """
+        Inicializuoja ForecastScheduler objektą
+
+        Args:
+            api (WeatherAPI): API objektas užklausoms (jo klientas, podėlis ir grandinė)
+            places (Iterable[str]): Vietovių kodai
+            run_interval (float): Laikas tarp meteo.lt modelio leidimų sekundėmis
+            publish_delay (float): Kiek sekundžių po leidimo laiko jis paprastai paskelbiamas
+            retry_interval (float): Pakartotinio tikrinimo intervalas, kai naujo leidimo dar nėra
+            spread (float): Per kiek sekundžių išskaidomos vietovių užklausos
+            jitter (float): Maksimalus atsitiktinis papildomas poslinkis sekundėmis
+            archive (ForecastArchive, optional): Nauji leidimai papildomai archyvuojami
+            clock (Callable): Laiko šaltinis (UNIX sekundės)
+            rng (random.Random, optional): Atsitiktinių skaičių generatorius (testams)
+        """
+        self.api = api
+        self.places = list(dict.fromkeys(places))
+        for place in self.places:
+            if not api.is_known_place(place):
+                raise ValueError(f"Nepalaikomas miesto kodas: {place}")
+        self.run_interval = run_interval
+        self.publish_delay = publish_delay
+        self.retry_interval = retry_interval
+        self.spread = spread
+        self.jitter = jitter
+        self.archive = archive
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self._entries: Dict[str, WarmForecast] = {}
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[float, str]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'polls': 0, 'new_runs': 0, 'unchanged': 0, 'failures': 0}
+
+        # Pradinis išskaidymas: pastovus vietovės poslinkis [0, spread) + jitter
+        now = self.clock()
+        for place in self.places:
+            heapq.heappush(self._queue, (now + self._offset(place), place))
+
+    def _offset(self, place: str) -> float:
+        """
+        Vietovės poslinkis: pastovus pagal kodą (crc32) ir atsitiktinis jitter
+        """
+        stagger = (zlib.crc32(place.encode('utf-8')) % 10_000) / 10_000 * self.spread
+        return stagger + self.rng.uniform(0, self.jitter)
+
+    def get(self, place: str) -> Optional[WarmForecast]:
+        """
+        Grąžina paskutinį atmintyje laikomą vietovės leidimą
+
+        Args:
+            place (str): Vietovės kodas
+
+        Returns:
+            WarmForecast: Leidimas arba None, jei dar neparsiųstas
+        """
+        with self._lock:
+            return self._entries.get(place)
+
+    def next_due(self, place: str, now: Optional[float] = None) -> float:
+        """
+        Apskaičiuoja kito vietovės tikrinimo laiką
+
+        Args:
+            place (str): Vietovės kodas
+            now (float, optional): Dabartinis laikas
+
+        Returns:
+            float: UNIX laikas
+        """
+        now = self.clock() if now is None else now
+        entry = self.get(place)
+        created = _creation_seconds(entry.created) if entry is not None else None
+        if created is not None:
+            expected = created + self.run_interval + self.publish_delay
+            if expected > now:
+                return expected + self._offset(place)
+        return now + self.retry_interval + self.rng.uniform(0, self.jitter)
+
+    def refresh(self, place: str) -> bool:
+        """
+        Parsiunčia vietovės prognozę ir, jei paskelbtas naujas leidimas, ją išanalizuoja
+
+        Args:
+            place (str): Vietovės kodas
+
+        Returns:
+            bool: True, jei gautas naujas leidimas
+        """
+        # Šviežias podėlio įrašas neturi slėpti naujo leidimo, todėl visada siunčiama
+        # (sąlyginė, jei yra ETag) užklausa; grandinės pertraukiklis galioja
+        data = self.api.revalidate(f"places/{place}/forecasts/long-term")
+        with self._lock:
+            self._stats['polls'] += 1
+        if not data or not data.get('forecastTimestamps'):
+            with self._lock:
+                self._stats['failures'] += 1
+            logger.warning(f"Nepavyko atnaujinti {place} prognozės")
+            return False
+
+        created = data.get('forecastCreationTimeUtc')
+        current = self.get(place)
+        if current is not None and created and current.created == created:
+            with self._lock:
+                self._stats['unchanged'] += 1
+            logger.debug(f"{place}: leidimas {created} nepasikeitė")
+            return False
+
+        frame = parse_forecast_timestamps(data['forecastTimestamps'], self.api.lithuania_tz)
+        frame.attrs['place'] = place
+        frame.attrs['forecastCreationTimeUtc'] = created
+        entry = WarmForecast(place=place, created=created, payload=data, frame=frame,
+                             fetched_at=self.clock())
+        with self._lock:
+            self._entries[place] = entry
+            self._stats['new_runs'] += 1
+
+        if self.archive is not None:
+            try:
+                self.archive.append_payload(data, place, self.api.lithuania_tz)
+            except Exception as e:
+                logger.error(f"Klaida archyvuojant {place} leidimą: {e}")
+
+        logger.info(f"{place}: naujas leidimas {created} ({len(frame)} įrašų)")
+        return True
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        Atnaujina visas vietoves, kurių tikrinimo laikas jau atėjo
+
+        Args:
+            now (float, optional): Laikas, iki kurio atrenkamos vietovės (numatytasis -
+                dabartinis). Kitas tikrinimas skaičiuojamas nuo laikrodžio po kiekvienos
+                užklausos, kad ilga eilė nepaslinktų vėlesnių vietovių į praeitį.
+
+        Returns:
+            int: Patikrintų vietovių skaičius
+        """
+        until = self.clock() if now is None else now
+        polled = 0
+        while not self._stop.is_set():
+            with self._lock:
+                if not self._queue or self._queue[0][0] > until:
+                    break
+                _, place = heapq.heappop(self._queue)
+            try:
+                self.refresh(place)
+            except Exception as e:
+                logger.error(f"Klaida atnaujinant {place}: {e}")
+            polled += 1
+            # next_due() pats ima self._lock (per get()), todėl skaičiuojama prieš užrakinant
+            due = self.next_due(place, max(until, self.clock()))
+            with self._lock:
+                heapq.heappush(self._queue, (due, place))
+        return polled
+
+    def seconds_until_next(self) -> Optional[float]:
+        """
+        Kiek sekundžių liko iki artimiausio tikrinimo
+        """
+        with self._lock:
+            if not self._queue:
+                return None
+            return max(0.0, self._queue[0][0] - self.clock())
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_pending()
+            wait = self.seconds_until_next()
+            self._stop.wait(60 if wait is None else min(wait, 60))
+
+    def start(self) -> 'ForecastScheduler':
+        """
+        Paleidžia planuoklį foninėje gijoje
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='forecast-scheduler',
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Sustabdo foninę giją (laukiama, kol baigsis vykdoma užklausa)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> 'ForecastScheduler':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Grąžina skaitiklius
+
+        Returns:
+            Dict: polls, new_runs, unchanged, failures, warm (vietovės atmintyje)
+        """
+        with self._lock:
+            return dict(self._stats, warm=len(self._entries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Foninis meteo.lt prognozių atnaujinimas")
+    parser.add_argument('places', nargs='+')
+    parser.add_argument('--run-interval', type=float, default=3600)
+    parser.add_argument('--spread', type=float, default=300)
+    parser.add_argument('--archive', help="Prognozių archyvo katalogas")
+    parser.add_argument('--cache', default='data/http_cache.sqlite')
+    args = parser.parse_args()
+
+    try:
+        from .weather_api import WeatherAPI
+        from .response_cache import ResponseCache
+        from .forecast_archive import ForecastArchive
+    except ImportError:
+        from weather_api import WeatherAPI
+        from response_cache import ResponseCache
+        from forecast_archive import ForecastArchive
+
+    logging.basicConfig(level=logging.INFO)
+    api = WeatherAPI(args.places[0], cache=ResponseCache(args.cache))
+    archive = ForecastArchive(args.archive) if args.archive else None
+    scheduler = ForecastScheduler(api, args.places, run_interval=args.run_interval,
+                                  spread=args.spread, archive=archive)
+    try:
+        with scheduler:
+            while True:
+                time.sleep(60)
+                logger.info(f"Planuoklio būsena: {scheduler.stats()}")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Bendras HTTP kliento sluoksnis: jungčių telkinys, užklausų ribojimas, backoff
+ir grandinės pertraukiklis (circuit breaker)
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Callable
+from urllib.parse import urlsplit
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Gijoms saugus token bucket užklausų ribotuvas
+    """
+
+    def __init__(self, rate: float, capacity: float,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializuoja TokenBucket objektą
+
+        Args:
+            rate (float): Žetonų papildymo greitis (užklausų per sekundę)
+            capacity (float): Maksimalus žetonų skaičius (leidžiamas pliūpsnis)
+            clock (Callable): Monotoninis laiko šaltinis
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate ir capacity turi būti teigiami")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Rezervuoja žetonus ir grąžina, kiek sekundžių reikia palaukti prieš užklausą
+
+        Rezervacija atliekama iš karto, todėl kelios gijos gauna nuosekliai
+        didėjančius laukimo laikus ir neviršija nustatyto greičio.
+
+        Args:
+            tokens (float): Reikalingų žetonų skaičius
+
+        Returns:
+            float: Laukimo laikas sekundėmis (0, jei žetonų pakanka)
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Blokuoja, kol galima atlikti užklausą
+
+        Args:
+            tokens (float): Reikalingų žetonų skaičius
+
+        Returns:
+            float: Kiek sekundžių laukta
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """
+    Gijoms saugus grandinės pertraukiklis, vedamas atskirai kiekvienam raktui (endpoint)
+
+    Po failure_threshold iš eilės nepavykusių bandymų grandinė atidaroma ir
+    cooldown sekundžių užklausos į tą endpoint nesiunčiamos. Pasibaigus pauzei
+    praleidžiamas vienas bandomasis kvietimas (half-open): sėkmė grandinę uždaro,
+    nesėkmė vėl atidaro naujai pauzei.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializuoja CircuitBreaker objektą
+
+        Args:
+            failure_threshold (int): Nesėkmių iš eilės skaičius grandinei atidaryti
+            cooldown (float): Kiek sekundžių grandinė lieka atvira
+            clock (Callable): Monotoninis laiko šaltinis
+        """
+        if failure_threshold < 1 or cooldown < 0:
+            raise ValueError("failure_threshold turi būti teigiamas, cooldown - neneigiamas")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        # raktas -> [nesėkmių iš eilės, atidarymo laikas arba None, ar vyksta bandomasis kvietimas]
+        self._circuits: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """
+        Tikrina, ar galima siųsti užklausą
+
+        Args:
+            key (str): Grandinės raktas (endpoint)
+
+        Returns:
+            bool: False, jei grandinė atvira arba jau vyksta bandomasis kvietimas
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit[1] is None:
+                return True
+            if self.clock() - circuit[1] < self.cooldown or circuit[2]:
+                return False
+            circuit[2] = True
+            return True
+
+    def record_success(self, key: str):
+        """
+        Pažymi sėkmingą užklausą - grandinė uždaroma
+        """
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key: str):
+        """
+        Pažymi nepavykusią užklausą - pasiekus slenkstį grandinė atidaroma
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, [0, None, False])
+            circuit[0] += 1
+            if circuit[2] or circuit[0] >= self.failure_threshold:
+                if circuit[1] is None or circuit[2]:
+                    logger.warning(f"Grandinė atidaryta {self.cooldown:.0f}s: {key}")
+                circuit[1] = self.clock()
+                circuit[2] = False
+
+    def release(self, key: str):
+        """
+        Atlaisvina bandomąjį kvietimą, jei jis baigėsi be record_success/record_failure
+
+        Kviečiama finally bloke: kitaip netikėtos klaidos atveju grandinė liktų
+        half-open būsenoje ir atmestų visas užklausas.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None:
+                circuit[2] = False
+
+    def state(self, key: str) -> str:
+        """
+        Grąžina grandinės būseną: closed, open arba half-open
+
+        Args:
+            key (str): Grandinės raktas (endpoint)
+
+        Returns:
+            str: Būsena
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit[1] is None:
+                return self.CLOSED
+            if circuit[2] or self.clock() - circuit[1] >= self.cooldown:
+                return self.HALF_OPEN
+            return self.OPEN
+
+    def reset(self):
+        """
+        Uždaro visas grandines
+        """
+        with self._lock:
+            self._circuits.clear()
+
+    @staticmethod
+    def is_failure(error: requests.exceptions.RequestException) -> bool:
+        """
+        Ar klaida rodo serverio ar tinklo gedimą (o ne kliento klaidą, pvz. 404)
+
+        Args:
+            error (RequestException): Užklausos klaida
+
+        Returns:
+            bool: True jungimosi klaidoms, laiko limitui ir 5xx atsakymams
+        """
+        response = error.response
+        return response is None or response.status_code >= 500
+
+
+class HttpClient:
+    """
+    Visiems WeatherAPI objektams bendras HTTP klientas
+
+    Laiko vieną requests.Session su sukonfigūruotu jungčių telkiniu, todėl TLS
+    jungtys pakartotinai naudojamos tarp miestų ir objektų. Grandinės
+    pertraukiklis taip pat bendras - sugedęs endpoint nebandomas iš visų objektų.
+
+    Greičio riba taikoma atskirai kiekvienam hostui: užklausos į kitus serverius
+    (simuliatorių, veidrodį) meteo.lt ribos nenaudoja. Kompromisas: į patį
+    meteo.lt vienu metu siunčiamos užklausos (fetch_forecasts_async, metų
+    stebėjimų užpildymas) neviršija DEFAULT_RATE, todėl jų trukmė auga su
+    užklausų skaičiumi (~2 min. 365 dienoms), bet serveris negrąžina 429.
+    Neribojamam hostui naudokite rate_per_second=None.
+    """
+
+    # meteo.lt leidžia ne daugiau kaip 180 užklausų per minutę iš vieno IP
+    DEFAULT_RATE = 2.9
+    DEFAULT_BURST = 5
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 32,
+                 keep_alive: bool = True,
+                 rate_per_second: Optional[float] = DEFAULT_RATE,
+                 burst: float = DEFAULT_BURST,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 user_agent: str = 'Weather-Analysis-System/1.0',
+                 breaker_threshold: Optional[int] = 5,
+                 breaker_cooldown: float = 30.0):
+        """
+        Inicializuoja HttpClient objektą
+
+        Args:
+            pool_connections (int): Skirtingų hostų telkinių skaičius
+            pool_maxsize (int): Maksimalus jungčių skaičius vienam hostui
+            keep_alive (bool): Ar palaikyti jungtis tarp užklausų
+            rate_per_second (float, optional): Užklausų greičio riba kiekvienam hostui
+                (None - be ribos)
+            burst (float): Leidžiamas užklausų pliūpsnis kiekvienam hostui
+            backoff_base (float): Pirmojo pakartojimo maksimali pauzė sekundėmis
+            backoff_max (float): Maksimali pauzė tarp bandymų sekundėmis
+            user_agent (str): User-Agent antraštė
+            breaker_threshold (int, optional): Nesėkmių iš eilės skaičius endpoint
+                grandinei atidaryti (None - be pertraukiklio)
+            breaker_cooldown (float): Kiek sekundžių atvira grandinė neleidžia užklausų
+        """
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        # hostas -> ribotuvas (kuriamas pirmos užklausos į hostą metu)
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        self._rate_lock = threading.Lock()
+        self.breaker = (CircuitBreaker(breaker_threshold, breaker_cooldown)
+                        if breaker_threshold else None)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive' if keep_alive else 'close',
+        })
+
+    def rate_limiter(self, url: str) -> Optional[TokenBucket]:
+        """
+        Grąžina URL hosto užklausų ribotuvą
+
+        Args:
+            url (str): Pilnas URL
+
+        Returns:
+            TokenBucket: Hosto ribotuvas arba None, jei greitis neribojamas
+        """
+        if not self.rate_per_second:
+            return None
+        host = urlsplit(url).netloc.lower()
+        with self._rate_lock:
+            limiter = self._rate_limiters.get(host)
+            if limiter is None:
+                limiter = TokenBucket(self.rate_per_second, self.burst)
+                self._rate_limiters[host] = limiter
+            return limiter
+
+    def get(self, url: str, params: Optional[Dict] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: float = 30) -> requests.Response:
+        """
+        Atlieka GET užklausą laikantis hosto greičio ribos
+
+        Args:
+            url (str): Pilnas URL
+            params (Dict, optional): Užklausos parametrai
+            headers (Dict, optional): Papildomos antraštės
+            timeout (float): Užklausos laiko limitas sekundėmis
+
+        Returns:
+            requests.Response: HTTP atsakymas
+        """
+        limiter = self.rate_limiter(url)
+        if limiter is not None:
+            waited = limiter.acquire()
+            if waited > 0:
+                logger.debug(f"Užklausų ribojimas: laukta {waited:.2f}s")
+        return self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+    @staticmethod
+    def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """
+        Nuskaito Retry-After antraštę (sekundės arba HTTP data)
+
+        Args:
+            response (requests.Response, optional): HTTP atsakymas
+
+        Returns:
+            float: Laukimo laikas sekundėmis arba None
+        """
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+    def backoff_delay(self, attempt: int,
+                      response: Optional[requests.Response] = None) -> float:
+        """
+        Apskaičiuoja pauzę prieš kitą bandymą
+
+        Jei serveris nurodė Retry-After, jo laikomasi; kitu atveju naudojamas
+        eksponentinis backoff su pilnu atsitiktiniu išsklaidymu (full jitter).
+
+        Args:
+            attempt (int): Nesėkmingo bandymo numeris (nuo 0)
+            response (requests.Response, optional): Paskutinis HTTP atsakymas
+
+        Returns:
+            float: Pauzė sekundėmis
+        """
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_client() -> HttpClient:
+    """
+    Grąžina procesui bendrą HttpClient (sukuriamas pirmo kvietimo metu)
+
+    Returns:
+        HttpClient: Bendras klientas
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
+
+
+def configure_shared_client(**kwargs: Any) -> HttpClient:
+    """
+    Pakeičia procesui bendrą HttpClient nauju su nurodytais nustatymais
+
+    Jau sukurti WeatherAPI objektai toliau naudoja ankstesnį klientą.
+
+    Args:
+        **kwargs: HttpClient konstruktoriaus parametrai
+
+    Returns:
+        HttpClient: Naujas bendras klientas
+    """
+    global _shared_client
+    client = HttpClient(**kwargs)
+    with _shared_lock:
+        _shared_client = client
+    return client
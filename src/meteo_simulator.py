@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+"""
+Vietinis meteo.lt API simuliatorius su įrašymu/atkūrimu ir vėlinimo/klaidų injekcija
+
+Paleidimas:
+    python -m src.meteo_simulator --port 8765 --csv data/forecast_data.csv --latency-ms 50
+
+WeatherAPI nukreipiamas į simuliatorių per base_url parametrą:
+    WeatherAPI('vilnius', base_url='http://127.0.0.1:8765/v1')
+"""
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
+import logging
+
+import requests
+
+try:
+    from .place_catalog import KNOWN_PLACES
+except ImportError:
+    from place_catalog import KNOWN_PLACES
+
+logger = logging.getLogger(__name__)
+
+# Pagrindinių miestų koordinatės
+DEFAULT_PLACES = KNOWN_PLACES
+
+# Automatinės meteorologijos stotys
+DEFAULT_STATIONS = {
+    'vilniaus-ams': ('Vilniaus AMS', 54.62502, 25.10729),
+    'kauno-ams': ('Kauno AMS', 54.88388, 23.83571),
+    'klaipedos-ams': ('Klaipėdos AMS', 55.73048, 21.08853),
+    'siauliu-ams': ('Šiaulių AMS', 55.94255, 23.32588),
+    'panevezio-ams': ('Panevėžio AMS', 55.73279, 24.41175),
+}
+
+FORECAST_SUFFIX = '/forecasts/long-term'
+
+
+def _to_number(value: str) -> Any:
+    """
+    CSV reikšmę paverčia int, float arba palieka tekstu
+    """
+    if value == '':
+        return None
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            continue
+    return value
+
+
+def load_csv_forecast(path: str) -> List[Dict[str, Any]]:
+    """
+    Nuskaito įrašytą prognozę (pvz. data/forecast_data.csv) kaip forecastTimestamps įrašus
+
+    Args:
+        path (str): CSV failo kelias su API stulpelių pavadinimais
+
+    Returns:
+        List[Dict]: forecastTimestamps įrašai
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            record = {'forecastTimeUtc': row['forecastTimeUtc'][:19]}
+            for key, value in row.items():
+                if key in ('forecastTime', 'forecastTimeUtc'):
+                    continue
+                record[key] = _to_number(value)
+            records.append(record)
+    return records
+
+
+class MeteoSimulator:
+    """
+    Klasė, imituojanti meteo.lt /places, /places/{code}/forecasts/long-term ir
+    /stations/{code}/observations/{date} endpoint'us
+
+    Atsakymai imami iš įrašytų JSON failų (replay_dir), įrašytos CSV prognozės
+    arba sintezuojami. Jei nurodytas upstream, trūkstami atsakymai parsiunčiami
+    iš tikro API ir įrašomi į replay_dir.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 replay_dir: Optional[str] = None, upstream: Optional[str] = None,
+                 csv_path: Optional[str] = None, extra_places: int = 0,
+                 forecast_hours: int = 168, latency: float = 0.0,
+                 latency_jitter: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, rate_limit_per_minute: Optional[int] = None,
+                 retry_after: int = 1, seed: Optional[int] = None):
+        """
+        Inicializuoja MeteoSimulator objektą
+
+        Args:
+            host (str): Klausymosi adresas
+            port (int): Prievadas (0 - parenkamas laisvas)
+            replay_dir (str, optional): Įrašytų atsakymų katalogas
+            upstream (str, optional): Tikro API adresas įrašymui (pvz. https://api.meteo.lt/v1)
+            csv_path (str, optional): Įrašyta prognozė CSV formatu visoms vietovėms
+            extra_places (int): Papildomai sugeneruojamų vietovių skaičius
+            forecast_hours (int): Sintezuojamos prognozės ilgis valandomis
+            latency (float): Atsakymo vėlinimas sekundėmis
+            latency_jitter (float): Atsitiktinis papildomas vėlinimas sekundėmis
+            error_rate (float): 500 klaidų tikimybė (0-1)
+            throttle_rate (float): 429 atsakymų tikimybė (0-1)
+            rate_limit_per_minute (int, optional): Užklausų riba per minutę (viršijus - 429)
+            retry_after (int): Retry-After reikšmė 429 atsakymuose
+            seed (int, optional): Atsitiktinių skaičių generatoriaus sėkla
+        """
+        self.host = host
+        self.port = port
+        self.replay_dir = replay_dir
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.forecast_hours = forecast_hours
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.retry_after = retry_after
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.stations = {
+            code: {'code': code, 'name': name,
+                   'coordinates': {'latitude': lat, 'longitude': lon}}
+            for code, (name, lat, lon) in DEFAULT_STATIONS.items()
+        }
+        self._stats = {'requests': 0, 'ok': 0, 'not_modified': 0, 'errors': 0,
+                       'throttled': 0, 'not_found': 0, 'recorded': 0}
+
+        self.places: Dict[str, Dict[str, Any]] = {}
+        for code, (name, division, lat, lon) in DEFAULT_PLACES.items():
+            self._add_place(code, name, division, lat, lon)
+        for i in range(extra_places):
+            self._add_place(f'vieta-{i + 1:04d}', f'Vieta {i + 1}', 'Sugeneruota savivaldybė',
+                            round(self._random.uniform(53.9, 56.4), 5),
+                            round(self._random.uniform(21.0, 26.8), 5))
+
+        self.csv_records = load_csv_forecast(csv_path) if csv_path else None
+
+    def _add_place(self, code: str, name: str, division: str, lat: float, lon: float):
+        self.places[code] = {
+            'code': code,
+            'name': name,
+            'administrativeDivision': division,
+            'country': 'Lietuva',
+            'countryCode': 'LT',
+            'coordinates': {'latitude': lat, 'longitude': lon},
+        }
+
+    @property
+    def base_url(self) -> str:
+        """
+        Simuliatoriaus API adresas WeatherAPI base_url parametrui
+        """
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> 'MeteoSimulator':
+        """
+        Paleidžia serverį foninėje gijoje
+
+        Returns:
+            MeteoSimulator: Šis objektas
+        """
+        simulator = self
+
+        class Handler(_SimulatorHandler):
+            pass
+
+        Handler.simulator = simulator
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        kwargs={'poll_interval': 0.05},
+                                        name='meteo-simulator', daemon=True)
+        self._thread.start()
+        logger.info(f"meteo.lt simuliatorius paleistas: {self.base_url}")
+        return self
+
+    def stop(self):
+        """
+        Sustabdo serverį
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> 'MeteoSimulator':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Grąžina simuliatoriaus užklausų skaitiklius
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _inject_faults(self) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        Pritaiko vėlinimą ir grąžina klaidos atsakymą, jei jis turi būti injektuotas
+        """
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            roll_error = self._random.random()
+            roll_throttle = self._random.random()
+
+            limited = False
+            if self.rate_limit_per_minute:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.rate_limit_per_minute:
+                    limited = True
+                else:
+                    self._recent.append(now)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if limited or roll_throttle < self.throttle_rate:
+            self._count('throttled')
+            body = json.dumps({'error': {'code': 429, 'message': 'Too Many Requests'}})
+            return 429, {'Retry-After': str(self.retry_after)}, body.encode('utf-8')
+        if roll_error < self.error_rate:
+            self._count('errors')
+            body = json.dumps({'error': {'code': 500, 'message': 'Internal Server Error'}})
+            return 500, {}, body.encode('utf-8')
+        return None
+
+    def _replay_path(self, path: str) -> Optional[str]:
+        """
+        Įrašo failo kelias replay_dir kataloge
+
+        Raises:
+            ValueError: Jei kelias (pvz. su '..') išeina už replay_dir ribų
+        """
+        if not self.replay_dir:
+            return None
+        root = os.path.realpath(self.replay_dir)
+        replay_path = os.path.realpath(
+            os.path.join(root, path.strip('/').replace('/', os.sep) + '.json'))
+        if os.path.commonpath([root, replay_path]) != root:
+            raise ValueError(f"Kelias už įrašų katalogo ribų: {path}")
+        return replay_path
+
+    def _load_recorded(self, path: str) -> Optional[Any]:
+        """
+        Grąžina įrašytą atsakymą arba jį įrašo iš upstream
+        """
+        replay_path = self._replay_path(path)
+        if replay_path and os.path.exists(replay_path):
+            with open(replay_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        if self.upstream is None:
+            return None
+
+        response = requests.get(f"{self.upstream}/{path.strip('/')}", timeout=30)
+        if response.status_code != 200:
+            return None
+        payload = response.json()
+
+        if replay_path:
+            os.makedirs(os.path.dirname(replay_path), exist_ok=True)
+            with open(replay_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            self._count('recorded')
+        return payload
+
+    def _synthesize_forecast(self, code: str) -> Dict[str, Any]:
+        """
+        Sugeneruoja tikroviškai atrodančią valandinę prognozę
+        """
+        start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        seed = int(hashlib.md5(f"{code}{start:%Y%m%d%H}".encode('utf-8')).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        base_temp = rng.uniform(-5, 20)
+
+        timestamps = []
+        for hour in range(self.forecast_hours):
+            moment = start + timedelta(hours=hour)
+            diurnal = 5 * math.sin((moment.hour - 9) / 24 * 2 * math.pi)
+            temperature = round(base_temp + diurnal + rng.gauss(0, 1), 1)
+            precipitation = round(max(0.0, rng.gauss(-0.5, 1.0)), 1)
+            timestamps.append({
+                'forecastTimeUtc': moment.strftime('%Y-%m-%d %H:%M:%S'),
+                'airTemperature': temperature,
+                'feelsLikeTemperature': round(temperature - rng.uniform(0, 3), 1),
+                'windSpeed': rng.randint(0, 12),
+                'windGust': rng.randint(2, 20),
+                'windDirection': rng.randint(0, 359),
+                'cloudCover': rng.randint(0, 100),
+                'seaLevelPressure': rng.randint(990, 1035),
+                'relativeHumidity': rng.randint(40, 100),
+                'totalPrecipitation': precipitation,
+                'conditionCode': 'light-rain' if precipitation > 0 else 'cloudy',
+            })
+        return {'timestamps': timestamps, 'created': start.strftime('%Y-%m-%d %H:%M:%S')}
+
+    def _synthesize_observations(self, code: str, day: str) -> Optional[Dict[str, Any]]:
+        """
+        Sugeneruoja valandinius vienos dienos stebėjimus (ateities valandų nėra)
+        """
+        try:
+            start = datetime.strptime(day, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+        now = datetime.now(timezone.utc)
+        seed = int(hashlib.md5(f"{code}{day}".encode('utf-8')).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        seasonal = 8 - 12 * math.cos((start.timetuple().tm_yday - 15) / 365.25 * 2 * math.pi)
+
+        observations = []
+        for hour in range(24):
+            moment = start + timedelta(hours=hour)
+            if moment > now:
+                break
+            diurnal = 4 * math.sin((hour - 9) / 24 * 2 * math.pi)
+            temperature = round(seasonal + diurnal + rng.gauss(0, 1.5), 1)
+            precipitation = round(max(0.0, rng.gauss(-0.6, 0.8)), 1)
+            observations.append({
+                'observationTimeUtc': moment.strftime('%Y-%m-%d %H:%M:%S'),
+                'airTemperature': temperature,
+                'feelsLikeTemperature': round(temperature - rng.uniform(0, 3), 1),
+                'windSpeed': round(rng.uniform(0, 10), 1),
+                'windGust': round(rng.uniform(2, 18), 1),
+                'windDirection': rng.randint(0, 359),
+                'cloudCover': rng.randint(0, 100),
+                'seaLevelPressure': round(rng.uniform(990, 1035), 1),
+                'relativeHumidity': rng.randint(40, 100),
+                'precipitation': precipitation,
+                'conditionCode': 'light-rain' if precipitation > 0 else 'cloudy',
+            })
+        return {'station': self.stations[code], 'observations': observations}
+
+    def _forecast_payload(self, code: str) -> Dict[str, Any]:
+        place = self.places[code]
+        if self.csv_records is not None:
+            timestamps = self.csv_records
+            created = timestamps[0]['forecastTimeUtc'] if timestamps else None
+        else:
+            synthesized = self._synthesize_forecast(code)
+            timestamps, created = synthesized['timestamps'], synthesized['created']
+        return {
+            'place': place,
+            'forecastType': 'long-term',
+            'forecastCreationTimeUtc': created,
+            'forecastTimestamps': timestamps,
+        }
+
+    def resolve(self, path: str) -> Optional[Any]:
+        """
+        Suranda atsakymą API keliui (be /v1 priešdėlio)
+
+        Args:
+            path (str): Kelias, pvz. 'places/vilnius/forecasts/long-term'
+
+        Returns:
+            Any: JSON atsakymas arba None, jei kelias nežinomas
+
+        Raises:
+            ValueError: Jei įrašų kelias išeina už replay_dir ribų
+        """
+        path = path.strip('/')
+        recorded = self._load_recorded(path)
+        if recorded is not None:
+            return recorded
+
+        parts = path.split('/')
+        if parts == ['places']:
+            return [{key: place[key] for key in
+                     ('code', 'name', 'administrativeDivision', 'countryCode')}
+                    for place in self.places.values()]
+        if len(parts) == 2 and parts[0] == 'places' and parts[1] in self.places:
+            return self.places[parts[1]]
+        if (len(parts) == 4 and parts[0] == 'places' and parts[1] in self.places
+                and '/'.join(parts[2:]) == FORECAST_SUFFIX.strip('/')):
+            return self._forecast_payload(parts[1])
+        if parts == ['stations']:
+            return list(self.stations.values())
+        if len(parts) == 2 and parts[0] == 'stations' and parts[1] in self.stations:
+            return self.stations[parts[1]]
+        if (len(parts) == 4 and parts[0] == 'stations' and parts[1] in self.stations
+                and parts[2] == 'observations'):
+            return self._synthesize_observations(parts[1], parts[3])
+        return None
+
+    def handle(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Apdoroja GET užklausą ir grąžina (statusas, antraštės, turinys)
+
+        Args:
+            path (str): Užklausos kelias su /v1 priešdėliu
+            headers (Dict): Užklausos antraštės
+
+        Returns:
+            Tuple: HTTP statusas, atsakymo antraštės ir turinys
+        """
+        self._count('requests')
+
+        fault = self._inject_faults()
+        if fault is not None:
+            return fault
+
+        route = urlsplit(path).path
+        if not route.startswith('/v1/'):
+            self._count('not_found')
+            return 404, {}, b'{"error": {"code": 404}}'
+
+        try:
+            payload = self.resolve(route[len('/v1/'):])
+        except ValueError as e:
+            logger.warning(f"Atmesta užklausa: {e}")
+            self._count('not_found')
+            return 400, {}, b'{"error": {"code": 400}}'
+        if payload is None:
+            self._count('not_found')
+            return 404, {}, b'{"error": {"code": 404}}'
+
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if headers.get('If-None-Match') == etag:
+            self._count('not_modified')
+            return 304, {'ETag': etag}, b''
+
+        response_headers = {'Content-Type': 'application/json; charset=utf-8', 'ETag': etag}
+        if 'gzip' in headers.get('Accept-Encoding', '') and len(body) > 1024:
+            body = gzip.compress(body, compresslevel=1)
+            response_headers['Content-Encoding'] = 'gzip'
+
+        self._count('ok')
+        return 200, response_headers, body
+
+
+class _SimulatorHandler(BaseHTTPRequestHandler):
+    """
+    HTTP užklausų apdorotojas, perduodantis darbą MeteoSimulator objektui
+    """
+
+    simulator: MeteoSimulator = None
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, headers, body = self.simulator.handle(self.path, dict(self.headers))
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vietinis meteo.lt API simuliatorius")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--replay-dir', help="Įrašytų atsakymų katalogas")
+    parser.add_argument('--record-from', help="Tikro API adresas įrašymui")
+    parser.add_argument('--csv', help="Įrašyta prognozė CSV formatu")
+    parser.add_argument('--extra-places', type=int, default=0)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, help="Užklausų riba per minutę")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = MeteoSimulator(
+        host=args.host, port=args.port, replay_dir=args.replay_dir,
+        upstream=args.record_from, csv_path=args.csv, extra_places=args.extra_places,
+        latency=args.latency_ms / 1000, latency_jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        rate_limit_per_minute=args.rate_limit
+    )
+    simulator.start()
+    print(f"Simuliatorius veikia: {simulator.base_url} (Ctrl+C - sustabdyti)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
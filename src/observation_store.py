@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+Istorinių stebėjimų (meteo.lt /stations/{code}/observations/{date}) saugykla ir sinchronizavimas
+
+Paleidimas (metų duomenų užpildymas ir vėlesnis papildymas):
+    python -m src.observation_store --station vilniaus-ams --days 365
+"""
+import argparse
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Iterable, Set
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Vietovė -> artimiausia automatinė meteorologijos stotis
+PLACE_STATIONS = {
+    'vilnius': 'vilniaus-ams',
+    'kaunas': 'kauno-ams',
+    'klaipeda': 'klaipedos-ams',
+    'siauliai': 'siauliu-ams',
+    'panevezys': 'panevezio-ams',
+}
+
+# API stulpelių pavadinimai -> lietuviški pavadinimai
+OBSERVATION_COLUMN_MAPPING = {
+    'airTemperature': 'temperatura',
+    'relativeHumidity': 'dregme',
+    'windSpeed': 'vejo_greitis',
+    'seaLevelPressure': 'slegimasJuros',
+    'precipitation': 'krituliai'
+}
+
+NUMERIC_FIELDS = (
+    'airTemperature', 'feelsLikeTemperature', 'windSpeed', 'windGust',
+    'windDirection', 'cloudCover', 'seaLevelPressure', 'relativeHumidity',
+    'precipitation',
+)
+TEXT_FIELDS = ('conditionCode',)
+FIELDS = NUMERIC_FIELDS + TEXT_FIELDS
+
+TIME_COLUMN = 'observationTimeUtc'
+INDEX_NAME = 'observationTimeLocal'
+
+
+def _utc_seconds(values: List[str]) -> np.ndarray:
+    """
+    Paverčia 'YYYY-MM-DD HH:MM:SS' UTC laikus į Unix sekundes
+    """
+    try:
+        return np.array(values, dtype='datetime64[s]').astype(np.int64)
+    except ValueError:
+        return (pd.to_datetime(pd.Series(values), utc=True)
+                .astype('int64').to_numpy() // 10 ** 9)
+
+
+class ObservationStore:
+    """
+    SQLite laiko eilučių saugykla, indeksuota pagal (stotis, laikas)
+
+    Be stebėjimų saugoma ir kurios dienos jau pilnai parsiųstos, todėl
+    pakartotinis sinchronizavimas siunčia tik naujas (ar nebaigtas) dienas.
+    """
+
+    def __init__(self, path: str = "data/observations.sqlite"):
+        """
+        Inicializuoja ObservationStore objektą
+
+        Args:
+            path (str): SQLite failo kelias
+        """
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        columns = ', '.join(
+            [f"{field} REAL" for field in NUMERIC_FIELDS] +
+            [f"{field} TEXT" for field in TEXT_FIELDS]
+        )
+        conn = self._connection()
+        with conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS observations (
+                    station TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    {columns},
+                    PRIMARY KEY (station, ts)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS synced_days (
+                    station TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    complete INTEGER NOT NULL,
+                    rows INTEGER NOT NULL,
+                    synced_at REAL NOT NULL,
+                    PRIMARY KEY (station, day)
+                ) WITHOUT ROWID
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Grąžina gijai priklausantį SQLite prisijungimą
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def write_day(self, station: str, day: date, observations: List[Dict[str, Any]],
+                  complete: bool = True) -> int:
+        """
+        Įrašo vienos dienos stebėjimus (esami to paties laiko įrašai perrašomi)
+
+        Args:
+            station (str): Stoties kodas
+            day (date): Diena
+            observations (List[Dict]): API stebėjimų įrašai
+            complete (bool): Ar diena baigta (nebaigta diena bus siunčiama iš naujo)
+
+        Returns:
+            int: Įrašytų eilučių skaičius
+        """
+        observations = [obs for obs in observations if obs.get(TIME_COLUMN)]
+        seconds = _utc_seconds([obs[TIME_COLUMN] for obs in observations])
+        rows = [
+            (station, int(ts), *(obs.get(field) for field in FIELDS))
+            for ts, obs in zip(seconds, observations)
+        ]
+
+        placeholders = ', '.join('?' * (len(FIELDS) + 2))
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO observations (station, ts, {', '.join(FIELDS)}) "
+                f"VALUES ({placeholders})", rows
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO synced_days (station, day, complete, rows, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (station, day.isoformat(), int(complete), len(rows),
+                 datetime.now(timezone.utc).timestamp())
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def synced_days(self, station: str, start: date, end: date) -> Set[date]:
+        """
+        Grąžina pilnai parsiųstas dienas intervale
+
+        Args:
+            station (str): Stoties kodas
+            start (date): Pradžios diena
+            end (date): Pabaigos diena (imtinai)
+
+        Returns:
+            Set[date]: Baigtos dienos
+        """
+        rows = self._connection().execute(
+            "SELECT day FROM synced_days WHERE station = ? AND complete = 1 "
+            "AND day BETWEEN ? AND ?", (station, start.isoformat(), end.isoformat())
+        ).fetchall()
+        return {date.fromisoformat(row[0]) for row in rows}
+
+    def last_synced_day(self, station: str) -> Optional[date]:
+        """
+        Grąžina paskutinę pilnai parsiųstą dieną
+
+        Args:
+            station (str): Stoties kodas
+
+        Returns:
+            date: Paskutinė baigta diena arba None
+        """
+        row = self._connection().execute(
+            "SELECT MAX(day) FROM synced_days WHERE station = ? AND complete = 1", (station,)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def load(self, station: str, start: Optional[datetime] = None,
+             end: Optional[datetime] = None, tz='Europe/Vilnius') -> pd.DataFrame:
+        """
+        Nuskaito stebėjimus kaip DataFrame su vietinio laiko indeksu
+
+        Args:
+            station (str): Stoties kodas
+            start (datetime, optional): Pradžios laikas (UTC, jei be laiko zonos)
+            end (datetime, optional): Pabaigos laikas, neimtinai
+            tz: Vietinė laiko zona
+
+        Returns:
+            pd.DataFrame: Stebėjimai lietuviškais stulpelių pavadinimais
+        """
+        query = f"SELECT ts, {', '.join(FIELDS)} FROM observations WHERE station = ?"
+        params: List[Any] = [station]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(int(pd.Timestamp(start).timestamp()))
+        if end is not None:
+            query += " AND ts < ?"
+            params.append(int(pd.Timestamp(end).timestamp()))
+        query += " ORDER BY ts"
+
+        rows = self._connection().execute(query, params).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * (len(FIELDS) + 1)
+
+        utc_index = pd.DatetimeIndex(
+            np.array(columns[0], dtype=np.int64).astype('datetime64[s]')
+        ).tz_localize('UTC')
+        data = {TIME_COLUMN: utc_index}
+        for field, values in zip(FIELDS, columns[1:]):
+            dtype = object if field in TEXT_FIELDS else np.float64
+            data[OBSERVATION_COLUMN_MAPPING.get(field, field)] = np.array(
+                [np.nan if v is None and dtype is np.float64 else v for v in values],
+                dtype=dtype
+            )
+
+        local_index = utc_index.tz_convert(tz).rename(INDEX_NAME)
+        return pd.DataFrame(data, index=local_index, copy=False)
+
+
+class ObservationSync:
+    """
+    Lygiagretus stebėjimų parsiuntimas į ObservationStore su tęsimu nuo paskutinės dienos
+    """
+
+    def __init__(self, api, store: ObservationStore, max_workers: int = 4,
+                 tz='Europe/Vilnius'):
+        """
+        Inicializuoja ObservationSync objektą
+
+        Args:
+            api (WeatherAPI): API objektas užklausoms
+            store (ObservationStore): Stebėjimų saugykla
+            max_workers (int): Maksimalus lygiagrečių užklausų skaičius
+            tz: Laiko zona, kurios datomis skaičiuojamos dienos (kaip get_historical_data)
+        """
+        self.api = api
+        self.store = store
+        self.max_workers = max_workers
+        self.tz = tz
+
+    def today(self) -> date:
+        """
+        Šiandienos data vietiniu laiku
+        """
+        return pd.Timestamp.now(tz=self.tz).date()
+
+    @staticmethod
+    def _days(start: date, end: date) -> Iterable[date]:
+        for offset in range((end - start).days + 1):
+            yield start + timedelta(days=offset)
+
+    def _fetch_day(self, station: str, day: date) -> Optional[List[Dict[str, Any]]]:
+        data = self.api._make_request(f'stations/{station}/observations/{day.isoformat()}')
+        if not data or 'observations' not in data:
+            return None
+        return data['observations']
+
+    def sync(self, station: str, start: date, end: date) -> Dict[str, int]:
+        """
+        Parsiunčia intervalo dienas, kurių dar nėra saugykloje
+
+        Šiandienos (vietiniu laiku) ir vėlesnės dienos pažymimos kaip nebaigtos,
+        todėl kito paleidimo metu jos parsiunčiamos iš naujo.
+
+        Args:
+            station (str): Stoties kodas
+            start (date): Pradžios diena
+            end (date): Pabaigos diena (imtinai)
+
+        Returns:
+            Dict: Parsiųstų dienų, įrašytų eilučių ir nepavykusių dienų skaičiai
+        """
+        today = self.today()
+        end = min(end, today)
+        done = self.store.synced_days(station, start, end)
+        pending = [day for day in self._days(start, end) if day not in done]
+
+        result = {'days': 0, 'rows': 0, 'failed': 0}
+        if not pending:
+            logger.info(f"Stotis {station}: visos dienos jau saugykloje")
+            return result
+
+        logger.info(f"Stotis {station}: siunčiama {len(pending)} dienų nuo {pending[0]}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch_day, station, day): day for day in pending}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    observations = future.result()
+                except Exception as e:
+                    logger.error(f"Klaida siunčiant {station} {day}: {e}")
+                    observations = None
+                if observations is None:
+                    result['failed'] += 1
+                    continue
+                result['rows'] += self.store.write_day(station, day, observations,
+                                                       complete=day < today)
+                result['days'] += 1
+
+        logger.info(f"Stotis {station}: įrašyta {result['days']} dienų, "
+                    f"{result['rows']} eilučių, nepavyko {result['failed']}")
+        return result
+
+    def resume(self, station: str, days: int = 365,
+               end: Optional[date] = None) -> Dict[str, int]:
+        """
+        Tęsia sinchronizavimą nuo paskutinės saugomos dienos
+
+        Tuščiai saugyklai parsiunčiamos paskutinės `days` dienos. Vėliau siunčiamos
+        tik naujos dienos ir anksčiau nepavykusios lango dienos.
+
+        Args:
+            station (str): Stoties kodas
+            days (int): Saugomo lango ilgis dienomis
+            end (date, optional): Pabaigos diena (numatytoji - šiandien vietiniu laiku)
+
+        Returns:
+            Dict: Kaip sync()
+        """
+        end = end or self.today()
+        # sync() praleidžia jau baigtas dienas ir registruoja pirmą siunčiamą dieną
+        return self.sync(station, end - timedelta(days=days - 1), end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="meteo.lt stebėjimų sinchronizavimas")
+    parser.add_argument('--station', action='append',
+                        help="Stoties kodas (galima kartoti; numatytosios - 5 miestai)")
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--db', default='data/observations.sqlite')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    try:
+        from .weather_api import WeatherAPI
+    except ImportError:
+        from weather_api import WeatherAPI
+
+    logging.basicConfig(level=logging.INFO)
+    store = ObservationStore(args.db)
+    sync = ObservationSync(WeatherAPI('vilnius'), store, max_workers=args.workers)
+    for station in args.station or PLACE_STATIONS.values():
+        result = sync.resume(station, days=args.days)
+        print(f"{station}: {result}")
+
+
+if __name__ == "__main__":
+    main()
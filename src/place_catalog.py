@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+meteo.lt vietovių katalogo modulis
+"""
+import csv
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Pagrindinių miestų koordinatės: jomis užpildomas numatytasis katalogas, kol
+# data/places.csv dar neparsiųstas (refresh())
+KNOWN_PLACES = {
+    'vilnius': ('Vilnius', 'Vilniaus miesto savivaldybė', 54.68705, 25.28291),
+    'kaunas': ('Kaunas', 'Kauno miesto savivaldybė', 54.90272, 23.90961),
+    'klaipeda': ('Klaipėda', 'Klaipėdos miesto savivaldybė', 55.70329, 21.14427),
+    'siauliai': ('Šiauliai', 'Šiaulių miesto savivaldybė', 55.93333, 23.31667),
+    'panevezys': ('Panevėžys', 'Panevėžio miesto savivaldybė', 55.73333, 24.35),
+}
+
+
+class PlaceCatalog:
+    """
+    Klasė visų meteo.lt vietovių (~1800) katalogui su koordinatėmis ir savivaldybėmis
+
+    Katalogas vieną kartą parsiunčiamas per /places ir saugomas kompaktiškame
+    CSV faile, todėl paleidimo metu jis įkeliamas be tinklo užklausų.
+    """
+
+    COLUMNS = ['code', 'name', 'administrativeDivision', 'countryCode',
+               'latitude', 'longitude']
+    DEFAULT_PATH = os.path.join('data', 'places.csv')
+    EARTH_RADIUS_KM = 6371.0088
+
+    _default_instance = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Inicializuoja PlaceCatalog objektą ir įkelia katalogą iš failo, jei jis yra
+
+        Numatytasis katalogas (be path), kurio failo dar nėra, užpildomas
+        KNOWN_PLACES miestais, kad paieška pagal koordinates veiktų be tinklo.
+
+        Args:
+            path (str, optional): Katalogo CSV failo kelias
+        """
+        self.path = path or self.DEFAULT_PATH
+        self.places: Dict[str, Dict[str, Any]] = {}
+
+        # Erdvinis indeksas kuriamas tik pirmos paieškos metu
+        self._tree = None
+        self._tree_codes: Optional[np.ndarray] = None
+        self._tree_lock = threading.Lock()
+
+        if os.path.exists(self.path):
+            self.load()
+        elif path is None:
+            self.places = {
+                code: {'code': code, 'name': name, 'administrativeDivision': division,
+                       'countryCode': 'LT', 'latitude': lat, 'longitude': lon}
+                for code, (name, division, lat, lon) in KNOWN_PLACES.items()
+            }
+            logger.info(f"Nėra {self.path} - naudojami {len(self.places)} pagrindiniai miestai")
+
+    @classmethod
+    def default(cls) -> 'PlaceCatalog':
+        """
+        Grąžina bendrą numatytojo failo katalogą (įkeliamas vieną kartą procese)
+
+        Returns:
+            PlaceCatalog: Numatytasis katalogas
+        """
+        with cls._default_lock:
+            if cls._default_instance is None:
+                cls._default_instance = cls()
+            return cls._default_instance
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.places
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        """
+        Grąžina vietovės įrašą
+
+        Args:
+            code (str): Vietovės kodas
+
+        Returns:
+            Dict: Vietovės duomenys arba None
+        """
+        return self.places.get(code)
+
+    def load(self) -> int:
+        """
+        Įkelia katalogą iš CSV failo
+
+        Returns:
+            int: Įkeltų vietovių skaičius
+        """
+        places = {}
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                for key in ('latitude', 'longitude'):
+                    row[key] = float(row[key]) if row.get(key) else None
+                places[row['code']] = row
+
+        self.places = places
+        self._tree = None
+        logger.info(f"Įkeltas vietovių katalogas: {len(places)} vietovių")
+        return len(places)
+
+    def save(self):
+        """
+        Išsaugo katalogą į CSV failą (atominis perrašymas)
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for code in sorted(self.places):
+                writer.writerow(self.places[code])
+
+        os.replace(tmp_path, self.path)
+        logger.info(f"Vietovių katalogas išsaugotas: {self.path}")
+
+    def refresh(self, api, max_workers: int = 8, save: bool = True) -> int:
+        """
+        Parsiunčia vietovių sąrašą ir trūkstamas koordinates iš meteo.lt
+
+        Koordinatės pateikiamos tik /places/{code} atsakyme, todėl jos gaunamos
+        lygiagrečiai per ribotą gijų telkinį. Jau žinomos koordinatės nekeičiamos.
+
+        Args:
+            api (WeatherAPI): API objektas užklausoms
+            max_workers (int): Maksimalus lygiagrečių užklausų skaičius
+            save (bool): Ar išsaugoti katalogą į failą
+
+        Returns:
+            int: Vietovių skaičius kataloge
+        """
+        listing = api._make_request('places')
+        if not listing:
+            logger.error("Nepavyko gauti vietovių sąrašo")
+            return len(self.places)
+
+        places = {}
+        for item in listing:
+            code = item.get('code')
+            if not code:
+                continue
+            previous = self.places.get(code, {})
+            places[code] = {
+                'code': code,
+                'name': item.get('name'),
+                'administrativeDivision': item.get('administrativeDivision'),
+                'countryCode': item.get('countryCode'),
+                'latitude': previous.get('latitude'),
+                'longitude': previous.get('longitude'),
+            }
+
+        missing = [code for code, place in places.items() if place['latitude'] is None]
+
+        def fetch_details(code: str) -> Optional[Dict[str, Any]]:
+            return api._make_request(f'places/{code}')
+
+        if missing:
+            logger.info(f"Gaunamos koordinatės {len(missing)} vietovėms")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for code, details in zip(missing, executor.map(fetch_details, missing)):
+                    coordinates = (details or {}).get('coordinates') or {}
+                    places[code]['latitude'] = coordinates.get('latitude')
+                    places[code]['longitude'] = coordinates.get('longitude')
+
+        self.places = places
+        self._tree = None
+        if save:
+            self.save()
+
+        logger.info(f"Atnaujintas vietovių katalogas: {len(places)} vietovių")
+        return len(places)
+
+    def select(self, division: Optional[str] = None,
+               country_code: Optional[str] = 'LT') -> List[str]:
+        """
+        Atrenka vietovių kodus pagal savivaldybę ir šalį
+
+        Args:
+            division (str, optional): Savivaldybės pavadinimas
+            country_code (str, optional): Šalies kodas (None - visos šalys)
+
+        Returns:
+            List[str]: Vietovių kodai
+        """
+        return [
+            code for code, place in self.places.items()
+            if (division is None or place.get('administrativeDivision') == division)
+            and (country_code is None or place.get('countryCode') == country_code)
+        ]
+
+    @staticmethod
+    def _to_unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        Paverčia platumą/ilgumą į vienetinės sferos 3D koordinates
+        """
+        lat_rad = np.radians(lat)
+        lon_rad = np.radians(lon)
+        cos_lat = np.cos(lat_rad)
+        return np.column_stack((cos_lat * np.cos(lon_rad),
+                                cos_lat * np.sin(lon_rad),
+                                np.sin(lat_rad)))
+
+    def _build_index(self):
+        """
+        Sukuria KD-medį iš vietovių, turinčių koordinates
+        """
+        from scipy.spatial import cKDTree
+
+        with self._tree_lock:
+            if self._tree is not None:
+                return
+            located = [(code, place['latitude'], place['longitude'])
+                       for code, place in self.places.items()
+                       if place.get('latitude') is not None and place.get('longitude') is not None]
+            if not located:
+                raise ValueError("Kataloge nėra vietovių su koordinatėmis")
+
+            codes, lats, lons = zip(*located)
+            self._tree_codes = np.array(codes, dtype=object)
+            self._tree = cKDTree(self._to_unit_vectors(np.array(lats, dtype=float),
+                                                       np.array(lons, dtype=float)))
+            logger.info(f"Sukurtas vietovių erdvinis indeksas: {len(codes)} vietovių")
+
+    def nearest(self, lat, lon, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Randa k artimiausių vietovių vienam taškui arba taškų masyvui
+
+        Paieška vykdoma KD-medyje vienetinės sferos koordinatėmis, todėl atstumai
+        atitinka didžiojo apskritimo atstumus.
+
+        Args:
+            lat (float | array-like): Platuma (laipsniais)
+            lon (float | array-like): Ilguma (laipsniais)
+            k (int): Grąžinamų vietovių skaičius kiekvienam taškui
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Vietovių kodai ir atstumai kilometrais,
+            forma (k,) vienam taškui arba (n, k) taškų masyvui
+        """
+        if k < 1:
+            raise ValueError("k turi būti teigiamas")
+        if self._tree is None:
+            self._build_index()
+
+        lat_arr = np.asarray(lat, dtype=float)
+        lon_arr = np.asarray(lon, dtype=float)
+        if lat_arr.shape != lon_arr.shape:
+            raise ValueError("Platumų ir ilgumų masyvų formos nesutampa")
+
+        k = min(k, len(self._tree_codes))
+        points = self._to_unit_vectors(np.atleast_1d(lat_arr), np.atleast_1d(lon_arr))
+        chord, idx = self._tree.query(points, k=list(range(1, k + 1)))
+
+        # Stygos ilgis -> didžiojo apskritimo atstumas
+        distances = 2 * self.EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+        codes = self._tree_codes[idx]
+
+        if lat_arr.ndim == 0:
+            return codes[0], distances[0]
+        return codes, distances
+
+    def fetch_forecasts(self, api, codes: Optional[Iterable[str]] = None,
+                        division: Optional[str] = None, days: int = 7,
+                        max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Gauna bet kurio vietovių poaibio prognozes per ribotą lygiagrečių užklausų telkinį
+
+        Args:
+            api (WeatherAPI): API objektas užklausoms
+            codes (Iterable[str], optional): Vietovių kodai (None - visos atrinktos)
+            division (str, optional): Savivaldybė, jei codes nenurodyti
+            days (int): Dienų skaičius prognozei
+            max_workers (int): Maksimalus lygiagrečių užklausų skaičius
+
+        Returns:
+            Dict: Vietovės kodas -> prognozės DataFrame (None, jei nepavyko)
+        """
+        if codes is None:
+            codes = self.select(division=division)
+        return api.fetch_forecasts(codes, days=days, max_concurrency=max_workers)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        from .weather_api import WeatherAPI
+    except ImportError:
+        from weather_api import WeatherAPI
+
+    catalog = PlaceCatalog()
+    count = catalog.refresh(WeatherAPI(catalog=catalog))
+    print(f"Vietovių kataloge: {count}")
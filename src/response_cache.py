@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Persistentinis HTTP atsakymų podėlis (cache) meteo.lt API užklausoms
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Optional, Dict, Any, Callable
+from urllib.parse import urlencode
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Vienas podėlyje saugomas API atsakymas
+    """
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    expires_at: float
+    fresh: bool
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Grąžina sąlyginės užklausos antraštes (If-None-Match / If-Modified-Since)
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    SQLite pagrįstas API atsakymų podėlis su TTL, sąlyginiu atnaujinimu ir LRU valymu
+
+    Vienas failas gali būti naudojamas kelių procesų vienu metu - SQLite
+    užrakinimas (WAL režimas) užtikrina, kad įrašai nebus sugadinti.
+    """
+
+    DEFAULT_TTL_RULES = {
+        'places/*/forecasts/*': 1800,
+        'places': 86400,
+        'places/*': 86400,
+    }
+
+    def __init__(self, path: str = "data/http_cache.sqlite", default_ttl: float = 600,
+                 ttl_rules: Optional[Dict[str, float]] = None,
+                 max_bytes: int = 50 * 1024 * 1024,
+                 clock: Callable[[], float] = time.time):
+        """
+        Inicializuoja ResponseCache objektą
+
+        Args:
+            path (str): SQLite failo kelias
+            default_ttl (float): TTL sekundėmis, kai endpoint neatitinka jokios taisyklės
+            ttl_rules (Dict, optional): fnmatch šablonas -> TTL sekundėmis
+            max_bytes (int): Maksimalus saugomų atsakymų dydis baitais
+            clock (Callable): Laiko šaltinis (testams)
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttl_rules = dict(self.DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'revalidations': 0,
+                       'stores': 0, 'evictions': 0}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Grąžina gijai priklausantį SQLite prisijungimą
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """
+        Sudaro podėlio raktą iš endpoint ir užklausos parametrų
+
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+
+        Returns:
+            str: Podėlio raktas
+        """
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Grąžina endpoint TTL - pirmoji atitikusi taisyklė laimi
+
+        Args:
+            endpoint (str): API endpoint
+
+        Returns:
+            float: TTL sekundėmis
+        """
+        for pattern, ttl in self.ttl_rules.items():
+            if fnmatch(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[CacheEntry]:
+        """
+        Ieško atsakymo podėlyje
+
+        Šviežias įrašas skaičiuojamas kaip pataikymas (hit). Pasenęs įrašas vis tiek
+        grąžinamas, kad jo ETag/Last-Modified galėtų būti panaudoti sąlyginei užklausai.
+
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+
+        Returns:
+            CacheEntry: Rastas įrašas arba None
+        """
+        key = self.make_key(endpoint, params)
+        now = self.clock()
+        conn = self._connection()
+
+        try:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, stored_at, expires_at "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning(f"Podėlio skaitymo klaida: {e}")
+            row = None
+
+        if row is None:
+            self._count('misses')
+            return None
+
+        body, etag, last_modified, stored_at, expires_at = row
+        fresh = now < expires_at
+        self._count('hits' if fresh else 'misses')
+        return CacheEntry(data=json.loads(body), etag=etag, last_modified=last_modified,
+                          stored_at=stored_at, expires_at=expires_at, fresh=fresh)
+
+    def set(self, endpoint: str, params: Optional[Dict], data: Any,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Išsaugo atsakymą podėlyje ir, jei reikia, pašalina seniausiai naudotus įrašus
+
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+            data (Any): JSON atsakymas
+            etag (str, optional): ETag antraštė
+            last_modified (str, optional): Last-Modified antraštė
+        """
+        key = self.make_key(endpoint, params)
+        body = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        now = self.clock()
+        expires_at = now + self.ttl_for(endpoint)
+        conn = self._connection()
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, endpoint, body, etag, last_modified, stored_at, expires_at, "
+                    "last_access, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, body, etag, last_modified, now, expires_at, now,
+                     len(body.encode('utf-8')))
+                )
+                evicted = self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning(f"Podėlio rašymo klaida: {e}")
+            return
+
+        self._count('stores')
+        if evicted:
+            self._count('evictions', evicted)
+
+    def revalidated(self, endpoint: str, params: Optional[Dict] = None):
+        """
+        Pažymi, kad serveris patvirtino įrašą (304 Not Modified) - pratęsiamas galiojimas
+
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+        """
+        key = self.make_key(endpoint, params)
+        now = self.clock()
+        try:
+            self._connection().execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                (now + self.ttl_for(endpoint), now, key)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Podėlio atnaujinimo klaida: {e}")
+            return
+        self._count('revalidations')
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """
+        Pašalina seniausiai naudotus įrašus, kol bendras dydis neviršija max_bytes
+        """
+        cursor = conn.execute("""
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (
+                        ORDER BY last_access DESC, stored_at DESC
+                    ) AS running_size
+                    FROM responses
+                ) WHERE running_size > ?
+            )
+        """, (self.max_bytes,))
+        return cursor.rowcount
+
+    def clear(self):
+        """
+        Išvalo visus podėlio įrašus
+        """
+        self._connection().execute("DELETE FROM responses")
+
+    def size_bytes(self) -> int:
+        """
+        Grąžina bendrą saugomų atsakymų dydį baitais
+        """
+        row = self._connection().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return int(row[0])
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Grąžina šio proceso podėlio skaitiklius
+
+        Returns:
+            Dict: hits, misses, revalidations, stores, evictions
+        """
+        with self._stats_lock:
+            return dict(self._stats)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Slenkančių langų (365, 30, 7 dienų) vidurkiai kiekvienai dienai per prefiksų sumas
+
+Valandiniai duomenys pirmiausia sutraukiami į dienų sumas ir validžių reikšmių
+skaičius (NaN praleidžiami), išdėstomi ištisiniame kalendoriuje (trūkstamos dienos -
+nuliai) ir sukaupiami cumsum. Bet kurio lango suma tada yra dviejų prefiksų
+skirtumas, todėl visų dienų visi langai apskaičiuojami per O(n).
+"""
+from typing import Iterable, Sequence, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .weekend_rain import local_days
+except ImportError:
+    from weekend_rain import local_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOWS = (365, 30, 7)
+
+
+def daily_totals(df: pd.DataFrame, columns: Sequence[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Sutraukia įrašus į vietinių dienų sumas ir validžių reikšmių skaičius
+
+    Rezultatus iš kelių duomenų dalių galima sujungti sudedant pagal dieną.
+
+    Args:
+        df (pd.DataFrame): Duomenys su DatetimeIndex
+        columns (Sequence[str]): Stulpeliai
+
+    Returns:
+        Tuple[DataFrame, DataFrame]: (sumos, kiekiai), indeksas - diena (datetime64[D])
+    """
+    days, inverse = np.unique(local_days(df.index), return_inverse=True)
+    index = pd.DatetimeIndex(days, name='data')
+    sums, counts = {}, {}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        sums[column] = np.bincount(inverse, weights=np.where(valid, values, 0.0), minlength=len(days))
+        counts[column] = np.bincount(inverse, weights=valid, minlength=len(days))
+    return (pd.DataFrame(sums, index=index, columns=list(columns)),
+            pd.DataFrame(counts, index=index, columns=list(columns)))
+
+
+def trailing_means(sums: pd.DataFrame, counts: pd.DataFrame,
+                   windows: Iterable[int] = DEFAULT_WINDOWS,
+                   min_coverage: float = 0.0) -> pd.DataFrame:
+    """
+    Apskaičiuoja kiekvienos kalendoriaus dienos slenkančių langų vidurkius
+
+    Lango vidurkis - visų lango dienų validžių įrašų vidurkis (kaip
+    calculate_yearly_averages, o ne dienų vidurkių vidurkis).
+
+    Args:
+        sums (pd.DataFrame): Dienų sumos (daily_totals)
+        counts (pd.DataFrame): Dienų validžių reikšmių skaičiai
+        windows (Iterable[int]): Langų ilgiai dienomis (langas baigiasi ta diena imtinai)
+        min_coverage (float): Mažiausia lango dienų su duomenimis dalis (0-1);
+            mažesnės aprėpties langai (pvz. duomenų pradžioje) grąžinami NaN
+
+    Returns:
+        pd.DataFrame: Ištisinis dienų indeksas, stulpeliai '{stulpelis}_{langas}d'
+    """
+    windows = list(windows)
+    if any(window < 1 for window in windows):
+        raise ValueError("Lango ilgis turi būti teigiamas")
+    if sums.empty:
+        return pd.DataFrame(columns=[f'{column}_{window}d' for column in sums.columns
+                                     for window in windows])
+
+    sums = sums.groupby(level=0).sum().sort_index()
+    counts = counts.groupby(level=0).sum().reindex(sums.index)
+    calendar = pd.date_range(sums.index[0], sums.index[-1], freq='D', name='data')
+    positions = ((sums.index - calendar[0]) // pd.Timedelta(days=1)).to_numpy()
+
+    def prefix(values: np.ndarray) -> np.ndarray:
+        grid = np.zeros((len(calendar) + 1, values.shape[1]))
+        grid[positions + 1] = values
+        return np.cumsum(grid, axis=0)
+
+    sum_prefix = prefix(sums.to_numpy(dtype=np.float64))
+    count_prefix = prefix(counts.to_numpy(dtype=np.float64))
+    day_prefix = prefix((counts.to_numpy() > 0).astype(np.float64))
+
+    upper = np.arange(1, len(calendar) + 1)
+    result = {}
+    for window in windows:
+        lower = np.maximum(upper - window, 0)
+        window_sum = sum_prefix[upper] - sum_prefix[lower]
+        window_count = count_prefix[upper] - count_prefix[lower]
+        window_days = day_prefix[upper] - day_prefix[lower]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = window_sum / window_count
+        means[(window_count == 0) | (window_days < min_coverage * window)] = np.nan
+        for position, column in enumerate(sums.columns):
+            result[f'{column}_{window}d'] = means[:, position]
+
+    ordered = [f'{column}_{window}d' for column in sums.columns for window in windows]
+    return pd.DataFrame(result, index=calendar)[ordered]
+
+
+def climate_trends(sums: pd.DataFrame, counts: pd.DataFrame, window: int = 30,
+                   min_coverage: float = 0.0) -> pd.DataFrame:
+    """
+    Metų ir mėnesio pokyčiai kiekvienai dienai
+
+    Palyginamas dienos slenkančio lango vidurkis su to paties lango vidurkiu
+    prieš 365 dienas (metinis pokytis) ir prieš 30 dienų (mėnesio pokytis).
+
+    Args:
+        sums (pd.DataFrame): Dienų sumos (daily_totals)
+        counts (pd.DataFrame): Dienų validžių reikšmių skaičiai
+        window (int): Lyginamo lango ilgis dienomis
+        min_coverage (float): Žr. trailing_means
+
+    Returns:
+        pd.DataFrame: '{stulpelis}_{langas}d', '{stulpelis}_metinis_pokytis',
+            '{stulpelis}_mėnesio_pokytis'
+    """
+    means = trailing_means(sums, counts, [window], min_coverage)
+    result = {}
+    for column in sums.columns:
+        current = means[f'{column}_{window}d']
+        result[f'{column}_{window}d'] = current
+        result[f'{column}_metinis_pokytis'] = current - current.shift(365)
+        result[f'{column}_mėnesio_pokytis'] = current - current.shift(30)
+    return pd.DataFrame(result, index=means.index)
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""
+Srautinis (vieno praėjimo) statistikos variklis WeatherAnalyzer rodikliams
+
+Duomenys apdorojami dalimis (chunks): kiekvienai daliai apskaičiuojami vidurkis,
+kvadratinių nuokrypių suma, minimumas ir maksimumas, o su ankstesnėmis dalimis jie
+sujungiami Chan/Welford formule. Visos duomenų aibės atmintyje laikyti nereikia -
+tik paskutinių 365 dienų eilutes metiniams vidurkiams ir prognozės kritulius.
+"""
+import math
+from datetime import timedelta
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .weekend_rain import (PRECIPITATION_COLUMN, local_days, split_place_index,
+                               weekend_rain_reports)
+except ImportError:
+    from weekend_rain import (PRECIPITATION_COLUMN, local_days, split_place_index,
+                              weekend_rain_reports)
+
+logger = logging.getLogger(__name__)
+
+# Stulpelis -> metinio vidurkio raktas (tokia pat tvarka kaip WeatherAnalyzer)
+YEARLY_AVERAGE_KEYS = {
+    'temperatura': 'vidutinė_metų_temperatūra',
+    'dregme': 'vidutinė_metų_drėgmė',
+    'vejo_greitis': 'vidutinis_vėjo_greitis',
+    'slegimasJuros': 'vidutinis_slėgimas',
+}
+
+# Stulpelis -> [(raktas, 'max' | 'min'), ...] ekstremumų ataskaitai
+EXTREME_KEYS = {
+    'temperatura': [('aukščiausia_temperatūra', 'max'), ('žemiausia_temperatūra', 'min')],
+    'vejo_greitis': [('didžiausias_vėjo_greitis', 'max')],
+    'slegimasJuros': [('aukščiausias_slėgimas', 'max'), ('žemiausias_slėgimas', 'min')],
+}
+
+
+def local_hours(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Vietinė valanda (0-23) kiekvienam indekso įrašui
+
+    Zona nuimama vieną kartą, o valanda gaunama iš datetime64[h] - pigiau nei
+    DatetimeIndex.hour laiko juostos indeksui.
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[h]').astype(np.int64) % 24
+
+
+class RunningStats:
+    """
+    Vieno stulpelio srautinė statistika: kiekis, vidurkis, dispersija, min/max
+    ir jų indekso žymės (argmin/argmax)
+
+    Dalys sujungiamos Chan et al. lygiagrečia Welford formule, todėl rezultatas
+    nepriklauso nuo dalių dydžio, o objektus iš skirtingų procesų galima sujungti
+    merge() metodu. NaN reikšmės praleidžiamos, kaip pandas.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.argmin = None
+        self.argmax = None
+
+    def update(self, values, index: Optional[pd.Index] = None) -> 'RunningStats':
+        """
+        Prideda vieną duomenų dalį
+
+        Args:
+            values (array-like): Stulpelio reikšmės
+            index (pd.Index, optional): Reikšmių žymės argmin/argmax (numatytosios - pozicijos)
+
+        Returns:
+            RunningStats: self
+        """
+        values = np.asarray(values, dtype=np.float64)
+        # Be indekso argmin/argmax - pozicija nuo pirmos eilutės, ne nuo dalies pradžios
+        offset = self.rows
+        self.rows += len(values)
+        valid = ~np.isnan(values)
+        count = int(valid.sum())
+        if count == 0:
+            return self
+
+        batch = values if count == len(values) else values[valid]
+        batch_mean = batch.mean()
+        batch_m2 = float(np.square(batch - batch_mean).sum())
+
+        # Pirmas pasikartojimas laimi, kaip idxmax/idxmin: keičiama tik griežtai geresne reikšme
+        if count == len(values):
+            max_pos, min_pos = int(values.argmax()), int(values.argmin())
+        else:
+            max_pos, min_pos = int(np.nanargmax(values)), int(np.nanargmin(values))
+        if values[max_pos] > self.max:
+            self.max = float(values[max_pos])
+            self.argmax = index[max_pos] if index is not None else offset + max_pos
+        if values[min_pos] < self.min:
+            self.min = float(values[min_pos])
+            self.argmin = index[min_pos] if index is not None else offset + min_pos
+
+        self._combine(count, float(batch_mean), batch_m2)
+        return self
+
+    def _combine(self, count: int, mean: float, m2: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Sujungia kitą (vėlesnių duomenų) statistiką į šią
+
+        Args:
+            other (RunningStats): Kitos duomenų dalies statistika
+
+        Returns:
+            RunningStats: self
+        """
+        self.rows += other.rows
+        if other.count == 0:
+            return self
+        if other.max > self.max:
+            self.max, self.argmax = other.max, other.argmax
+        if other.min < self.min:
+            self.min, self.argmin = other.min, other.argmin
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """
+        Imties dispersija (ddof=1, kaip pandas)
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def result_mean(self) -> float:
+        """
+        Vidurkis arba NaN, jei validžių reikšmių nėra (kaip pd.Series.mean)
+        """
+        return self.mean if self.count else math.nan
+
+
+class StreamingAnalysis:
+    """
+    Metiniai vidurkiai, dienos/nakties temperatūra, ekstremumai ir savaitgalių
+    lietus per vieną praėjimą per duomenų dalis
+
+    Rezultatai sutampa su WeatherAnalyzer calculate_yearly_averages(),
+    analyze_day_night_temperature(), find_extremes() ir
+    analyze_weekend_rain_forecast() žodynais. Dalys turi būti chronologinės
+    tvarkos (kaip surūšiuotas DataFrame), kad ekstremumų datos sutaptų lygybės atvejais.
+    """
+
+    def __init__(self, day_start: int = 8, day_end: int = 20,
+                 window: timedelta = timedelta(days=365),
+                 extreme_columns: Optional[Iterable[str]] = None):
+        """
+        Inicializuoja StreamingAnalysis objektą
+
+        Args:
+            day_start (int): Dienos pradžios valanda (imtinai)
+            day_end (int): Dienos pabaigos valanda (neimtinai; jei mažesnė - per vidurnaktį)
+            window (timedelta): Metinių vidurkių laikotarpis nuo paskutinio įrašo
+            extreme_columns (Iterable[str], optional): Stulpeliai ekstremumams
+                (pvz. bendri istorinių ir prognozės stulpeliai; numatytieji - visi)
+        """
+        self.day_start = day_start
+        self.day_end = day_end
+        self.window = window
+        self.extreme_columns = (set(EXTREME_KEYS) if extreme_columns is None
+                                else set(extreme_columns) & set(EXTREME_KEYS))
+
+        self.historical_rows = 0
+        self.day = RunningStats()
+        self.night = RunningStats()
+        self.has_temperature = False
+        self.extremes_stats: Dict[str, RunningStats] = {}
+
+        # Prognozės krituliai savaitgalių suvestinei: (vietovės, vietinės datos, reikšmės)
+        self.forecast_rows = 0
+        self._rain: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._rain_missing = False
+        self._multi_place = False
+
+        # Metinių vidurkių uodega: tik eilutės, kurios dar gali patekti į langą
+        self._yearly_columns: List[str] = []
+        self._tail: List[Tuple[np.ndarray, Dict[str, np.ndarray]]] = []
+        self._max_time: Optional[int] = None
+
+    def update(self, chunk: pd.DataFrame, historical: bool = True,
+               extremes: bool = True) -> 'StreamingAnalysis':
+        """
+        Apdoroja vieną duomenų dalį
+
+        Args:
+            chunk (pd.DataFrame): Dalis su DatetimeIndex ir lietuviškais stulpeliais
+            historical (bool): True - istoriniai duomenys (metiniai vidurkiai,
+                dienos/naktis, ekstremumai); False - prognozė (ekstremumai, kaip
+                combined_data, ir savaitgalių lietus)
+            extremes (bool): Ar dalis įtraukiama į ekstremumus
+
+        Returns:
+            StreamingAnalysis: self
+        """
+        if chunk is None or chunk.empty:
+            return self
+
+        if extremes:
+            for column in EXTREME_KEYS:
+                if column in self.extreme_columns and column in chunk.columns:
+                    self.extremes_stats.setdefault(column, RunningStats()).update(
+                        chunk[column].to_numpy(dtype=np.float64), chunk.index)
+
+        if historical:
+            self.historical_rows += len(chunk)
+            self._update_day_night(chunk)
+            self._update_yearly(chunk)
+        else:
+            self.forecast_rows += len(chunk)
+            self._update_rain(chunk)
+        return self
+
+    def _update_day_night(self, chunk: pd.DataFrame):
+        if 'temperatura' not in chunk.columns:
+            return
+        self.has_temperature = True
+        hours = local_hours(chunk.index)
+        if self.day_start < self.day_end:
+            day_mask = (hours >= self.day_start) & (hours < self.day_end)
+        else:
+            day_mask = (hours >= self.day_start) | (hours < self.day_end)
+        temperature = chunk['temperatura'].to_numpy(dtype=np.float64)
+        self.day.update(temperature[day_mask])
+        self.night.update(temperature[~day_mask])
+
+    def _update_yearly(self, chunk: pd.DataFrame):
+        for column in YEARLY_AVERAGE_KEYS:
+            if column in chunk.columns and column not in self._yearly_columns:
+                self._yearly_columns.append(column)
+
+        times = chunk.index.asi8
+        chunk_max = int(times.max())
+        if self._max_time is None or chunk_max > self._max_time:
+            self._max_time = chunk_max
+
+        threshold = self._max_time - self._window_ns()
+        keep = times >= threshold
+        if keep.any():
+            self._tail.append((times[keep], {
+                column: chunk[column].to_numpy(dtype=np.float64)[keep]
+                for column in YEARLY_AVERAGE_KEYS if column in chunk.columns
+            }))
+
+        # Galutinis maksimumas ne mažesnis nei dabartinis, todėl senesnės eilutės nebereikalingos
+        pruned = []
+        for piece_times, piece_values in self._tail:
+            if piece_times.min() >= threshold:
+                pruned.append((piece_times, piece_values))
+                continue
+            mask = piece_times >= threshold
+            if mask.any():
+                pruned.append((piece_times[mask],
+                               {column: values[mask] for column, values in piece_values.items()}))
+        self._tail = pruned
+
+    def _update_rain(self, chunk: pd.DataFrame):
+        if PRECIPITATION_COLUMN not in chunk.columns:
+            self._rain_missing = True
+            return
+        self._multi_place = self._multi_place or isinstance(chunk.index, pd.MultiIndex)
+        places, times = split_place_index(chunk.index)
+        self._rain.append((places.astype(str).astype(object), local_days(times),
+                           chunk[PRECIPITATION_COLUMN].to_numpy(dtype=np.float64)))
+
+    def _window_ns(self) -> int:
+        return int(self.window.total_seconds() * 1_000_000_000)
+
+    def yearly_averages(self) -> Dict[str, float]:
+        """
+        Paskutinių 365 dienų vidurkiai (žr. WeatherAnalyzer.calculate_yearly_averages)
+        """
+        if self.historical_rows == 0 or not self._tail:
+            return {}
+
+        stats = {column: RunningStats() for column in self._yearly_columns}
+        for _, piece_values in self._tail:
+            for column, values in piece_values.items():
+                stats[column].update(values)
+
+        return {YEARLY_AVERAGE_KEYS[column]: round(stats[column].result_mean(), 2)
+                for column in YEARLY_AVERAGE_KEYS if column in stats}
+
+    def day_night_temperature(self) -> Dict[str, float]:
+        """
+        Dienos ir nakties temperatūros (žr. WeatherAnalyzer.analyze_day_night_temperature)
+        """
+        if self.historical_rows == 0 or not self.has_temperature:
+            return {}
+
+        results = {}
+        for label, stats in (('dienos', self.day), ('nakties', self.night)):
+            if stats.rows == 0:
+                continue
+            results[f'vidutinė_{label}_temperatūra'] = round(stats.result_mean(), 2)
+            results[f'maksimali_{label}_temperatūra'] = round(
+                stats.max if stats.count else math.nan, 2)
+            results[f'minimali_{label}_temperatūra'] = round(
+                stats.min if stats.count else math.nan, 2)
+
+        if 'vidutinė_dienos_temperatūra' in results and 'vidutinė_nakties_temperatūra' in results:
+            temp_diff = results['vidutinė_dienos_temperatūra'] - results['vidutinė_nakties_temperatūra']
+            results['dienos_nakties_skirtumas'] = round(temp_diff, 2)
+        return results
+
+    def extremes(self) -> Dict[str, Any]:
+        """
+        Ekstremumai su datomis (žr. WeatherAnalyzer.find_extremes)
+        """
+        results = {}
+        for column, keys in EXTREME_KEYS.items():
+            stats = self.extremes_stats.get(column)
+            if stats is None or stats.count == 0:
+                continue
+            for key, kind in keys:
+                value, label = ((stats.max, stats.argmax) if kind == 'max'
+                                else (stats.min, stats.argmin))
+                results[key] = {'reikšmė': round(value, 2), 'data': str(label)}
+        return results
+
+    def weekend_rain(self) -> Dict[str, Any]:
+        """
+        Prognozės savaitgalių lietus (žr. WeatherAnalyzer.analyze_weekend_rain_forecast)
+        """
+        if self.forecast_rows == 0 or self._rain_missing:
+            return {}
+        places, days, values = (np.concatenate(parts) for parts in zip(*self._rain))
+        reports = weekend_rain_reports(places, days, values)
+        if not reports:
+            return {'savaitgalių_skaičius': 0}
+        if self._multi_place:
+            return reports
+        return next(iter(reports.values()))
+
+
+def analyze_chunks(chunks: Iterable[pd.DataFrame],
+                   forecast_chunks: Iterable[pd.DataFrame] = (),
+                   **kwargs) -> Dict[str, Any]:
+    """
+    Apskaičiuoja metinius vidurkius, dienos/nakties analizę ir ekstremumus iš dalių
+
+    Args:
+        chunks (Iterable[DataFrame]): Istorinių duomenų dalys chronologine tvarka
+        forecast_chunks (Iterable[DataFrame]): Prognozės dalys (tik ekstremumams)
+        **kwargs: StreamingAnalysis parametrai
+
+    Returns:
+        Dict: metiniai_vidurkiai, dienos_nakties_analizė, ekstremaliuosius_rodikliai
+    """
+    engine = StreamingAnalysis(**kwargs)
+    for chunk in chunks:
+        engine.update(chunk)
+    for chunk in forecast_chunks:
+        engine.update(chunk, historical=False)
+    return {
+        'metiniai_vidurkiai': engine.yearly_averages(),
+        'dienos_nakties_analizė': engine.day_night_temperature(),
+        'ekstremaliuosius_rodikliai': engine.extremes(),
+    }
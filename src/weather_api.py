@@ -6,12 +6,30 @@ import requests
 import pandas as pd
 import pytz
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor, Future
+import asyncio
+import functools
 import logging
+import threading
 import time
 
-# Konfigūruojame logging sistemą
-logging.basicConfig(level=logging.INFO)
+try:
+    from .response_cache import ResponseCache, CacheEntry
+    from .place_catalog import PlaceCatalog
+    from .forecast_parser import parse_forecast_timestamps, apply_compact_schema
+    from .http_client import HttpClient, get_shared_client
+    from .observation_store import ObservationStore, ObservationSync, PLACE_STATIONS
+    from .weekend_rain import weekend_rain_table, weekend_rain_summary, iso_weeks
+except ImportError:
+    from response_cache import ResponseCache, CacheEntry
+    from place_catalog import PlaceCatalog
+    from forecast_parser import parse_forecast_timestamps, apply_compact_schema
+    from http_client import HttpClient, get_shared_client
+    from observation_store import ObservationStore, ObservationSync, PLACE_STATIONS
+    from weekend_rain import weekend_rain_table, weekend_rain_summary, iso_weeks
+
+# Logging konfigūruoja programa (main.py arba CLI), ne importuojamas modulis
 logger = logging.getLogger(__name__)
 
 
@@ -20,19 +38,65 @@ class WeatherAPI:
     Klasė skirta darbui su Lietuvos hidrometeorologijos tarnybos API
     """
     
-    def __init__(self, location_code: str = "vilnius"):
+    def __init__(self, location_code: str = "vilnius",
+                 cache: Optional[ResponseCache] = None,
+                 forecast_ttl: float = 60,
+                 catalog: Optional[PlaceCatalog] = None,
+                 client: Optional[HttpClient] = None,
+                 base_url: str = "https://api.meteo.lt/v1",
+                 observation_store: Optional[ObservationStore] = None,
+                 station_code: Optional[str] = None,
+                 stale_ttl: float = 0,
+                 serve_stale_on_error: bool = True,
+                 warm_cache=None,
+                 warm_max_age: float = 3 * 3600):
         """
         Inicializuoja WeatherAPI objektą
         
         Args:
-            location_code (str): Vietovės kodas (vilnius, kaunas, klaipeda, siauliai, panevezys)
+            location_code (str): Vietovės kodas (vilnius, kaunas, klaipeda, siauliai,
+                panevezys arba bet kuri vietovė iš katalogo)
+            cache (ResponseCache, optional): API atsakymų podėlis diske
+            forecast_ttl (float): Kiek sekundžių atmintyje laikomas prognozės atsakymas
+            catalog (PlaceCatalog, optional): Vietovių katalogas (numatytasis - data/places.csv)
+            client (HttpClient, optional): HTTP klientas (numatytasis - bendras visam procesui)
+            base_url (str): API adresas (pvz. vietinio simuliatoriaus)
+            observation_store (ObservationStore, optional): Istorinių stebėjimų saugykla
+                (numatytoji - data/observations.sqlite, sukuriama pirmo kvietimo metu)
+            station_code (str, optional): Stebėjimų stotis (numatytoji - pagal miestą)
+            stale_ttl (float): Kiek sekundžių po galiojimo pabaigos podėlio įrašas
+                grąžinamas iš karto, o atnaujinamas fone (0 - išjungta)
+            serve_stale_on_error (bool): Ar grąžinti paskutinį podėlio atsakymą,
+                kai API nepasiekiamas ar grandinė atvira
+            warm_cache (ForecastScheduler, optional): Iš anksto išanalizuotos prognozės;
+                jei vietovė jame yra, prognozė grąžinama be tinklo užklausos
+            warm_max_age (float): Seniausias planuoklio leidimas sekundėmis (pagal
+                forecastCreationTimeUtc); senesnis leidimas ignoruojamas ir prognozė
+                gaunama įprastai (per podėlį ar API)
         """
         self.location_code = location_code
-        self.base_url = "https://api.meteo.lt/v1"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Weather-Analysis-System/1.0'
-        })
+        self.base_url = base_url.rstrip('/')
+        self.cache = cache
+        self.forecast_ttl = forecast_ttl
+        self.stale_ttl = stale_ttl
+        self.serve_stale_on_error = serve_stale_on_error
+        self.warm_cache = warm_cache
+        self.warm_max_age = warm_max_age
+        self.observation_store = observation_store
+        self.station_code = station_code or PLACE_STATIONS.get(location_code)
+        
+        # Prognozės atsakymo atmintis ir vykdoma užklausa (bendra visoms gijoms)
+        self._forecast_lock = threading.Lock()
+        self._forecast_memo: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._forecast_inflight: Optional[Future] = None
+        
+        # Fone atnaujinami podėlio raktai (stale-while-revalidate)
+        self._revalidate_lock = threading.Lock()
+        self._revalidating: Set[str] = set()
+        
+        # Bendras jungčių telkinys ir užklausų ribotuvas visiems objektams
+        self.client = client if client is not None else get_shared_client()
+        self.session = self.client.session
         
         # Lietuvos laiko zona
         self.lithuania_tz = pytz.timezone('Europe/Vilnius')
@@ -46,14 +110,70 @@ class WeatherAPI:
             'panevezys': 'panevezys'
         }
         
-        if location_code not in self.city_codes:
+        self.catalog = catalog if catalog is not None else PlaceCatalog.default()
+        
+        if not self.is_known_place(location_code):
             raise ValueError(f"Nepalaikomas miesto kodas: {location_code}")
             
+    def is_known_place(self, code: str) -> bool:
+        """
+        Tikrina, ar vietovės kodas palaikomas (pagrindiniai miestai arba katalogas)
+        
+        Args:
+            code (str): Vietovės kodas
+            
+        Returns:
+            bool: True, jei vietovė žinoma
+        """
+        return code in self.city_codes or code in self.catalog
+        
+    def nearest_places(self, lat, lon, k: int = 1):
+        """
+        Randa artimiausias katalogo vietoves pagal koordinates
+        
+        Args:
+            lat (float | array-like): Platuma (laipsniais)
+            lon (float | array-like): Ilguma (laipsniais)
+            k (int): Vietovių skaičius kiekvienam taškui
+            
+        Returns:
+            List[str]: Vietovių kodai nuo artimiausios vienam taškui, arba
+            np.ndarray (n, k) su kodais taškų masyvui
+        """
+        codes, _ = self.catalog.nearest(lat, lon, k)
+        if codes.ndim == 1:
+            return list(codes)
+        return codes
+        
+    @classmethod
+    def for_coordinates(cls, lat: float, lon: float,
+                        catalog: Optional[PlaceCatalog] = None, **kwargs) -> 'WeatherAPI':
+        """
+        Sukuria WeatherAPI objektą artimiausiai koordinatėms vietovei
+        
+        Args:
+            lat (float): Platuma (laipsniais)
+            lon (float): Ilguma (laipsniais)
+            catalog (PlaceCatalog, optional): Vietovių katalogas
+            **kwargs: Kiti konstruktoriaus parametrai
+            
+        Returns:
+            WeatherAPI: API objektas artimiausiai vietovei
+        """
+        catalog = catalog if catalog is not None else PlaceCatalog.default()
+        codes, _ = catalog.nearest(lat, lon, 1)
+        return cls(codes[0], catalog=catalog, **kwargs)
+        
     def _make_request(self, endpoint: str, params: Optional[Dict] = None, 
                      max_retries: int = 3) -> Optional[Dict[str, Any]]:
         """
         Atlieka HTTP užklausą su retry logika
         
+        Jei nustatytas podėlis, šviežias atsakymas grąžinamas be tinklo užklausos,
+        o pasenęs atnaujinamas sąlygine užklausa (ETag/Last-Modified). Įrašas,
+        pasenęs ne daugiau nei stale_ttl sekundžių, grąžinamas iš karto ir
+        atnaujinamas fone. Jei API nepasiekiamas, grąžinamas paskutinis geras atsakymas.
+        
         Args:
             endpoint (str): API endpoint
             params (Dict, optional): Užklausos parametrai
@@ -62,97 +182,530 @@ class WeatherAPI:
         Returns:
             Dict: API atsakymas arba None klaidos atveju
         """
-        url = f"{self.base_url}/{endpoint}"
+        cached = self._cache_lookup(endpoint, params)
+        if cached is not None and cached.fresh:
+            logger.debug(f"Atsakymas iš podėlio: {endpoint}")
+            return cached.data
+            
+        if self._within_stale_window(cached):
+            self._revalidate_in_background(endpoint, params, cached, max_retries)
+            return cached.data
+            
+        data = self._fetch_with_retries(endpoint, params, cached, max_retries)
+        return self._stale_fallback(endpoint, data, cached)
         
+    def revalidate(self, endpoint: str, params: Optional[Dict] = None,
+                   max_retries: int = 3) -> Optional[Dict[str, Any]]:
+        """
+        Siunčia užklausą net jei podėlio įrašas šviežias
+        
+        Jei podėlyje yra įrašas su ETag/Last-Modified, užklausa sąlyginė (304 atveju
+        grąžinamas podėlio atsakymas). Taikomi tie patys bandymai ir grandinės
+        pertraukiklis kaip _make_request, bet pasenęs atsakymas klaidos atveju negrąžinamas.
+        
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+            max_retries (int): Maksimalus bandymų skaičius
+            
+        Returns:
+            Dict: API atsakymas arba None klaidos atveju
+        """
+        cached = self._cache_lookup(endpoint, params)
+        return self._fetch_with_retries(endpoint, params, cached, max_retries)
+        
+    def _fetch_with_retries(self, endpoint: str, params: Optional[Dict],
+                            cached: Optional[CacheEntry],
+                            max_retries: int = 3) -> Optional[Dict[str, Any]]:
+        """
+        Kartoja _fetch su backoff, kol pavyksta arba atsidaro grandinė
+        
+        Returns:
+            Dict: API atsakymas arba None, jei visi bandymai nepavyko
+        """
         for attempt in range(max_retries):
+            if not self._circuit_allows(endpoint):
+                return None
             try:
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"Sėkminga užklausa į {endpoint}")
-                return data
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Bandymas {attempt + 1} nepavyko: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Visi bandymai nepavyko endpoint: {endpoint}")
+                data = self._fetch(endpoint, params, cached)
+            except BaseException as e:
+                delay = self._after_attempt(endpoint, attempt, max_retries, e)
+                if delay is None:
                     return None
+                time.sleep(delay)
+                continue
+            self._after_attempt(endpoint, attempt, max_retries)
+            return data
+        return None
+        
+    def _after_attempt(self, endpoint: str, attempt: int, max_retries: int,
+                       error: Optional[BaseException] = None) -> Optional[float]:
+        """
+        Bendra sinchroninio ir asinchroninio kelio bandymo rezultato logika
+        
+        Perduoda rezultatą grandinės pertraukikliui ir apskaičiuoja pauzę prieš
+        kitą bandymą. Netikėta klaida (ne RequestException) atlaisvina half-open
+        bandomąjį kvietimą ir perduodama kvietėjui.
+        
+        Args:
+            endpoint (str): API endpoint
+            attempt (int): Bandymo numeris (nuo 0)
+            max_retries (int): Maksimalus bandymų skaičius
+            error (BaseException, optional): Bandymo klaida (None - sėkmė)
+            
+        Returns:
+            float: Pauzė sekundėmis prieš kitą bandymą arba None, jei daugiau nebandoma
+        """
+        if error is None:
+            self._record_outcome(endpoint)
+            logger.info(f"Sėkminga užklausa į {endpoint}")
+            return None
+        if not isinstance(error, requests.exceptions.RequestException):
+            self._release_probe(endpoint)
+            raise error
+            
+        self._record_outcome(endpoint, error)
+        logger.warning(f"Bandymas {attempt + 1} nepavyko ({endpoint}): {error}")
+        if attempt < max_retries - 1:
+            # Retry-After arba eksponentinis backoff su jitter
+            return self.client.backoff_delay(attempt, error.response)
+        logger.error(f"Visi bandymai nepavyko endpoint: {endpoint}")
+        return None
+        
+    def _circuit_allows(self, endpoint: str) -> bool:
+        """
+        Tikrina bendrą grandinės pertraukiklį (jei jis įjungtas)
+        """
+        breaker = self.client.breaker
+        if breaker is None or breaker.allow(endpoint):
+            return True
+        logger.warning(f"Grandinė atvira - užklausa nesiunčiama: {endpoint}")
+        return False
+        
+    def _release_probe(self, endpoint: str):
+        """
+        Atlaisvina half-open bandomąjį kvietimą, jei jis baigėsi netikėta klaida
+        """
+        breaker = self.client.breaker
+        if breaker is not None:
+            breaker.release(endpoint)
+            
+    def _record_outcome(self, endpoint: str,
+                        error: Optional[requests.exceptions.RequestException] = None):
+        """
+        Perduoda užklausos rezultatą grandinės pertraukikliui
+        
+        Kliento klaidos (4xx) rodo, kad serveris veikia, todėl grandinę uždaro.
+        """
+        breaker = self.client.breaker
+        if breaker is None:
+            return
+        if error is not None and breaker.is_failure(error):
+            breaker.record_failure(endpoint)
+        else:
+            breaker.record_success(endpoint)
+            
+    def _within_stale_window(self, cached: Optional[CacheEntry]) -> bool:
+        """
+        Ar pasenusį įrašą galima grąžinti iš karto (ne daugiau nei stale_ttl po galiojimo)
+        """
+        if cached is None or self.stale_ttl <= 0:
+            return False
+        return self.cache.clock() - cached.expires_at <= self.stale_ttl
+        
+    def _stale_fallback(self, endpoint: str, data: Optional[Dict[str, Any]],
+                        cached: Optional[CacheEntry]) -> Optional[Dict[str, Any]]:
+        """
+        Nepavykus užklausai grąžina paskutinį gerą atsakymą iš podėlio
+        """
+        if data is None and cached is not None and self.serve_stale_on_error:
+            age = self.cache.clock() - cached.stored_at
+            logger.warning(f"API nepasiekiamas - grąžinamas {age:.0f}s senumo atsakymas: {endpoint}")
+            return cached.data
+        return data
+        
+    def _revalidate_in_background(self, endpoint: str, params: Optional[Dict],
+                                  cached: CacheEntry, max_retries: int = 3):
+        """
+        Atnaujina pasenusį podėlio įrašą foninėje gijoje
+        
+        Tam pačiam raktui vienu metu vykdomas tik vienas atnaujinimas.
+        """
+        key = ResponseCache.make_key(endpoint, params)
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            
+        def revalidate():
+            try:
+                self._fetch_with_retries(endpoint, params, cached, max_retries)
+            except Exception as e:
+                logger.error(f"Klaida atnaujinant {endpoint} fone: {e}")
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
                     
-    def get_historical_data(self, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        logger.debug(f"Grąžinamas pasenęs atsakymas, atnaujinama fone: {endpoint}")
+        threading.Thread(target=revalidate, name=f"revalidate-{key}", daemon=True).start()
+        
+    def _cache_lookup(self, endpoint: str, params: Optional[Dict]) -> Optional[CacheEntry]:
+        """
+        Ieško atsakymo podėlyje (jei jis nustatytas)
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(endpoint, params)
+        
+    def _fetch(self, endpoint: str, params: Optional[Dict],
+               cached: Optional[CacheEntry] = None) -> Dict[str, Any]:
         """
-        Gauna istorinius oro duomenis - šiuo metu API nepalaiko istorinių duomenų
-        Grąžina None su informatyvia žinute
+        Vienas HTTP užklausos bandymas su podėlio atnaujinimu
+        
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+            cached (CacheEntry, optional): Pasenęs podėlio įrašas sąlyginei užklausai
+            
+        Returns:
+            Dict: API atsakymas
+            
+        Raises:
+            requests.exceptions.RequestException: Kai užklausa nepavyksta
+        """
+        url = f"{self.base_url}/{endpoint}"
+        headers = cached.validators() if cached is not None else None
+        
+        response = self.client.get(url, params=params, headers=headers or None, timeout=30)
+        
+        if response.status_code == 304 and cached is not None:
+            self.cache.revalidated(endpoint, params)
+            return cached.data
+            
+        response.raise_for_status()
+        data = response.json()
+        
+        if self.cache is not None:
+            self.cache.set(endpoint, params, data,
+                           etag=response.headers.get('ETag'),
+                           last_modified=response.headers.get('Last-Modified'))
+        return data
+        
+    def get_historical_data(self, start_date: str, end_date: str,
+                            compact: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Gauna istorinius stebėjimų duomenis iš vietinės saugyklos
+        
+        Trūkstamos dienos pirmiausia parsiunčiamos iš /stations/{code}/observations/{date}
+        ir išsaugomos, todėl pakartotinis kvietimas siunčia tik naujas dienas.
         
         Args:
             start_date (str): Pradžios data (YYYY-MM-DD formatu)
-            end_date (str): Pabaigos data (YYYY-MM-DD formatu)
+            end_date (str): Pabaigos data (YYYY-MM-DD formatu, imtinai)
+            compact (bool): Ar naudoti kompaktiškus tipus (float32, uint8/uint16, category)
             
         Returns:
-            pd.DataFrame: None - istoriniai duomenys neprieinami per API
+            pd.DataFrame: Stebėjimų duomenys arba None klaidos atveju
         """
-        logger.warning("METEO.LT API APRIBOJIMAS: Istoriniai duomenys neprieinami")
-        logger.info("API palaiko tik prognozes (forecasts). Naudokite get_forecast_data()")
-        logger.info(f"Užklausa istoriniams duomenims {start_date} - {end_date} praleidžiama")
-        return None
+        try:
+            start = datetime.strptime(start_date, '%Y-%m-%d').date()
+            end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            logger.error(f"Netinkamas datos formatas: {start_date} - {end_date}")
+            return None
+            
+        if start > end:
+            logger.error(f"Pradžios data vėlesnė nei pabaigos: {start_date} > {end_date}")
+            return None
+            
+        if not self.station_code:
+            logger.error(f"Nežinoma stebėjimų stotis vietovei {self.location_code}")
+            return None
             
-    def get_forecast_data(self, days: int = 7) -> Optional[pd.DataFrame]:
+        try:
+            if self.observation_store is None:
+                self.observation_store = ObservationStore()
+            ObservationSync(self, self.observation_store,
+                            tz=self.lithuania_tz).sync(self.station_code, start, end)
+            
+            df = self.observation_store.load(
+                self.station_code, start, end + timedelta(days=1), tz=self.lithuania_tz
+            )
+            if df.empty:
+                logger.warning(f"Stebėjimų duomenų laikotarpiui {start_date} - {end_date} nėra")
+                return None
+                
+            logger.info(f"Gauti {len(df)} stebėjimų įrašai ({self.station_code})")
+            return apply_compact_schema(df) if compact else df
+            
+        except Exception as e:
+            logger.error(f"Klaida gaunant istorinius duomenis: {e}")
+            return None
+            
+    def get_forecast_data(self, days: int = 7, compact: bool = False) -> Optional[pd.DataFrame]:
         """
         Gauna oro prognozės duomenis
         
         Args:
             days (int): Dienų skaičius prognozei
+            compact (bool): Ar naudoti kompaktiškus tipus (float32, uint8/uint16, category)
             
         Returns:
             pd.DataFrame: Prognozės duomenys arba None klaidos atveju
         """
         try:
-            endpoint = f"places/{self.location_code}/forecasts/long-term"
-            data = self._make_request(endpoint)
-            
-            if not data or 'forecastTimestamps' not in data:
-                logger.error("Nepavyko gauti prognozės duomenų")
-                return None
+            warm = self._warm_forecast()
+            if warm is not None:
+                return self._slice_warm_forecast(warm, days, compact)
                 
-            # Konvertuojame į DataFrame
-            forecasts = data['forecastTimestamps']
-            df = pd.DataFrame(forecasts)
+            data = self._get_forecast_payload()
+            return self._parse_forecast(data, days, compact)
             
-            if df.empty:
-                logger.warning("Gauti tušti prognozės duomenys")
-                return df
+        except Exception as e:
+            logger.error(f"Klaida gaunant prognozės duomenis: {e}")
+            return None
+            
+    def _get_forecast_payload(self) -> Optional[Dict[str, Any]]:
+        """
+        Grąžina long-term prognozės atsakymą iš atminties arba jį parsiunčia
+        
+        Atsakymas laikomas forecast_ttl sekundžių. Jei kelios gijos jo prašo vienu
+        metu, užklausą vykdo tik pirmoji, o kitos laukia to paties rezultato.
+        
+        Returns:
+            Dict: API atsakymas arba None klaidos atveju
+        """
+        warm = self._warm_forecast()
+        if warm is not None:
+            return warm.payload
+            
+        with self._forecast_lock:
+            memo = self._forecast_memo
+            if memo is not None and time.monotonic() - memo[0] < self.forecast_ttl:
+                return memo[1]
                 
-            # Apdorojame laiko stulpelį
-            df['forecastTimeUtc'] = pd.to_datetime(df['forecastTimeUtc'], utc=True)
-            df['forecastTimeLocal'] = df['forecastTimeUtc'].dt.tz_convert(self.lithuania_tz)
-            
-            # Filtruojame pagal dienų skaičių
-            cutoff_date = datetime.now(self.lithuania_tz) + timedelta(days=days)
-            df = df[df['forecastTimeLocal'] <= cutoff_date]
-            
-            # Nustatome indeksą
-            df.set_index('forecastTimeLocal', inplace=True)
-            
-            # Pervardiname stulpelius lietuviškai
-            column_mapping = {
-                'airTemperature': 'temperatura',
-                'relativeHumidity': 'dregme',
-                'windSpeed': 'vejo_greitis',
-                'seaLevelPressure': 'slegimasJuros',
-                'totalPrecipitation': 'krituliai'
-            }
+            inflight = self._forecast_inflight
+            if inflight is None:
+                inflight = self._forecast_inflight = Future()
+                leader = True
+            else:
+                leader = False
+                
+        if not leader:
+            return inflight.result()
             
-            df = df.rename(columns=column_mapping)
+        try:
+            endpoint = f"places/{self.location_code}/forecasts/long-term"
+            data = self._make_request(endpoint)
+        except BaseException as e:
+            with self._forecast_lock:
+                self._forecast_inflight = None
+            inflight.set_exception(e)
+            raise
+            
+        with self._forecast_lock:
+            # Nesėkmingų atsakymų neįsimename - kitas kvietimas bandys iš naujo
+            if data and 'forecastTimestamps' in data:
+                self._forecast_memo = (time.monotonic(), data)
+            self._forecast_inflight = None
+        inflight.set_result(data)
+        return data
+        
+    def _warm_forecast(self):
+        """
+        Grąžina planuoklio paruoštą šios vietovės leidimą (jei jis nustatytas, turi
+        vietovę ir leidimas ne senesnis nei warm_max_age)
+        """
+        if self.warm_cache is None:
+            return None
+        warm = self.warm_cache.get(self.location_code)
+        if warm is None:
+            return None
+        clock = getattr(self.warm_cache, 'clock', time.time)
+        age = warm.age(clock())
+        if age > self.warm_max_age:
+            logger.debug(f"Planuoklio leidimas {warm.place} pasenęs ({age:.0f} s), "
+                         f"prognozė gaunama įprastai")
+            return None
+        return warm
+        
+    def _slice_warm_forecast(self, warm, days: int = 7,
+                             compact: bool = False) -> pd.DataFrame:
+        """
+        Iš jau išanalizuoto leidimo atrenka days dienų prognozę be pakartotinės analizės
+        
+        Returns:
+            pd.DataFrame: Kopija, kurią kviečiantysis gali keisti
+        """
+        cutoff_date = datetime.now(self.lithuania_tz) + timedelta(days=days)
+        frame = warm.frame
+        df = frame.iloc[:frame.index.searchsorted(cutoff_date, side='right')].copy()
+        if compact:
+            df = apply_compact_schema(df)
+        df.attrs['place'] = warm.place
+        df.attrs['forecastCreationTimeUtc'] = warm.created
+        logger.debug(f"Prognozė iš planuoklio atminties: {warm.place} ({len(df)} įrašų)")
+        return df
+        
+    def clear_forecast_memo(self):
+        """
+        Pamiršta atmintyje laikomą prognozės atsakymą
+        """
+        with self._forecast_lock:
+            self._forecast_memo = None
             
-            logger.info(f"Gauti prognozės duomenys {days} dienoms: {len(df)} įrašų")
-            return df
+    def _parse_forecast(self, data: Optional[Dict[str, Any]], 
+                        days: int = 7, compact: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Paverčia long-term prognozės atsakymą į DataFrame
+        
+        Args:
+            data (Dict, optional): API atsakymas
+            days (int): Dienų skaičius prognozei
+            compact (bool): Ar taikyti kompaktišką tipų schemą
             
-        except Exception as e:
-            logger.error(f"Klaida gaunant prognozės duomenis: {e}")
+        Returns:
+            pd.DataFrame: Prognozės duomenys arba None, jei atsakymas netinkamas
+        """
+        if not data or 'forecastTimestamps' not in data:
+            logger.error("Nepavyko gauti prognozės duomenų")
             return None
             
+        forecasts = data['forecastTimestamps']
+        if not forecasts:
+            logger.warning("Gauti tušti prognozės duomenys")
+            return pd.DataFrame(forecasts)
+            
+        # Stulpelinis analizatorius: laikai, filtras pagal dienų skaičių,
+        # vietinio laiko indeksas ir lietuviški stulpelių pavadinimai
+        cutoff_date = datetime.now(self.lithuania_tz) + timedelta(days=days)
+        df = parse_forecast_timestamps(forecasts, self.lithuania_tz, cutoff_date, compact)
+        df.attrs['place'] = (data.get('place') or {}).get('code', self.location_code)
+        df.attrs['forecastCreationTimeUtc'] = data.get('forecastCreationTimeUtc')
+        
+        logger.info(f"Gauti prognozės duomenys {days} dienoms: {len(df)} įrašų")
+        return df
+        
+    async def _make_request_async(self, endpoint: str, params: Optional[Dict] = None,
+                                  max_retries: int = 3,
+                                  executor: Optional[ThreadPoolExecutor] = None
+                                  ) -> Optional[Dict[str, Any]]:
+        """
+        Asinchroninė _make_request versija - HTTP užklausa vykdoma gijų
+        telkinyje, o pauzės tarp bandymų neblokuoja įvykių ciklo
+        
+        Args:
+            endpoint (str): API endpoint
+            params (Dict, optional): Užklausos parametrai
+            max_retries (int): Maksimalus bandymų skaičius
+            executor (ThreadPoolExecutor, optional): Gijų telkinys užklausoms
+            
+        Returns:
+            Dict: API atsakymas arba None klaidos atveju
+        """
+        cached = self._cache_lookup(endpoint, params)
+        if cached is not None and cached.fresh:
+            return cached.data
+            
+        if self._within_stale_window(cached):
+            self._revalidate_in_background(endpoint, params, cached, max_retries)
+            return cached.data
+            
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(max_retries):
+            if not self._circuit_allows(endpoint):
+                break
+            try:
+                data = await loop.run_in_executor(
+                    executor, functools.partial(self._fetch, endpoint, params, cached)
+                )
+            except BaseException as e:
+                delay = self._after_attempt(endpoint, attempt, max_retries, e)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+                continue
+            self._after_attempt(endpoint, attempt, max_retries)
+            return data
+                    
+        return self._stale_fallback(endpoint, None, cached)
+                    
+    async def fetch_forecasts_async(self, places: Iterable[str], days: int = 7,
+                                    max_concurrency: int = 8, compact: bool = False
+                                    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Lygiagrečiai gauna kelių vietovių prognozes
+        
+        Visos užklausos vykdomos vienu metu (ne daugiau nei max_concurrency),
+        todėl bendra trukmė priklauso nuo lėčiausios užklausos, o ne nuo jų sumos.
+        
+        Args:
+            places (Iterable[str]): Vietovių kodai
+            days (int): Dienų skaičius prognozei
+            max_concurrency (int): Maksimalus vienu metu vykdomų užklausų skaičius
+            compact (bool): Ar naudoti kompaktiškus tipus
+            
+        Returns:
+            Dict: Vietovės kodas -> prognozės DataFrame (None, jei nepavyko)
+        """
+        places = list(dict.fromkeys(places))
+        for place in places:
+            if not self.is_known_place(place):
+                raise ValueError(f"Nepalaikomas miesto kodas: {place}")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency turi būti teigiamas")
+            
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            async def fetch_one(place: str) -> Optional[pd.DataFrame]:
+                async with semaphore:
+                    endpoint = f"places/{place}/forecasts/long-term"
+                    data = await self._make_request_async(endpoint, executor=executor)
+                try:
+                    return self._parse_forecast(data, days, compact)
+                except Exception as e:
+                    logger.error(f"Klaida apdorojant {place} prognozę: {e}")
+                    return None
+                    
+            frames = await asyncio.gather(*(fetch_one(place) for place in places))
+            
+        results = dict(zip(places, frames))
+        succeeded = sum(1 for df in frames if df is not None)
+        logger.info(f"Gautos prognozės {succeeded}/{len(places)} vietovėms")
+        return results
+        
+    def fetch_forecasts(self, places: Iterable[str], days: int = 7,
+                        max_concurrency: int = 8,
+                        compact: bool = False) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Sinchroninis fetch_forecasts_async apvalkalas
+        
+        Jei gijoje jau veikia įvykių ciklas (pvz. Jupyter), užklausos vykdomos
+        atskiroje gijoje su savo ciklu, o kvietėjas palaukia rezultato.
+        Asinchroniniame kode geriau naudoti await fetch_forecasts_async().
+        
+        Args:
+            places (Iterable[str]): Vietovių kodai
+            days (int): Dienų skaičius prognozei
+            max_concurrency (int): Maksimalus vienu metu vykdomų užklausų skaičius
+            compact (bool): Ar naudoti kompaktiškus tipus
+            
+        Returns:
+            Dict: Vietovės kodas -> prognozės DataFrame (None, jei nepavyko)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_forecasts_async(places, days, max_concurrency, compact))
+            
+        # asyncio.run() negali būti kviečiamas veikiančiame cikle
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(
+                asyncio.run, self.fetch_forecasts_async(places, days, max_concurrency, compact)
+            ).result()
+            
     def get_current_weather(self) -> Optional[Dict[str, Any]]:
         """
         Gauna dabartinius oro duomenis iš forecast endpoint (latest)
@@ -162,8 +715,7 @@ class WeatherAPI:
         """
         try:
             # Naudojame forecast endpoint kaip alternatives dabartiniams duomenims
-            endpoint = f"places/{self.location_code}/forecasts/long-term"
-            data = self._make_request(endpoint)
+            data = self._get_forecast_payload()
             
             if not data or 'forecastTimestamps' not in data:
                 logger.error("Nepavyko gauti dabartinių oro duomenų")
@@ -196,39 +748,75 @@ class WeatherAPI:
             
     def predict_weekend_rain(self) -> Optional[Dict[str, str]]:
         """
-        Prognozuoja savaitgalio lietaus tikimybę
+        Prognozuoja artimiausio savaitgalio lietų
+        
+        Kiekvienai dienai naudojama visų jos valandų kritulių suma (žr. get_weekend_rain()).
+        Savaitgalis - pirma ISO savaitė, kurioje prognozė apima ir šeštadienį, ir sekmadienį.
         
         Returns:
             Dict: Savaitgalio lietaus prognozė arba None klaidos atveju
         """
         try:
-            forecast_data = self.get_forecast_data(days=7)
-            if forecast_data is None or forecast_data.empty:
+            summary = self.get_weekend_rain(days=7)
+            if summary is None:
                 return None
+            if summary.empty:
+                return {"info": "Savaitgalio duomenų nerasta"}
                 
-            # Randame šeštadienio ir sekmadienio duomenis
-            weekend_data = {}
-            
-            for idx, row in forecast_data.iterrows():
-                day_name = idx.strftime('%A').lower()
-                if day_name in ['saturday', 'sunday']:
-                    lithuanian_day = 'šeštadienis' if day_name == 'saturday' else 'sekmadienis'
-                    
-                    precipitation = row.get('krituliai', 0)
-                    if precipitation > 0:
-                        weekend_data[lithuanian_day] = f"Tikėtinas lietus: {precipitation}mm"
-                    else:
-                        weekend_data[lithuanian_day] = "Sausas oras"
-                        
-            return weekend_data if weekend_data else {"info": "Savaitgalio duomenų nerasta"}
+            # Artimiausias savaitgalis - pirma ISO savaitė su šeštadieniu ir sekmadieniu
+            # (prognozė, prasidedanti sekmadienį, kitaip sujungtų jį su kito savaitgalio šeštadieniu)
+            iso_year, iso_week = iso_weeks(summary['data'].to_numpy().astype('datetime64[D]'))
+            weeks = pd.Series(iso_year * 100 + iso_week, index=summary.index)
+            complete = weeks[weeks.map(weeks.value_counts()) == 2]
+            nearest = summary[weeks == (complete.iloc[0] if not complete.empty else weeks.iloc[0])]
+            return {
+                day: (f"Tikėtinas lietus: {total}mm ({hours} val.)" if rainy else "Sausas oras")
+                for day, total, hours, rainy in zip(nearest['savaitės_diena'],
+                                                    nearest['krituliai_suma'],
+                                                    nearest['lietingos_valandos'],
+                                                    nearest['lietus'])
+            }
             
         except Exception as e:
             logger.error(f"Klaida prognozuojant savaitgalio lietų: {e}")
             return None
-                
-            logger.info("Gauti dabartiniai oro duomenys")
-            return data
             
-        except Exception as e:
-            logger.error(f"Klaida gaunant dabartinius oro duomenis: {e}")
-            return None
\ No newline at end of file
+    def get_weekend_rain(self, days: int = 7,
+                         rain_threshold: float = 0.0) -> Optional[pd.DataFrame]:
+        """
+        Savaitgalio dienų kritulių suvestinė šiai vietovei
+        
+        Args:
+            days (int): Dienų skaičius prognozei
+            rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+            
+        Returns:
+            pd.DataFrame: Po eilutę savaitgalio dienai (krituliai_suma, krituliai_max,
+                lietingos_valandos, valandos, lietus) arba None klaidos atveju
+        """
+        forecast_data = self.get_forecast_data(days=days)
+        if forecast_data is None or forecast_data.empty:
+            return None
+        return weekend_rain_summary(forecast_data, self.location_code, rain_threshold)
+        
+    def predict_weekend_rain_batch(self, places: Iterable[str], days: int = 7,
+                                   max_concurrency: int = 8,
+                                   rain_threshold: float = 0.0) -> pd.DataFrame:
+        """
+        Savaitgalio kritulių suvestinė daugeliui vietovių vienoje lentelėje
+        
+        Prognozės parsiunčiamos lygiagrečiai (fetch_forecasts), o visų vietovių
+        suvestinė skaičiuojama vienu vektorizuotu grupavimu.
+        
+        Args:
+            places (Iterable[str]): Vietovių kodai
+            days (int): Dienų skaičius prognozei
+            max_concurrency (int): Maksimalus vienu metu vykdomų užklausų skaičius
+            rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+            
+        Returns:
+            pd.DataFrame: Tvarkinga lentelė su 'vieta' stulpeliu; nepavykusios
+                vietovės praleidžiamos
+        """
+        frames = self.fetch_forecasts(places, days, max_concurrency)
+        return weekend_rain_table(frames, rain_threshold)
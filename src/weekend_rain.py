@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+Vektorizuota savaitgalio kritulių suvestinė vienai ar kelioms vietovėms
+
+Savaitės diena ir vietinė data skaičiuojamos tiesiai iš indekso masyvų
+(datetime64[D]), o dienų sumos, maksimumai ir lietingų valandų skaičiai -
+NumPy redukcijomis per grupių numerius, be iterrows() ir strftime().
+"""
+from typing import Any, Dict, Mapping, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PRECIPITATION_COLUMN = 'krituliai'
+
+# Kelių vietovių DataFrame indekso lygis su vietovės kodu
+PLACE_LEVEL = 'vieta'
+
+# Savaitės dienos numeris (pirmadienis=0) -> lietuviškas pavadinimas
+WEEKEND_DAYS = {5: 'šeštadienis', 6: 'sekmadienis'}
+
+WEEKEND_RAIN_COLUMNS = ['vieta', 'data', 'savaitės_diena', 'krituliai_suma',
+                        'krituliai_max', 'lietingos_valandos', 'valandos', 'lietus']
+
+
+def local_days(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Grąžina vietines indekso datas kaip datetime64[D] masyvą
+
+    Args:
+        index (pd.DatetimeIndex): Laiko indeksas (su zona arba be jos)
+
+    Returns:
+        np.ndarray: Vietinės datos
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]')
+
+
+def split_place_index(index: pd.Index, place: str = '') -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """
+    Išskiria vietovių kodus ir laiko indeksą
+
+    Args:
+        index (pd.Index): DatetimeIndex arba MultiIndex su PLACE_LEVEL ir laiko lygiais
+        place (str): Vietovės kodas, kai indekse nėra vietovės lygio
+
+    Returns:
+        Tuple[np.ndarray, DatetimeIndex]: Kiekvienos eilutės vietovė ir laikas
+    """
+    if isinstance(index, pd.MultiIndex):
+        places = index.get_level_values(PLACE_LEVEL).to_numpy(dtype=object)
+        for level in range(index.nlevels):
+            times = index.get_level_values(level)
+            if isinstance(times, pd.DatetimeIndex):
+                return places, times
+        raise ValueError("MultiIndex neturi laiko lygio")
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Reikalingas DatetimeIndex")
+    return np.full(len(index), place, dtype=object), index
+
+
+def day_of_week(days: np.ndarray) -> np.ndarray:
+    """
+    Savaitės diena (pirmadienis=0) iš datetime64[D] masyvo
+
+    1970-01-01 buvo ketvirtadienis (3), todėl pakanka dienų skaičiaus nuo epochos.
+    """
+    return (days.astype(np.int64) + 3) % 7
+
+
+def _weekend_days(places: np.ndarray, days: np.ndarray, values: np.ndarray,
+                  rain_threshold: float) -> Dict[str, np.ndarray]:
+    """
+    Savaitgalio dienų rodikliai, sugrupuoti pagal (vietovė, vietinė data)
+
+    Grupės surikiuotos pagal vietovės pasirodymo numerį, po to chronologiškai.
+    Sumos negrąžinamos suapvalintos, kad iš jų būtų galima skaičiuoti savaitgalius.
+    NaN valandos įskaitomos į 'valandos' kaip 0 mm, bet ne į 'validžios_valandos'.
+    """
+    weekend = day_of_week(days) >= 5
+    place_ids, names = pd.factorize(places[weekend])
+    days, values = days[weekend], values[weekend]
+
+    # Grupės raktas: vietovės numeris ir dienos numeris nuo epochos
+    day_numbers = days.astype(np.int64)
+    offset = day_numbers - (day_numbers.min() if len(day_numbers) else 0)
+    keys = place_ids.astype(np.int64) * (offset.max() + 1 if len(offset) else 1) + offset
+    unique_keys, first, groups = np.unique(keys, return_index=True, return_inverse=True)
+    groups = groups.reshape(-1)
+    count = len(unique_keys)
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    maxima = np.full(count, -np.inf)
+    np.maximum.at(maxima, groups, filled)
+    return {
+        'vieta': np.asarray(names, dtype=object)[place_ids[first]],
+        'data': days[first],
+        'krituliai_suma': np.bincount(groups, weights=filled, minlength=count).astype(np.float64),
+        'krituliai_max': maxima,
+        'lietingos_valandos': np.bincount(groups, weights=filled > rain_threshold,
+                                          minlength=count).astype(np.int64),
+        'valandos': np.bincount(groups, minlength=count).astype(np.int64),
+        'validžios_valandos': np.bincount(groups, weights=valid, minlength=count).astype(np.int64),
+    }
+
+
+def _timestamps(days: np.ndarray) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(days.astype('datetime64[ns]'))
+
+
+def weekend_rain_table(frames: Mapping[str, Optional[pd.DataFrame]],
+                       rain_threshold: float = 0.0) -> pd.DataFrame:
+    """
+    Apskaičiuoja savaitgalio dienų kritulių suvestinę kelioms vietovėms iš karto
+
+    Visų vietovių įrašai sujungiami į vieną masyvą ir sugrupuojami vienu
+    np.unique kvietimu pagal (vietovė, vietinė data).
+
+    Args:
+        frames (Mapping[str, DataFrame]): Vietovės kodas -> prognozės DataFrame
+            (None ir tušti praleidžiami)
+        rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+
+    Returns:
+        pd.DataFrame: Po eilutę kiekvienai vietovės savaitgalio dienai (vietovės - pateikimo
+            tvarka, dienos - chronologiškai)
+    """
+    usable = {place: df for place, df in frames.items()
+              if df is not None and not df.empty and PRECIPITATION_COLUMN in df.columns}
+    # Tuščias masyvas gale - kad np.concatenate veiktų ir be vietovių
+    places = np.repeat(np.asarray(list(usable), dtype=object),
+                       np.array([len(df) for df in usable.values()], dtype=np.int64))
+    days = np.concatenate([local_days(df.index) for df in usable.values()]
+                          + [np.empty(0, dtype='datetime64[D]')])
+    values = np.concatenate([df[PRECIPITATION_COLUMN].to_numpy(dtype=np.float64)
+                             for df in usable.values()] + [np.empty(0)])
+    return _daily_table(_weekend_days(places, days, values, rain_threshold))
+
+
+def _daily_table(daily: Dict[str, np.ndarray]) -> pd.DataFrame:
+    day_names = np.asarray([WEEKEND_DAYS[5], WEEKEND_DAYS[6]], dtype=object)
+    return pd.DataFrame({
+        'vieta': daily['vieta'],
+        'data': _timestamps(daily['data']),
+        'savaitės_diena': day_names[day_of_week(daily['data']) - 5],
+        'krituliai_suma': daily['krituliai_suma'].round(2),
+        'krituliai_max': daily['krituliai_max'],
+        'lietingos_valandos': daily['lietingos_valandos'],
+        'valandos': daily['valandos'],
+        'lietus': daily['lietingos_valandos'] > 0,
+    }, columns=WEEKEND_RAIN_COLUMNS)
+
+
+def weekend_rain_summary(df: Optional[pd.DataFrame], place: str = '',
+                         rain_threshold: float = 0.0) -> pd.DataFrame:
+    """
+    Vienos vietovės savaitgalio dienų kritulių suvestinė
+
+    Args:
+        df (pd.DataFrame): Prognozės DataFrame su 'krituliai' stulpeliu
+        place (str): Vietovės kodas 'vieta' stulpeliui
+        rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+
+    Returns:
+        pd.DataFrame: Žr. weekend_rain_table()
+    """
+    return weekend_rain_table({place: df}, rain_threshold)
+
+
+WEEKLY_RAIN_COLUMNS = ['vieta', 'iso_metai', 'iso_savaitė', 'data', 'dienos', 'valandos',
+                       'lietingos_valandos', 'krituliai_suma', 'vidutiniai_krituliai', 'lietus']
+
+
+def iso_weeks(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ISO 8601 metai ir savaitės numeris iš datetime64[D] masyvo
+
+    ISO savaitė priklauso tiems metams, kuriems priklauso jos ketvirtadienis.
+    """
+    thursday = days - day_of_week(days) + 3
+    year_start = thursday.astype('datetime64[Y]')
+    week = (thursday - year_start.astype('datetime64[D]')).astype(np.int64) // 7 + 1
+    return year_start.astype(np.int64) + 1970, week
+
+
+def weekly_weekend_rain(df: Optional[pd.DataFrame], place: str = '',
+                        rain_threshold: float = 0.0) -> pd.DataFrame:
+    """
+    Savaitgalių (šeštadienis ir sekmadienis kartu) kritulių suvestinė
+
+    Sudedamos tos pačios dienų sumos kaip weekend_rain_table(): gretimos tos
+    pačios vietovės dienos su tuo pačiu ISO savaitės šeštadieniu sudaro vieną
+    savaitgalį.
+
+    Args:
+        df (pd.DataFrame): Prognozė su 'krituliai' stulpeliu; kelioms vietovėms -
+            MultiIndex su PLACE_LEVEL lygiu
+        place (str): Vietovės kodas, kai indekse nėra vietovės lygio
+        rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+
+    Returns:
+        pd.DataFrame: Po eilutę kiekvienam vietovės savaitgaliui (vietovės - pasirodymo
+            tvarka, savaitgaliai - chronologiškai); 'data' - savaitgalio šeštadienis
+    """
+    if df is None or df.empty or PRECIPITATION_COLUMN not in df.columns:
+        places, days, values = np.empty(0, dtype=object), np.empty(0, dtype='datetime64[D]'), np.empty(0)
+    else:
+        places, times = split_place_index(df.index, place)
+        places, days = places.astype(str).astype(object), local_days(times)
+        values = df[PRECIPITATION_COLUMN].to_numpy(dtype=np.float64)
+    weekly = _weekly_weekends(places, days, values, rain_threshold)
+    return pd.DataFrame({
+        'vieta': weekly['vieta'],
+        'iso_metai': weekly['iso_metai'],
+        'iso_savaitė': weekly['iso_savaitė'],
+        'data': _timestamps(weekly['data']),
+        'dienos': weekly['dienos'],
+        'valandos': weekly['valandos'],
+        'lietingos_valandos': weekly['lietingos_valandos'],
+        'krituliai_suma': weekly['krituliai_suma'],
+        'vidutiniai_krituliai': weekly['vidutiniai_krituliai'],
+        'lietus': weekly['lietus'],
+    }, columns=WEEKLY_RAIN_COLUMNS)
+
+
+def _weekly_weekends(places: np.ndarray, days: np.ndarray, values: np.ndarray,
+                     rain_threshold: float) -> Dict[str, np.ndarray]:
+    """
+    weekly_weekend_rain() stulpeliai masyvais ('data' - datetime64[D] šeštadienis)
+    """
+    daily = _weekend_days(places, days, values, rain_threshold)
+
+    # Dienos surikiuotos pagal vietovę ir datą, todėl savaitgalio dienos - gretimos eilutės
+    saturdays = daily['data'] - day_of_week(daily['data']) + 5
+    starts = np.ones(len(saturdays), dtype=bool)
+    starts[1:] = (daily['vieta'][1:] != daily['vieta'][:-1]) | (saturdays[1:] != saturdays[:-1])
+    groups = np.cumsum(starts) - 1
+    first = np.flatnonzero(starts)
+    count = len(first)
+
+    def weekly(column: str) -> np.ndarray:
+        return np.bincount(groups, weights=daily[column], minlength=count).astype(np.float64)
+
+    totals = weekly('krituliai_suma')
+    rainy_hours = weekly('lietingos_valandos').astype(np.int64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = totals / weekly('validžios_valandos')
+    iso_year, iso_week = iso_weeks(saturdays[first])
+    return {
+        'vieta': daily['vieta'][first],
+        'iso_metai': iso_year,
+        'iso_savaitė': iso_week,
+        'data': saturdays[first],
+        'dienos': np.bincount(groups, minlength=count).astype(np.int64),
+        'valandos': weekly('valandos').astype(np.int64),
+        'lietingos_valandos': rainy_hours,
+        'krituliai_suma': totals.round(2),
+        'vidutiniai_krituliai': means.round(2),
+        'lietus': rainy_hours > 0,
+    }
+
+
+def weekend_rain_reports(places: np.ndarray, days: np.ndarray, values: np.ndarray,
+                         rain_threshold: float = 0.0) -> Dict[str, Dict[str, Any]]:
+    """
+    Savaitgalių suvestinės kiekvienai vietovei tiesiai iš masyvų (be tarpinės lentelės)
+
+    Args:
+        places (np.ndarray): Kiekvienos eilutės vietovės kodas
+        days (np.ndarray): Vietinės datos (datetime64[D], žr. local_days())
+        values (np.ndarray): Krituliai (mm)
+        rain_threshold (float): Valanda lietinga, jei krituliai > rain_threshold mm
+
+    Returns:
+        Dict: vietovė -> weekend_rain_report() žodynas (vietovės - pasirodymo tvarka)
+    """
+    weekly = _weekly_weekends(places, days, values, rain_threshold)
+    dates = np.datetime_as_string(weekly['data'], unit='D').tolist()
+    rain = weekly['lietus'].tolist()
+    means = weekly['vidutiniai_krituliai'].tolist()
+    names = weekly['vieta']
+    starts = np.flatnonzero(np.r_[len(names) > 0, names[1:] != names[:-1]])
+    bounds = np.r_[starts, len(names)]
+
+    reports = {}
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        total = int(end - start)
+        rainy = int(sum(rain[start:end]))
+        reports[names[start]] = {
+            'savaitgalių_skaičius': total,
+            'savaitgaliai_su_lietumi': rainy,
+            'lietaus_tikimybė_procentais': round(rainy / total * 100, 1),
+            'savaitgalių_detalizacija': [
+                {'data': date, 'lietaus_prognozė': wet, 'vidutiniai_krituliai': mean}
+                for date, wet, mean in zip(dates[start:end], rain[start:end], means[start:end])
+            ],
+        }
+    return reports
+
+
+def weekend_rain_report(table: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Vienos vietovės savaitgalių suvestinė WeatherAnalyzer.analyze_weekend_rain_forecast formatu
+
+    Args:
+        table (pd.DataFrame): weekly_weekend_rain() rezultatas vienai vietovei
+
+    Returns:
+        Dict: savaitgalių_skaičius, savaitgaliai_su_lietumi, lietaus_tikimybė_procentais,
+            savaitgalių_detalizacija
+    """
+    total = len(table)
+    rainy = int(table['lietus'].sum())
+    details = pd.DataFrame({
+        'data': table['data'].dt.strftime('%Y-%m-%d'),
+        'lietaus_prognozė': table['lietus'],
+        'vidutiniai_krituliai': table['vidutiniai_krituliai'],
+    })
+    return {
+        'savaitgalių_skaičius': total,
+        'savaitgaliai_su_lietumi': rainy,
+        'lietaus_tikimybė_procentais': round(rainy / total * 100, 1) if total > 0 else 0,
+        'savaitgalių_detalizacija': details.to_dict('records'),
+    }
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Bendri testų nustatymai
+"""
+import os
+import sys
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from http_client import configure_shared_client
+
+
+def pytest_configure(config):
+    """
+    Testuose užklausos imituojamos, todėl bendram klientui greičio riba netaikoma,
+    o grandinės pertraukiklis išjungtas, kad nesėkmės nepersiduotų tarp testų
+    """
+    configure_shared_client(rate_per_second=None, breaker_threshold=None)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Daugelio vietovių analizės procesų telkinyje unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch_analysis import SharedFrame, run_batch
+from data_analysis import WeatherAnalyzer
+
+
+def make_place(days: int = 60, seed: int = 1) -> pd.DataFrame:
+    index = pd.date_range('2024-01-01', periods=days * 24, freq='h', tz='Europe/Vilnius')
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'temperatura': rng.normal(3, 6, len(index)),
+        'dregme': rng.uniform(40, 95, len(index)),
+        'krituliai': rng.exponential(0.3, len(index)),
+    }, index=index)
+
+
+def without_date(report: dict) -> dict:
+    report = dict(report)
+    report.pop('analizės_data', None)
+    return report
+
+
+class TestSharedFrame:
+    """
+    SharedFrame testai
+    """
+
+    def test_roundtrip(self):
+        """
+        Testuoja, kad prijungtas DataFrame sutampa su originalu (be ne skaitinių stulpelių)
+        """
+        df = make_place(days=5)
+        df['conditionCode'] = 'clear'
+        descriptor, block = SharedFrame.create(df)
+        try:
+            frame, attached = descriptor.attach()
+            pd.testing.assert_frame_equal(frame, df.drop(columns='conditionCode'), check_freq=False)
+            del frame
+            attached.close()
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_requires_datetime_index(self):
+        """
+        Testuoja ValueError be DatetimeIndex
+        """
+        with pytest.raises(ValueError):
+            SharedFrame.create(pd.DataFrame({'temperatura': [1.0, 2.0]}))
+
+    def test_block_removed_when_copy_fails(self, monkeypatch):
+        """
+        Testuoja, kad nepavykus kopijavimui bendros atminties blokas pašalinamas
+        """
+        from multiprocessing import shared_memory
+        created = []
+        original = shared_memory.SharedMemory
+
+        def tracking(*args, **kwargs):
+            block = original(*args, **kwargs)
+            created.append(block.name)
+            return block
+
+        def fail(*args, **kwargs):
+            raise MemoryError("nepakanka atminties")
+
+        monkeypatch.setattr(shared_memory, 'SharedMemory', tracking)
+        monkeypatch.setattr(pd.DataFrame, 'to_numpy', fail)
+        with pytest.raises(MemoryError):
+            SharedFrame.create(make_place(days=1))
+
+        monkeypatch.undo()
+        assert len(created) == 1
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=created[0])
+
+
+class TestRunBatch:
+    """
+    run_batch testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.places = {place: make_place(seed=seed) for seed, place in
+                       enumerate(['vilnius', 'kaunas', 'klaipeda'])}
+
+    def assert_place(self, result: dict, place: str, forecast: pd.DataFrame = None):
+        reference = WeatherAnalyzer(self.places[place], forecast)
+        assert without_date(result['vietovės'][place]) == without_date(reference.generate_summary_report())
+
+        expected = reference.calculate_correlations()
+        actual = pd.DataFrame(result['koreliacijos'][place]).loc[expected.index, expected.columns]
+        np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), atol=1e-9)
+
+    def test_process_pool(self, tmp_path):
+        """
+        Testuoja failų kelius ir DataFrame (bendra atmintis) procesų telkinyje
+        """
+        path = tmp_path / 'vilnius.csv'
+        self.places['vilnius'].to_csv(path)
+        forecast = make_place(days=7, seed=9)
+        forecast.index = forecast.index + pd.Timedelta(days=60)
+
+        result = run_batch({
+            'vilnius': str(path),
+            'kaunas': self.places['kaunas'],
+            'klaipeda': {'historical': self.places['klaipeda'], 'forecast': forecast},
+        }, max_workers=2)
+
+        assert result['vietovių_skaičius'] == 3
+        assert result['klaidos'] == {}
+        assert list(result['vietovės']) == ['vilnius', 'kaunas', 'klaipeda']
+        self.assert_place(result, 'vilnius')
+        self.assert_place(result, 'kaunas')
+        self.assert_place(result, 'klaipeda', forecast)
+
+    def test_errors_do_not_stop_batch(self, tmp_path):
+        """
+        Testuoja, kad vietovės klaida įrašoma, o kitos vietovės išanalizuojamos
+        """
+        result = run_batch({
+            'nera': str(tmp_path / 'nera.csv'),
+            'blogas': [1, 2, 3],
+            'kaunas': self.places['kaunas'],
+        }, max_workers=1)
+
+        assert set(result['klaidos']) == {'nera', 'blogas'}
+        assert list(result['vietovės']) == ['kaunas']
+        self.assert_place(result, 'kaunas')
+
+    def test_empty_report_is_error(self, monkeypatch):
+        """
+        Testuoja, kad tuščia darbuotojo ataskaita įrašoma į klaidas
+        """
+        monkeypatch.setattr(WeatherAnalyzer, 'generate_summary_report', lambda self: {})
+        result = run_batch({'kaunas': self.places['kaunas']}, max_workers=1)
+
+        assert result['vietovės'] == {}
+        assert set(result['klaidos']) == {'kaunas'}
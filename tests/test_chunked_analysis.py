@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+ChunkedWeatherAnalyzer (analizės dalimis) unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chunked_analysis import ChunkedWeatherAnalyzer, iter_frame_chunks, normalize_chunk
+from data_analysis import WeatherAnalyzer
+
+
+def make_observations(days: int = 500, seed: int = 5) -> pd.DataFrame:
+    """
+    Sukuria valandinius stebėjimus tokiu pat formatu kaip ObservationStore
+    """
+    utc = pd.date_range('2023-03-01', periods=days * 24, freq='h', tz='UTC')
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'observationTimeUtc': utc,
+        'temperatura': rng.normal(7, 9, len(utc)),
+        'dregme': rng.uniform(40, 95, len(utc)),
+        'vejo_greitis': rng.uniform(0, 15, len(utc)),
+        'slegimasJuros': rng.normal(1013, 12, len(utc)),
+        'krituliai': rng.exponential(0.3, len(utc)),
+        'conditionCode': 'cloudy',
+    }, index=utc.tz_convert('Europe/Vilnius').rename('observationTimeLocal'))
+    df.iloc[::37, 1] = np.nan
+    return df
+
+
+def make_forecast(start: pd.Timestamp, seed: int = 9) -> pd.DataFrame:
+    index = pd.date_range(start, periods=240, freq='h', tz='Europe/Vilnius')
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'temperatura': rng.normal(12, 6, len(index)),
+        'dregme': rng.uniform(50, 90, len(index)),
+        'slegimasJuros': rng.normal(1015, 8, len(index)),
+        'krituliai': rng.exponential(0.4, len(index)),
+    }, index=index)
+
+
+class TestChunkedWeatherAnalyzer:
+    """
+    Rezultatų palyginimas su WeatherAnalyzer
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.historical = make_observations()
+        self.forecast = make_forecast(self.historical.index[-1] + pd.Timedelta(hours=1))
+        self.reference = WeatherAnalyzer(self.historical, self.forecast)
+
+    def assert_matches_reference(self, analyzer: ChunkedWeatherAnalyzer):
+        reference = self.reference
+        assert analyzer.calculate_yearly_averages() == reference.calculate_yearly_averages()
+        assert analyzer.analyze_day_night_temperature() == reference.analyze_day_night_temperature()
+        assert analyzer.find_extremes() == reference.find_extremes()
+        assert analyzer.analyze_weekend_rain_forecast() == reference.analyze_weekend_rain_forecast()
+
+        expected = reference.calculate_correlations()
+        actual = analyzer.calculate_correlations().loc[expected.index, expected.columns]
+        np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), atol=1e-9)
+
+        pd.testing.assert_frame_equal(analyzer.rolling_averages(), reference.rolling_averages(),
+                                      check_freq=False, rtol=1e-9)
+
+        report, expected_report = analyzer.generate_summary_report(), reference.generate_summary_report()
+        report.pop('analizės_data'), expected_report.pop('analizės_data')
+        assert report == expected_report
+
+    def test_csv_source(self, tmp_path):
+        """
+        Testuoja CSV failą, skaitomą dalimis
+        """
+        path = tmp_path / 'historical.csv'
+        self.historical.to_csv(path)
+        analyzer = ChunkedWeatherAnalyzer(str(path), self.forecast, chunksize=1000)
+        self.assert_matches_reference(analyzer)
+
+    def test_dataframe_chunks(self):
+        """
+        Testuoja DataFrame dalių sąrašą (galima skaityti kelis kartus)
+        """
+        chunks = [self.historical.iloc[start:start + 777] for start in range(0, len(self.historical), 777)]
+        analyzer = ChunkedWeatherAnalyzer(chunks, self.forecast)
+        self.assert_matches_reference(analyzer)
+
+        custom = analyzer.analyze_day_night(['temperatura', 'dregme'], day_start=22, day_end=6)
+        expected = self.reference.analyze_day_night(['temperatura', 'dregme'], day_start=22, day_end=6)
+        assert custom == expected
+        assert (analyzer.analyze_day_night_temperature(day_start=6, day_end=18)
+                == self.reference.analyze_day_night_temperature(day_start=6, day_end=18))
+
+    def test_parquet_directory(self, tmp_path):
+        """
+        Testuoja skaidytą Parquet katalogą (place=/month=)
+        """
+        pytest.importorskip('pyarrow')
+        months = self.historical.index.tz_convert('UTC').strftime('%Y-%m')
+        for month in sorted(set(months)):
+            directory = tmp_path / 'place=vilnius' / f'month={month}'
+            directory.mkdir(parents=True)
+            self.historical[months == month].reset_index(drop=True).to_parquet(directory / 'part.parquet')
+
+        analyzer = ChunkedWeatherAnalyzer(str(tmp_path), self.forecast, chunksize=2000)
+        self.assert_matches_reference(analyzer)
+
+    def test_one_shot_iterator(self):
+        """
+        Testuoja, kad vienkartinis iteratorius perskaitomas tik vieną kartą
+        """
+        reads = []
+
+        def chunks():
+            for start in range(0, len(self.historical), 1000):
+                reads.append(start)
+                yield self.historical.iloc[start:start + 1000]
+
+        analyzer = ChunkedWeatherAnalyzer(chunks(), self.forecast)
+        report = analyzer.generate_summary_report()
+        assert analyzer.find_extremes() == report['ekstremaliuosius_rodikliai']
+        assert analyzer.calculate_correlations() is not None
+        assert len(reads) == len(range(0, len(self.historical), 1000))
+
+        # Kitam dienos langui reikėtų antro praėjimo
+        assert analyzer.analyze_day_night(['temperatura'], day_start=6, day_end=18) == {}
+
+    def test_rescan_after_file_change(self, tmp_path):
+        """
+        Testuoja, kad pasikeitus failui rezultatai perskaičiuojami
+        """
+        path = tmp_path / 'historical.csv'
+        self.historical.iloc[:1000].to_csv(path)
+        analyzer = ChunkedWeatherAnalyzer(str(path), chunksize=300)
+        before = analyzer.find_extremes()
+
+        self.historical.to_csv(path)
+        os.utime(path, (1, 1))
+        assert analyzer.find_extremes() == WeatherAnalyzer(self.historical).find_extremes()
+        assert analyzer.find_extremes() != before
+
+
+class TestNormalizeChunk:
+    """
+    normalize_chunk ir iter_frame_chunks testai
+    """
+
+    def test_api_columns_and_local_time(self):
+        """
+        Testuoja API stulpelių pervadinimą ir laiko indeksą iš vietinio laiko stulpelio
+        """
+        raw = pd.DataFrame({
+            'observationTime': ['2025-08-06 23:00:00+03:00', '2025-08-07 00:00:00+03:00'],
+            'airTemperature': [13.6, 12.7],
+            'precipitation': [0, 0.2],
+        })
+        chunk = normalize_chunk(raw)
+        assert list(chunk.columns[-2:]) == ['temperatura', 'krituliai']
+        assert str(chunk.index.tz) == 'Europe/Vilnius'
+        assert chunk.index[1].hour == 0
+
+    def test_missing_time_column(self):
+        """
+        Testuoja ValueError, kai nėra laiko stulpelio
+        """
+        with pytest.raises(ValueError):
+            normalize_chunk(pd.DataFrame({'temperatura': [1.0]}))
+
+    def test_headerless_index_column(self, tmp_path):
+        """
+        Testuoja CSV, kurio laiko indeksas neturi pavadinimo (paprastas df.to_csv())
+        """
+        df = make_forecast(pd.Timestamp('2024-10-25 12:00', tz='Europe/Vilnius'))
+        path = tmp_path / 'plain.csv'
+        df.to_csv(path)
+        chunks = list(iter_frame_chunks(str(path), chunksize=100))
+        restored = pd.concat(chunks)
+        assert list(restored.columns) == list(df.columns)
+        # Vasaros laiko pabaiga: poslinkis iš teksto išsaugo abi 03:00 valandas
+        assert restored.index.equals(df.index)
+
+        report = ChunkedWeatherAnalyzer(str(path), chunksize=100).generate_summary_report()
+        assert report['duomenų_kiekis']['istoriniai'] == len(df)
+
+    def test_unreadable_source_raises(self, tmp_path):
+        """
+        Testuoja, kad neperskaitomas šaltinis sukelia klaidą, o ne tuščią ataskaitą
+        """
+        path = tmp_path / 'values.csv'
+        pd.DataFrame({'temperatura': [1.0, 2.0]}).to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            ChunkedWeatherAnalyzer(str(path)).generate_summary_report()
+
+    def test_repository_csv(self):
+        """
+        Testuoja repozitorijos pavyzdinį CSV failą
+        """
+        path = os.path.join(os.path.dirname(__file__), '..', 'data', 'historical_data.csv')
+        if not os.path.exists(path):
+            pytest.skip("Nėra data/historical_data.csv")
+        chunks = list(iter_frame_chunks(path, chunksize=10))
+        assert sum(len(chunk) for chunk in chunks) == len(pd.read_csv(path))
+        assert 'temperatura' in chunks[0].columns
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+IncrementalCorrelation (atnaujinamos koreliacijos) unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from correlation import IncrementalCorrelation
+
+
+def make_data(rows: int = 5000, seed: int = 2) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    temperature = rng.normal(8, 9, rows)
+    df = pd.DataFrame({
+        'temperatura': temperature,
+        'dregme': 80 - 1.5 * temperature + rng.normal(0, 8, rows),
+        'slegimasJuros': 1013 + 0.2 * temperature + rng.normal(0, 10, rows),
+        'krituliai': rng.exponential(0.3, rows),
+    })
+    df.iloc[::7, 1] = np.nan
+    df.iloc[::13, 2] = np.nan
+    return df
+
+
+class TestIncrementalCorrelation:
+    """
+    IncrementalCorrelation testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.df = make_data()
+        self.expected = self.df.corr()
+
+    def test_batches_match_full_corr(self):
+        """
+        Testuoja, kad paketais sukauptos sumos sutampa su DataFrame.corr()
+        """
+        tracker = IncrementalCorrelation(self.df.columns)
+        for start in range(0, len(self.df), 333):
+            tracker.update(self.df.iloc[start:start + 333])
+
+        assert tracker.rows == len(self.df)
+        pd.testing.assert_frame_equal(tracker.pearson(), self.expected, atol=1e-10)
+
+    def test_merge_partial_results(self):
+        """
+        Testuoja skirtingų procesų (skirtingi centrai) kaupiklių sujungimą
+        """
+        parts = [IncrementalCorrelation.from_frame(self.df.iloc[start:start + 1200] + offset)
+                 for offset, start in zip([0, 50, -30, 7, 0], range(0, len(self.df), 1200))]
+        shifted = pd.concat([self.df.iloc[start:start + 1200] + offset
+                             for offset, start in zip([0, 50, -30, 7, 0], range(0, len(self.df), 1200))])
+
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        pd.testing.assert_frame_equal(merged.pearson(), shifted.corr(), atol=1e-10)
+
+    def test_merge_with_empty_column(self):
+        """
+        Testuoja sujungimą, kai vienoje dalyje stulpelis neturi reikšmių
+        """
+        first = self.df.iloc[:2000].copy()
+        first['krituliai'] = np.nan
+        tracker = IncrementalCorrelation.from_frame(first)
+        tracker.merge(IncrementalCorrelation.from_frame(self.df.iloc[2000:]))
+
+        combined = pd.concat([first, self.df.iloc[2000:]])
+        pd.testing.assert_frame_equal(tracker.pearson(), combined.corr(), atol=1e-10)
+
+    def test_missing_columns_and_constant(self):
+        """
+        Testuoja trūkstamus stulpelius (NaN) ir stulpelį be sklaidos
+        """
+        tracker = IncrementalCorrelation(['temperatura', 'vejo_greitis', 'pastovus'])
+        batch = self.df[['temperatura']].assign(pastovus=1.0)
+        tracker.update(batch)
+        result = tracker.pearson()
+
+        assert result.loc['temperatura', 'temperatura'] == pytest.approx(1.0)
+        assert np.isnan(result.loc['temperatura', 'vejo_greitis'])
+        assert np.isnan(result.loc['temperatura', 'pastovus'])
+
+    def test_spearman_sample(self):
+        """
+        Testuoja Spearman koreliaciją: tiksli mažiems duomenims, apytikslė imčiai
+        """
+        exact = IncrementalCorrelation.from_frame(self.df.iloc[:500], sample_size=1000, seed=1)
+        pd.testing.assert_frame_equal(exact.spearman(), self.df.iloc[:500].corr(method='spearman'))
+
+        approximate = IncrementalCorrelation(self.df.columns, sample_size=2000, seed=1)
+        for start in range(0, len(self.df), 700):
+            approximate.update(self.df.iloc[start:start + 700])
+        other = IncrementalCorrelation.from_frame(make_data(seed=3), sample_size=2000, seed=2)
+        approximate.merge(other)
+
+        assert len(approximate.sample) == 2000
+        expected = pd.concat([self.df, make_data(seed=3)]).corr(method='spearman')
+        np.testing.assert_allclose(approximate.spearman().to_numpy(), expected.to_numpy(), atol=0.08)
+
+    def test_spearman_requires_sample(self):
+        """
+        Testuoja ValueError be imties ir nesutampančius stulpelius
+        """
+        tracker = IncrementalCorrelation.from_frame(self.df)
+        with pytest.raises(ValueError):
+            tracker.spearman()
+        with pytest.raises(ValueError):
+            tracker.merge(IncrementalCorrelation(['temperatura']))
@@ -12,7 +12,7 @@ import os
 # Pridedame src katalogą į Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from data_analysis import WeatherAnalyzer
+from data_analysis import WeatherAnalyzer, REPORT_SECTIONS
 
 
 class TestWeatherAnalyzer:
@@ -349,4 +349,190 @@ class TestWeatherAnalyzer:
         end = time.time()
         
         assert isinstance(averages, dict)
-        assert (end - start) < 5  # Neturi užtrukti ilgiau nei 5 sekundės
\ No newline at end of file
+        assert (end - start) < 5  # Neturi užtrukti ilgiau nei 5 sekundės
+        
+    def test_compact_dtypes_analysis(self):
+        """
+        Testuoja analizę su kompaktiškais tipais (float32, uint8)
+        """
+        compact_historical = self.historical_data.astype({
+            'temperatura': 'float32', 'vejo_greitis': 'float32',
+            'slegimasJuros': 'float32', 'krituliai': 'float32'
+        })
+        compact_historical['dregme'] = compact_historical['dregme'].round().astype('uint8')
+        compact_forecast = self.forecast_data.astype('float32')
+        
+        full = WeatherAnalyzer(self.historical_data, self.forecast_data)
+        compact = WeatherAnalyzer(compact_historical, compact_forecast)
+        
+        compact_averages = compact.calculate_yearly_averages()
+        for key, value in full.calculate_yearly_averages().items():
+            assert isinstance(compact_averages[key], float)
+            assert compact_averages[key] == pytest.approx(value, abs=0.5)
+            
+        compact_day_night = compact.analyze_day_night_temperature()
+        for key, value in full.analyze_day_night_temperature().items():
+            assert isinstance(compact_day_night[key], float)
+            assert compact_day_night[key] == pytest.approx(value, abs=0.01)
+            
+        for section in compact.find_extremes().values():
+            assert isinstance(section['reikšmė'], float)
+            
+        assert compact.analyze_weekend_rain_forecast()['savaitgalių_skaičius'] > 0
+        assert compact.calculate_correlations() is not None
+            
+    def test_results_memoized(self):
+        """
+        Testuoja, kad pakartotinė ataskaita neperskaičiuoja analizių
+        """
+        first = self.analyzer.generate_summary_report()
+        computed = self.analyzer.cache_info()
+        second = self.analyzer.generate_summary_report()
+        repeated = self.analyzer.cache_info()
+        
+        # Kiekviena sekcija pirmą kartą apskaičiuojama, antrą - imama iš podėlio
+        assert computed['hits'] == 0
+        assert computed['misses'] == computed['size'] == len(REPORT_SECTIONS)
+        assert repeated['misses'] == computed['misses']
+        assert repeated['hits'] == len(REPORT_SECTIONS)
+        first.pop('analizės_data'), second.pop('analizės_data')
+        assert first == second
+        
+    def test_memoized_result_is_copy(self):
+        """
+        Testuoja, kad grąžinto rezultato keitimas nesugadina podėlio
+        """
+        averages = self.analyzer.calculate_yearly_averages()
+        averages.clear()
+        correlations = self.analyzer.calculate_correlations()
+        correlations.iloc[0, 0] = 99
+        
+        assert self.analyzer.calculate_yearly_averages()
+        assert self.analyzer.calculate_correlations().iloc[0, 0] == pytest.approx(1.0)
+        
+    def test_memoization_invalidated_on_change(self):
+        """
+        Testuoja podėlio išvalymą pakeitus duomenis
+        """
+        before = self.analyzer.find_extremes()
+        
+        # Vietinis pakeitimas pirmoje eilutėje (patenka į atspaudo imtį)
+        self.analyzer.historical_data.iloc[0, 0] = 100.0
+        self.analyzer.combine_data()
+        assert self.analyzer.find_extremes()['aukščiausia_temperatūra']['reikšmė'] == 100.0
+        
+        # Naujų duomenų priskyrimas
+        self.analyzer.historical_data = self.historical_data.iloc[:24]
+        assert self.analyzer.calculate_yearly_averages() != {}
+        assert self.analyzer.cache_info()['size'] == 1
+        assert before != self.analyzer.find_extremes()
+        
+    def test_cache_bounded(self):
+        """
+        Testuoja, kad įsimenama ne daugiau cache_size rezultatų
+        """
+        analyzer = WeatherAnalyzer(self.historical_data, self.forecast_data, cache_size=2)
+        analyzer.calculate_yearly_averages()
+        analyzer.analyze_day_night_temperature()
+        analyzer.find_extremes()
+        assert analyzer.cache_info()['size'] == 2
+        
+        disabled = WeatherAnalyzer(self.historical_data, cache_size=0)
+        disabled.calculate_yearly_averages()
+        assert disabled.cache_info() == {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 0}
+        
+    @pytest.mark.parametrize("forecast", ['full', 'none', 'no_rain', 'multi_place'])
+    def test_report_matches_separate_methods(self, forecast):
+        """
+        Testuoja, kad vieno praėjimo ataskaita sutampa su atskirų metodų rezultatais
+        """
+        forecast_data = {
+            'full': self.forecast_data,
+            'none': None,
+            'no_rain': self.forecast_data.drop(columns='krituliai'),
+            'multi_place': pd.concat({'vilnius': self.forecast_data, 'kaunas': self.forecast_data},
+                                     names=['vieta', 'laikas']),
+        }[forecast]
+        historical = self.historical_data.copy()
+        historical.iloc[::7, 0] = np.nan
+        report = WeatherAnalyzer(historical, forecast_data, cache_size=0).generate_summary_report()
+        
+        separate = WeatherAnalyzer(historical, forecast_data, cache_size=0)
+        for section, method in REPORT_SECTIONS.items():
+            assert report[section] == getattr(separate, method)(), section
+            
+    def test_report_extremes_common_columns_only(self):
+        """
+        Testuoja, kad ekstremumai imami tik iš bendrų stulpelių (kaip combined_data)
+        """
+        analyzer = WeatherAnalyzer(self.historical_data,
+                                   self.forecast_data.drop(columns='vejo_greitis'))
+        report = analyzer.generate_summary_report()
+        assert 'didžiausias_vėjo_greitis' not in report['ekstremaliuosius_rodikliai']
+        assert report['ekstremaliuosius_rodikliai'] == analyzer.find_extremes()
+        
+    def test_report_fills_method_cache(self):
+        """
+        Testuoja, kad po ataskaitos atskiri metodai grąžina įsimintus rezultatus
+        """
+        report = self.analyzer.generate_summary_report()
+        hits = self.analyzer.cache_info()['hits']
+        
+        assert self.analyzer.find_extremes() == report['ekstremaliuosius_rodikliai']
+        assert self.analyzer.analyze_weekend_rain_forecast() == report['savaitgalių_lietaus_prognozė']
+        assert self.analyzer.cache_info()['hits'] == hits + 2
+        
+    def test_day_night_without_frame_copies(self, monkeypatch):
+        """
+        Testuoja, kad dienos/nakties analizė nekopijuoja DataFrame
+        """
+        expected = WeatherAnalyzer(self.historical_data, cache_size=0).analyze_day_night_temperature()
+        
+        def no_copy(*args, **kwargs):
+            raise AssertionError("DataFrame.copy() neturi būti kviečiamas")
+        monkeypatch.setattr(pd.DataFrame, 'copy', no_copy)
+        
+        analyzer = WeatherAnalyzer(self.historical_data, cache_size=0)
+        assert analyzer.analyze_day_night_temperature() == expected
+        
+        hours = self.historical_data.index.hour
+        day = self.historical_data['temperatura'][(hours >= 8) & (hours < 20)]
+        assert expected['vidutinė_dienos_temperatūra'] == round(day.mean(), 2)
+        assert expected['maksimali_dienos_temperatūra'] == round(day.max(), 2)
+        
+    def test_day_night_many_columns_custom_window(self):
+        """
+        Testuoja kelis stulpelius ir kitą dienos langą (taip pat per vidurnaktį)
+        """
+        analyzer = WeatherAnalyzer(self.historical_data)
+        analysis = analyzer.analyze_day_night(['temperatura', 'dregme', 'nera'], day_start=6, day_end=22)
+        
+        assert set(analysis) == {'temperatura', 'dregme'}
+        hours = self.historical_data.index.hour
+        night = self.historical_data['dregme'][(hours < 6) | (hours >= 22)]
+        assert analysis['dregme']['nakties']['vidutinė'] == round(night.mean(), 2)
+        assert analysis['dregme']['skirtumas'] == round(
+            analysis['dregme']['dienos']['vidutinė'] - analysis['dregme']['nakties']['vidutinė'], 2)
+        
+        # Langas per vidurnaktį: "diena" 22-6 yra aukščiau skaičiuota naktis
+        wrapped = analyzer.analyze_day_night(['dregme'], day_start=22, day_end=6)
+        assert wrapped['dregme']['dienos'] == analysis['dregme']['nakties']
+        
+        everything = analyzer.analyze_day_night()
+        assert set(everything) == set(self.historical_data.columns)
+        
+        with pytest.raises(ValueError):
+            analyzer.analyze_day_night_temperature(day_start=8, day_end=8)
+            
+    def test_day_night_ignores_nan(self):
+        """
+        Testuoja, kad NaN reikšmės praleidžiamos kaip pandas
+        """
+        data = self.historical_data.copy()
+        data.iloc[::5, 0] = np.nan
+        hours = data.index.hour
+        night = data['temperatura'][(hours < 8) | (hours >= 20)]
+        
+        result = WeatherAnalyzer(data).analyze_day_night_temperature()
+        assert result['vidutinė_nakties_temperatūra'] == round(night.mean(), 2)
+        assert result['minimali_nakties_temperatūra'] == round(night.min(), 2)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Srautinių top-k ekstremumų unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extremes import TopKExtremes, top_extremes, period_codes, period_label
+from data_analysis import WeatherAnalyzer
+from chunked_analysis import ChunkedWeatherAnalyzer
+
+
+def make_hourly(days: int = 400, seed: int = 4) -> pd.DataFrame:
+    index = pd.date_range('2023-11-20', periods=days * 24, freq='h', tz='Europe/Vilnius')
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'temperatura': np.round(rng.normal(5, 10, len(index)), 1),
+        'vejo_greitis': rng.uniform(0, 20, len(index)),
+        'slegimasJuros': rng.normal(1013, 10, len(index)),
+    }, index=index)
+    df.iloc[::17, 0] = np.nan
+    return df
+
+
+def naive_top(df: pd.DataFrame, column: str, k: int, largest: bool) -> pd.DataFrame:
+    """
+    Tiesioginis palyginimas: stabilus rikiavimas pagal reikšmę (vienodos - pagal laiką)
+    """
+    series = df[column].dropna()
+    ordered = series.sort_values(ascending=not largest, kind='stable')
+    return ordered.iloc[:k]
+
+
+class TestTopKExtremes:
+    """
+    TopKExtremes testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.df = make_hourly()
+
+    def test_chunks_match_naive_per_month(self):
+        """
+        Testuoja, kad dalimis sukaupti top-k sutampa su tiesioginiu rikiavimu kiekvienam mėnesiui
+        """
+        engine = TopKExtremes(k=5, period='month', columns=['temperatura'])
+        for start in range(0, len(self.df), 1000):
+            engine.update(self.df.iloc[start:start + 1000])
+        result = engine.result()
+
+        months = self.df.index.tz_localize(None).to_period('M').astype(str)
+        for month in ['2023-11', '2024-02', '2024-12']:
+            group = self.df[months == month]
+            for direction, largest in [('didžiausios', True), ('mažiausios', False)]:
+                expected = naive_top(group, 'temperatura', 5, largest)
+                actual = result[(result['laikotarpis'] == month) & (result['kryptis'] == direction)]
+                assert list(actual['rangas']) == [1, 2, 3, 4, 5]
+                assert list(actual['reikšmė']) == list(expected)
+                assert list(actual['data']) == list(expected.index)
+
+    def test_top_one_matches_find_extremes(self):
+        """
+        Testuoja, kad k=1 visam laikotarpiui sutampa su find_extremes()
+        """
+        analyzer = WeatherAnalyzer(self.df)
+        expected = analyzer.find_extremes()
+        result = analyzer.find_top_extremes(k=1)
+
+        top = result.set_index(['stulpelis', 'kryptis'])
+        assert top.loc[('temperatura', 'didžiausios'), 'reikšmė'] == expected['aukščiausia_temperatūra']['reikšmė']
+        assert str(top.loc[('temperatura', 'mažiausios'), 'data']) == expected['žemiausia_temperatūra']['data']
+        assert str(top.loc[('slegimasJuros', 'didžiausios'), 'data']) == expected['aukščiausias_slėgimas']['data']
+
+    def test_places_and_merge(self):
+        """
+        Testuoja kelias vietoves (MultiIndex ir žodynas) ir kaupiklių sujungimą
+        """
+        other = make_hourly(days=100, seed=8)
+        frames = {'vilnius': self.df, 'kaunas': other}
+        multi = pd.concat(frames, names=['vieta', 'laikas'])
+
+        from_mapping = top_extremes(frames, k=3, period='season', columns=['temperatura'])
+        from_multi = top_extremes(multi, k=3, period='season', columns=['temperatura'])
+        pd.testing.assert_frame_equal(from_mapping, from_multi)
+        assert list(from_mapping['vieta'].unique()) == ['vilnius', 'kaunas']
+
+        first = TopKExtremes(k=3, period='season', columns=['temperatura']).update(self.df, 'vilnius')
+        second = TopKExtremes(k=3, period='season', columns=['temperatura']).update(other, 'kaunas')
+        pd.testing.assert_frame_equal(first.merge(second).result(), from_mapping)
+
+        winter = from_mapping[(from_mapping['vieta'] == 'kaunas') & (from_mapping['laikotarpis'] == '2024 žiema')
+                              & (from_mapping['kryptis'] == 'mažiausios')]
+        expected = naive_top(other[other.index.month.isin([12, 1, 2])], 'temperatura', 3, largest=False)
+        assert list(winter['reikšmė']) == list(expected)
+
+    def test_to_dict(self):
+        """
+        Testuoja žodyno formatą
+        """
+        engine = TopKExtremes(k=2, period='year', columns=['vejo_greitis']).update(self.df, 'vilnius')
+        result = engine.to_dict()
+        entries = result['vilnius']['vejo_greitis']['2024']['didžiausios']
+        assert len(entries) == 2
+        assert entries[0]['reikšmė'] >= entries[1]['reikšmė']
+        assert set(entries[0]) == {'reikšmė', 'data'}
+
+    def test_periods(self):
+        """
+        Testuoja laikotarpių numerius ir pavadinimus (vietinis laikas)
+        """
+        index = pd.DatetimeIndex(['2023-12-31 23:30', '2024-01-15', '2024-03-01'], tz='UTC')
+        local = index.tz_convert('Europe/Vilnius')
+        seasons = period_codes(local, 'season')
+        assert [period_label(code, 'season') for code in seasons] == ['2024 žiema', '2024 žiema',
+                                                                      '2024 pavasaris']
+        assert period_label(period_codes(local, 'day')[0], 'day') == '2024-01-01'
+        assert period_label(period_codes(local, 'month')[0], 'month') == '2024-01'
+
+        with pytest.raises(ValueError):
+            TopKExtremes(period='week')
+        with pytest.raises(ValueError):
+            TopKExtremes(k=0)
+
+
+class TestChunkedTopExtremes:
+    """
+    ChunkedWeatherAnalyzer.find_top_extremes testai
+    """
+
+    def test_matches_in_memory(self):
+        """
+        Testuoja, kad dalimis gauti top-k sutampa su WeatherAnalyzer
+        """
+        df = make_hourly(days=200)
+        forecast = make_hourly(days=10, seed=6)[['temperatura', 'slegimasJuros']]
+        forecast.index = forecast.index + pd.Timedelta(days=200)
+        chunks = [df.iloc[start:start + 500] for start in range(0, len(df), 500)]
+
+        def ordered(result: pd.DataFrame) -> pd.DataFrame:
+            # combined_data stulpelių tvarka priklauso nuo aibės tvarkos
+            return result.sort_values(['stulpelis', 'kryptis'], kind='stable').reset_index(drop=True)
+
+        expected = WeatherAnalyzer(df, forecast).find_top_extremes(k=4, period='month')
+        actual = ChunkedWeatherAnalyzer(chunks, forecast).find_top_extremes(k=4, period='month')
+        pd.testing.assert_frame_equal(ordered(actual), ordered(expected))
+        assert 'vejo_greitis' not in set(actual['stulpelis'])
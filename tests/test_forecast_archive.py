@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Prognozių archyvo unit testai
+"""
+import pytest
+import pandas as pd
+import pytz
+import requests_mock
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pytest.importorskip('pyarrow')
+
+from forecast_archive import ForecastArchive
+from weather_api import WeatherAPI
+from tests.test_weather_api import make_forecast_payload
+
+
+def make_run(created: datetime, place: str = 'vilnius', hours: int = 240) -> dict:
+    """
+    Sukuria prognozės leidimą, prasidedantį leidimo laiku
+    """
+    payload = make_forecast_payload(place, hours)
+    offset = created.replace(tzinfo=None) - datetime.strptime(
+        payload['forecastCreationTimeUtc'], '%Y-%m-%d %H:%M:%S')
+    for record in payload['forecastTimestamps']:
+        moment = datetime.strptime(record['forecastTimeUtc'], '%Y-%m-%d %H:%M:%S') + offset
+        record['forecastTimeUtc'] = moment.strftime('%Y-%m-%d %H:%M:%S')
+        record['airTemperature'] += created.hour / 100
+    payload['forecastCreationTimeUtc'] = created.strftime('%Y-%m-%d %H:%M:%S')
+    return payload
+
+
+class TestForecastArchive:
+    """
+    ForecastArchive klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.tz = pytz.timezone('Europe/Vilnius')
+        self.created = [datetime(2025, 1, 30, 0) + timedelta(hours=6 * i) for i in range(12)]
+
+    def make_archive(self, tmp_path) -> ForecastArchive:
+        archive = ForecastArchive(str(tmp_path / 'archive'))
+        for created in self.created:
+            assert archive.append_payload(make_run(created))
+        return archive
+
+    def test_partition_layout(self, tmp_path):
+        """
+        Testuoja skaidymą pagal vietovę ir leidimo mėnesį
+        """
+        archive = self.make_archive(tmp_path)
+        place_dir = tmp_path / 'archive' / 'place=vilnius'
+
+        assert sorted(os.listdir(place_dir)) == ['month=2025-01', 'month=2025-02']
+        assert (place_dir / 'month=2025-01' / '20250130T000000.parquet').exists()
+        assert len(archive.runs('vilnius')) == 12
+
+    def test_duplicate_run_skipped(self, tmp_path):
+        """
+        Testuoja, kad jau išsaugotas leidimas praleidžiamas
+        """
+        archive = self.make_archive(tmp_path)
+
+        assert not archive.append_payload(make_run(self.created[0]))
+        assert len(archive.runs('vilnius')) == 12
+
+    def test_roundtrip_values(self, tmp_path):
+        """
+        Testuoja, kad nuskaityti duomenys sutampa su išsaugotais
+        """
+        archive = ForecastArchive(str(tmp_path / 'archive'))
+        payload = make_run(self.created[0], hours=24)
+        archive.append_payload(payload)
+
+        df = archive.load('vilnius')
+        assert len(df) == 24
+        assert df.index.name == 'forecastTimeLocal'
+        assert str(df.index.tz) == 'Europe/Vilnius'
+        assert df['forecastCreationTimeUtc'].iloc[0] == pd.Timestamp('2025-01-30', tz='UTC')
+        # Numatytai saugoma pilnu tikslumu
+        assert df['temperatura'].dtype == 'float64'
+        assert df['temperatura'].iloc[0] == payload['forecastTimestamps'][0]['airTemperature']
+        assert df['conditionCode'].iloc[0] == 'partly-cloudy'
+
+    def test_compact_option(self, tmp_path):
+        """
+        Testuoja kompaktiškų tipų pasirinkimą
+        """
+        archive = ForecastArchive(str(tmp_path / 'archive'), compact=True)
+        payload = make_run(self.created[0], hours=24)
+        archive.append_payload(payload)
+
+        df = archive.load('vilnius')
+        assert df['temperatura'].dtype == 'float32'
+        assert df['temperatura'].iloc[0] == pytest.approx(
+            payload['forecastTimestamps'][0]['airTemperature'], abs=1e-4)
+
+    def test_range_reads_only_needed_runs(self, tmp_path, monkeypatch):
+        """
+        Testuoja, kad intervalo užklausa skaito tik reikalingus leidimus
+        """
+        import pyarrow.parquet as pq
+        archive = self.make_archive(tmp_path)
+        archive.MAX_HORIZON = timedelta(hours=12)
+
+        read = []
+        original = pq.read_table
+        monkeypatch.setattr(pq, 'read_table', lambda path, *a, **kw: read.append(path) or original(path, *a, **kw))
+
+        start, end = datetime(2025, 2, 1, 0), datetime(2025, 2, 1, 12)
+        df = archive.load('vilnius', start, end)
+
+        assert len(read) == 5
+        assert df['forecastTimeUtc'].min() >= pd.Timestamp(start, tz='UTC')
+        assert df['forecastTimeUtc'].max() < pd.Timestamp(end, tz='UTC')
+
+    def test_latest_only(self, tmp_path):
+        """
+        Testuoja, kad latest=True palieka vėliausio leidimo prognozę
+        """
+        archive = self.make_archive(tmp_path)
+
+        df = archive.load('vilnius', datetime(2025, 2, 1), datetime(2025, 2, 2), latest=True)
+        assert len(df) == 24
+        assert df.index.is_unique
+        assert (df['forecastCreationTimeUtc'] == pd.Timestamp('2025-02-01 18:00', tz='UTC')).sum() == 6
+
+    def test_missing_place(self, tmp_path):
+        """
+        Testuoja tuščią rezultatą nežinomai vietovei
+        """
+        archive = ForecastArchive(str(tmp_path / 'archive'))
+        assert archive.load('kaunas').empty
+        assert archive.runs('kaunas') == []
+
+    def test_capture_from_api(self, tmp_path):
+        """
+        Testuoja API leidimo archyvavimą ir df.attrs metaduomenis
+        """
+        api = WeatherAPI('kaunas')
+        archive = ForecastArchive(str(tmp_path / 'archive'))
+        payload = make_forecast_payload('kaunas', hours=240)
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{api.base_url}/places/kaunas/forecasts/long-term", json=payload)
+            df = api.get_forecast_data(days=2)
+            assert archive.capture(api)
+            assert not archive.capture(api)
+            assert mocker.call_count == 1
+
+        assert df.attrs['place'] == 'kaunas'
+        assert df.attrs['forecastCreationTimeUtc'] == payload['forecastCreationTimeUtc']
+        assert len(archive.load('kaunas')) == 240
+        assert not archive.append(df)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Stulpelinio prognozės analizatoriaus unit testai
+"""
+import pytest
+import pandas as pd
+import pytz
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from forecast_parser import parse_forecast_timestamps, parse_forecast_timestamps_pandas
+from tests.test_weather_api import make_forecast_payload
+
+
+class TestForecastParser:
+    """
+    parse_forecast_timestamps funkcijos testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.tz = pytz.timezone('Europe/Vilnius')
+        self.records = make_forecast_payload(hours=24 * 10)['forecastTimestamps']
+
+    def assert_same_as_pandas(self, records, cutoff=None):
+        fast = parse_forecast_timestamps(records, self.tz, cutoff)
+        reference = parse_forecast_timestamps_pandas(records, self.tz, cutoff)
+        pd.testing.assert_frame_equal(fast, reference)
+        return fast
+
+    def test_identical_to_pandas_path(self):
+        """
+        Testuoja, kad rezultatas sutampa su pd.DataFrame + pd.to_datetime keliu
+        """
+        result = self.assert_same_as_pandas(self.records)
+
+        assert result.index.name == 'forecastTimeLocal'
+        assert str(result.index.tz) == 'Europe/Vilnius'
+        for col in ['temperatura', 'dregme', 'vejo_greitis', 'slegimasJuros', 'krituliai']:
+            assert col in result.columns
+
+    def test_cutoff_filter(self):
+        """
+        Testuoja filtravimą pagal paskutinį vietinį laiką
+        """
+        cutoff = datetime.now(self.tz) + timedelta(days=3)
+        result = self.assert_same_as_pandas(self.records, cutoff)
+
+        assert len(result) < len(self.records)
+        assert result.index.max() <= cutoff
+
+    def test_mixed_int_float_and_missing_values(self):
+        """
+        Testuoja tipų parinkimą, kai reikšmės mišrios arba trūksta laukų
+        """
+        records = [dict(record) for record in self.records[:6]]
+        records[0]['airTemperature'] = 12
+        records[1]['windGust'] = None
+        del records[2]['cloudCover']
+        records[3]['conditionCode'] = None
+
+        result = self.assert_same_as_pandas(records)
+        assert result['temperatura'].dtype == 'float64'
+        assert result['windDirection'].dtype == 'int64'
+
+    def test_unexpected_time_format_falls_back(self):
+        """
+        Testuoja atsarginį pandas kelią, kai laiko formatas nestandartinis
+        """
+        records = [dict(record) for record in self.records[:3]]
+        for record in records:
+            record['forecastTimeUtc'] = record['forecastTimeUtc'].replace(' ', 'T') + '+00:00'
+
+        result = parse_forecast_timestamps(records, self.tz)
+        assert len(result) == 3
+        assert result.index.tz is not None
+
+    def test_empty_records(self):
+        """
+        Testuoja tuščią įrašų sąrašą
+        """
+        assert parse_forecast_timestamps([], self.tz).empty
+
+
+class TestCompactSchema:
+    """
+    Kompaktiškos tipų schemos testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.tz = pytz.timezone('Europe/Vilnius')
+        self.records = make_forecast_payload(hours=24 * 10)['forecastTimestamps']
+
+    def test_compact_dtypes(self):
+        """
+        Testuoja, kad schema pritaikoma analizės metu
+        """
+        result = parse_forecast_timestamps(self.records, self.tz, compact=True)
+
+        assert result['temperatura'].dtype == 'float32'
+        assert result['krituliai'].dtype == 'float32'
+        assert result['windDirection'].dtype == 'uint16'
+        assert result['cloudCover'].dtype == 'uint8'
+        assert result['dregme'].dtype == 'uint8'
+        assert result['conditionCode'].dtype == 'category'
+
+    def test_values_preserved(self):
+        """
+        Testuoja, kad kompaktiškos reikšmės sutampa su pilno tikslumo reikšmėmis
+        """
+        full = parse_forecast_timestamps(self.records, self.tz)
+        compact = parse_forecast_timestamps(self.records, self.tz, compact=True)
+
+        pd.testing.assert_frame_equal(compact.astype(full.dtypes.to_dict()), full,
+                                      check_exact=False, rtol=1e-6)
+
+    def test_pandas_path_matches(self):
+        """
+        Testuoja, kad atsarginis kelias taiko tą pačią schemą
+        """
+        pd.testing.assert_frame_equal(
+            parse_forecast_timestamps(self.records, self.tz, compact=True),
+            parse_forecast_timestamps_pandas(self.records, self.tz, compact=True))
+
+    def test_memory_footprint(self):
+        """
+        Testuoja, kad kompaktiškas DataFrame užima bent 3 kartus mažiau atminties
+        """
+        full = parse_forecast_timestamps(self.records, self.tz)
+        compact = parse_forecast_timestamps(self.records, self.tz, compact=True)
+
+        ratio = full.memory_usage(deep=True).sum() / compact.memory_usage(deep=True).sum()
+        assert ratio >= 3
+
+    def test_integer_column_with_missing_values(self):
+        """
+        Testuoja, kad sveikųjų skaičių stulpelis su trūkstamomis reikšmėmis tampa float32
+        """
+        records = [dict(record) for record in self.records[:5]]
+        records[0]['cloudCover'] = None
+        records[1]['windDirection'] = 400
+
+        result = parse_forecast_timestamps(records, self.tz, compact=True)
+        assert result['cloudCover'].dtype == 'float32'
+        assert result['cloudCover'].isna().sum() == 1
+        assert result['windDirection'].dtype == 'uint16'
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+ForecastScheduler klasės unit testai
+"""
+import pytest
+import random
+import pandas as pd
+import requests_mock
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import forecast_scheduler
+from forecast_scheduler import ForecastScheduler
+from response_cache import ResponseCache
+from weather_api import WeatherAPI
+from tests.test_weather_api import make_forecast_payload
+
+
+class FakeClock:
+    """
+    Valdomas laikrodis (UNIX sekundės)
+    """
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def with_creation(payload: dict, created: datetime) -> dict:
+    payload['forecastCreationTimeUtc'] = created.strftime('%Y-%m-%d %H:%M:%S')
+    return payload
+
+
+class TestForecastScheduler:
+    """
+    ForecastScheduler klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.created = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        self.clock = FakeClock(self.created.timestamp() + 60)
+        self.api = WeatherAPI('vilnius')
+        self.places = ['vilnius', 'kaunas', 'klaipeda']
+
+    def make_scheduler(self, **kwargs) -> ForecastScheduler:
+        options = dict(run_interval=3600, publish_delay=600, retry_interval=900,
+                       spread=300, jitter=10, clock=self.clock, rng=random.Random(1))
+        options.update(kwargs)
+        return ForecastScheduler(self.api, self.places, **options)
+
+    def mock_places(self, mocker, created: datetime):
+        for place in self.places:
+            mocker.get(f"{self.api.base_url}/places/{place}/forecasts/long-term",
+                       json=with_creation(make_forecast_payload(place, hours=240), created))
+
+    def test_initial_fetches_staggered(self):
+        """
+        Testuoja, kad pirmieji tikrinimai išskaidyti per spread + jitter
+        """
+        scheduler = self.make_scheduler()
+        due = sorted(time for time, _ in scheduler._queue)
+
+        assert len(set(due)) == 3
+        assert all(self.clock.now <= time < self.clock.now + 310 for time in due)
+        assert scheduler.run_pending() == 0
+
+    def test_unknown_place(self):
+        """
+        Testuoja ValueError nežinomai vietovei
+        """
+        with pytest.raises(ValueError):
+            ForecastScheduler(self.api, ['nezinoma-vieta'])
+
+    def test_unchanged_run_not_reparsed(self, monkeypatch):
+        """
+        Testuoja, kad tas pats forecastCreationTimeUtc neanalizuojamas iš naujo
+        """
+        scheduler = self.make_scheduler()
+        parsed = []
+        original = forecast_scheduler.parse_forecast_timestamps
+        monkeypatch.setattr(forecast_scheduler, 'parse_forecast_timestamps',
+                            lambda *a, **kw: parsed.append(1) or original(*a, **kw))
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            assert scheduler.refresh('vilnius')
+            assert not scheduler.refresh('vilnius')
+
+            self.mock_places(mocker, self.created + timedelta(hours=1))
+            assert scheduler.refresh('vilnius')
+
+        assert len(parsed) == 2
+        assert scheduler.stats() == {'polls': 3, 'new_runs': 2, 'unchanged': 1,
+                                     'failures': 0, 'warm': 1}
+        assert len(scheduler.get('vilnius').frame) == 240
+
+    def test_next_due_aligned_to_model_run(self):
+        """
+        Testuoja, kad kitas tikrinimas planuojamas po kito leidimo paskelbimo
+        """
+        scheduler = self.make_scheduler(jitter=0)
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            scheduler.refresh('vilnius')
+
+        expected = self.created.timestamp() + 3600 + 600
+        due = scheduler.next_due('vilnius')
+        assert expected <= due < expected + 300
+
+        # Naujo leidimo dar nėra - tikrinama po retry_interval
+        late = expected + 1000
+        assert scheduler.next_due('vilnius', late) == late + 900
+
+    def test_run_pending_polls_due_places(self):
+        """
+        Testuoja, kad run_pending apdoroja visas suėjusias vietoves ir jas perplanuoja
+        """
+        scheduler = self.make_scheduler()
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            assert scheduler.run_pending(self.clock.now + 400) == 3
+            assert scheduler.run_pending(self.clock.now + 400) == 0
+
+        assert scheduler.stats()['warm'] == 3
+        assert min(time for time, _ in scheduler._queue) >= self.created.timestamp() + 4200
+
+    def test_run_pending_reads_clock_per_place(self, monkeypatch):
+        """
+        Testuoja, kad kitas tikrinimas skaičiuojamas nuo laiko po kiekvienos užklausos
+        """
+        scheduler = self.make_scheduler(retry_interval=900, jitter=0)
+
+        def slow_refresh(place):
+            self.clock.now += 100
+            return False
+
+        monkeypatch.setattr(scheduler, 'refresh', slow_refresh)
+        start = self.clock.now
+        assert scheduler.run_pending() == 0
+        self.clock.now += 400
+        assert scheduler.run_pending() == 3
+
+        due = sorted(time for time, _ in scheduler._queue)
+        assert due == [start + 400 + 100 * (i + 1) + 900 for i in range(3)]
+
+    def test_fresh_cache_does_not_hide_new_run(self, tmp_path):
+        """
+        Testuoja, kad planuoklis aplenkia šviežią podėlio įrašą
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+        self.api = WeatherAPI('vilnius', cache=cache)
+        scheduler = self.make_scheduler()
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            scheduler.refresh('vilnius')
+            self.mock_places(mocker, self.created + timedelta(hours=1))
+            assert scheduler.refresh('vilnius')
+
+        assert mocker.call_count == 2
+        assert cache.get('places/vilnius/forecasts/long-term').data[
+            'forecastCreationTimeUtc'] == scheduler.get('vilnius').created
+
+    def test_weather_api_reads_warm_cache(self):
+        """
+        Testuoja, kad WeatherAPI ima prognozę iš planuoklio be užklausos
+        """
+        scheduler = self.make_scheduler()
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            scheduler.refresh('kaunas')
+
+            api = WeatherAPI('kaunas', warm_cache=scheduler)
+            df = api.get_forecast_data(days=2)
+            compact = api.get_forecast_data(days=2, compact=True)
+            current = api.get_current_weather()
+            calls = mocker.call_count
+
+        assert calls == 1
+        assert isinstance(df, pd.DataFrame)
+        assert 47 <= len(df) <= 49
+        assert df.attrs['place'] == 'kaunas'
+        assert str(compact['temperatura'].dtype) == 'float32'
+        assert current['place']['code'] == 'kaunas'
+
+        # Kopijos keitimas nesugadina planuoklio duomenų
+        df['temperatura'] = 0
+        assert scheduler.get('kaunas').frame['temperatura'].iloc[0] != 0
+
+    def test_weather_api_skips_stale_warm_entry(self):
+        """
+        Testuoja, kad per senas planuoklio leidimas ignoruojamas ir prognozė parsiunčiama
+        """
+        scheduler = self.make_scheduler()
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            scheduler.refresh('kaunas')
+
+            api = WeatherAPI('kaunas', warm_cache=scheduler, warm_max_age=3600)
+            assert api.get_forecast_data(days=2) is not None
+            assert mocker.call_count == 1
+
+            self.clock.now = self.created.timestamp() + 3601
+            assert api.get_forecast_data(days=2) is not None
+            assert mocker.call_count == 2
+
+    def test_archive_new_runs(self, tmp_path):
+        """
+        Testuoja, kad nauji leidimai archyvuojami vieną kartą
+        """
+        pytest.importorskip('pyarrow')
+        from forecast_archive import ForecastArchive
+
+        archive = ForecastArchive(str(tmp_path / 'archive'))
+        scheduler = self.make_scheduler(archive=archive)
+        with requests_mock.Mocker() as mocker:
+            self.mock_places(mocker, self.created)
+            scheduler.refresh('vilnius')
+            scheduler.refresh('vilnius')
+
+        assert len(archive.runs('vilnius')) == 1
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+HttpClient ir TokenBucket klasių unit testai
+"""
+import pytest
+import requests
+import requests_mock
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from http_client import TokenBucket, CircuitBreaker, HttpClient, get_shared_client
+from weather_api import WeatherAPI
+
+
+class FakeClock:
+    """
+    Valdomas monotoninis laikrodis
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_response(headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 429
+    response.headers.update(headers)
+    return response
+
+
+class TestTokenBucket:
+    """
+    TokenBucket klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=2.0, capacity=3, clock=self.clock)
+
+    def test_burst_then_wait(self):
+        """
+        Testuoja, kad pliūpsnis praleidžiamas, o vėliau laukiama pagal greitį
+        """
+        waits = [self.bucket.reserve() for _ in range(5)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.5)
+        assert waits[4] == pytest.approx(1.0)
+
+    def test_refill_over_time(self):
+        """
+        Testuoja žetonų papildymą bėgant laikui
+        """
+        for _ in range(3):
+            self.bucket.reserve()
+        self.clock.now += 1.0
+        assert self.bucket.reserve() == 0.0
+        assert self.bucket.reserve() == 0.0
+        assert self.bucket.reserve() > 0
+
+    def test_invalid_rate(self):
+        """
+        Testuoja neteisingus parametrus
+        """
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestCircuitBreaker:
+    """
+    CircuitBreaker klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=3, cooldown=30, clock=self.clock)
+
+    def test_opens_after_threshold(self):
+        """
+        Testuoja, kad grandinė atsidaro po slenksčio ir kitų raktų neliečia
+        """
+        for _ in range(2):
+            self.breaker.record_failure('a')
+        assert self.breaker.allow('a')
+
+        self.breaker.record_failure('a')
+        assert self.breaker.state('a') == CircuitBreaker.OPEN
+        assert not self.breaker.allow('a')
+        assert self.breaker.allow('b')
+
+    def test_success_resets_failures(self):
+        """
+        Testuoja, kad sėkmė nuline nesėkmių skaičių
+        """
+        self.breaker.record_failure('a')
+        self.breaker.record_failure('a')
+        self.breaker.record_success('a')
+        self.breaker.record_failure('a')
+        assert self.breaker.state('a') == CircuitBreaker.CLOSED
+
+    def test_half_open_single_trial(self):
+        """
+        Testuoja, kad po pauzės praleidžiamas tik vienas bandomasis kvietimas
+        """
+        for _ in range(3):
+            self.breaker.record_failure('a')
+        self.clock.now += 30
+
+        assert self.breaker.state('a') == CircuitBreaker.HALF_OPEN
+        assert self.breaker.allow('a')
+        assert not self.breaker.allow('a')
+
+        # Nepavykęs bandymas vėl atidaro grandinę visai pauzei
+        self.breaker.record_failure('a')
+        assert self.breaker.state('a') == CircuitBreaker.OPEN
+        self.clock.now += 29
+        assert not self.breaker.allow('a')
+
+        self.clock.now += 1
+        assert self.breaker.allow('a')
+        self.breaker.record_success('a')
+        assert self.breaker.state('a') == CircuitBreaker.CLOSED
+
+    def test_failure_classification(self):
+        """
+        Testuoja, kad tik tinklo klaidos ir 5xx laikomos gedimais
+        """
+        server_error = requests.Response()
+        server_error.status_code = 503
+        not_found = requests.Response()
+        not_found.status_code = 404
+
+        assert CircuitBreaker.is_failure(requests.exceptions.ConnectTimeout())
+        assert CircuitBreaker.is_failure(requests.exceptions.HTTPError(response=server_error))
+        assert not CircuitBreaker.is_failure(requests.exceptions.HTTPError(response=not_found))
+
+    def test_weather_api_stops_calling_open_endpoint(self, monkeypatch):
+        """
+        Testuoja, kad atvira grandinė sustabdo pakartojimus ir kitus kvietimus
+        """
+        monkeypatch.setattr('time.sleep', lambda delay: None)
+        client = HttpClient(rate_per_second=None, breaker_threshold=2, breaker_cooldown=60)
+        first = WeatherAPI('vilnius', client=client)
+        second = WeatherAPI('kaunas', client=client)
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{first.base_url}/places/vilnius", status_code=503)
+            assert first._make_request('places/vilnius') is None
+            assert second._make_request('places/vilnius') is None
+
+        assert mocker.call_count == 2
+        assert client.breaker.state('places/vilnius') == CircuitBreaker.OPEN
+
+    def test_probe_released_after_unexpected_error(self, monkeypatch):
+        """
+        Testuoja, kad netikėta bandomojo kvietimo klaida nepalieka grandinės half-open
+        """
+        client = HttpClient(rate_per_second=None, breaker_threshold=1, breaker_cooldown=0)
+        api = WeatherAPI('vilnius', client=client)
+        client.breaker.record_failure('places/vilnius')
+
+        def broken(*args, **kwargs):
+            raise ValueError("sugadintas atsakymas")
+
+        monkeypatch.setattr(api, '_fetch', broken)
+        with pytest.raises(ValueError):
+            api._make_request('places/vilnius')
+        assert client.breaker.allow('places/vilnius')
+
+
+class TestHttpClient:
+    """
+    HttpClient klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.client = HttpClient(pool_maxsize=16, rate_per_second=None,
+                                 backoff_base=1.0, backoff_max=10.0)
+
+    def test_session_configuration(self):
+        """
+        Testuoja jungčių telkinio ir antraščių nustatymus
+        """
+        adapter = self.client.session.get_adapter('https://api.meteo.lt/v1')
+        assert adapter._pool_maxsize == 16
+        assert 'gzip' in self.client.session.headers['Accept-Encoding']
+        assert self.client.session.headers['Connection'] == 'keep-alive'
+        assert HttpClient(keep_alive=False).session.headers['Connection'] == 'close'
+        assert HttpClient(breaker_threshold=None).breaker is None
+
+    def test_rate_limit_per_host(self):
+        """
+        Testuoja, kad greičio riba taikoma kiekvienam hostui atskirai
+        """
+        client = HttpClient(rate_per_second=1.0, burst=1)
+        meteo = client.rate_limiter('https://api.meteo.lt/v1/places')
+        assert meteo is client.rate_limiter('https://API.meteo.lt/v1/stations')
+        assert meteo is not client.rate_limiter('http://127.0.0.1:8765/v1/places')
+
+        assert meteo.reserve() == 0.0
+        assert client.rate_limiter('http://127.0.0.1:8765/v1/places').reserve() == 0.0
+        assert self.client.rate_limiter('https://api.meteo.lt/v1/places') is None
+
+    def test_retry_after_seconds(self):
+        """
+        Testuoja Retry-After sekundėmis
+        """
+        response = make_response({'Retry-After': '7'})
+        assert self.client.backoff_delay(0, response) == 7.0
+        assert self.client.backoff_delay(0, make_response({'Retry-After': '120'})) == 10.0
+
+    def test_retry_after_http_date(self):
+        """
+        Testuoja Retry-After HTTP datos formatu
+        """
+        moment = datetime.now(timezone.utc) + timedelta(seconds=5)
+        response = make_response({'Retry-After': format_datetime(moment, usegmt=True)})
+        assert 3.0 <= self.client.backoff_delay(0, response) <= 5.0
+
+    def test_jittered_backoff(self):
+        """
+        Testuoja, kad be Retry-After pauzė yra atsitiktinė ir ribota
+        """
+        delays = [self.client.backoff_delay(2) for _ in range(200)]
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+        assert all(delay <= 10.0 for delay in (self.client.backoff_delay(10) for _ in range(20)))
+
+    def test_shared_between_instances(self):
+        """
+        Testuoja, kad visi WeatherAPI objektai naudoja tą patį klientą ir sesiją
+        """
+        first = WeatherAPI('vilnius')
+        second = WeatherAPI('kaunas')
+
+        assert first.client is get_shared_client()
+        assert first.session is second.session
+
+    def test_weather_api_honors_retry_after(self, monkeypatch):
+        """
+        Testuoja, kad 429 atsakymo Retry-After naudojamas pauzei tarp bandymų
+        """
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        api = WeatherAPI('vilnius', client=self.client)
+        url = f"{api.base_url}/places/vilnius"
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, [
+                {'status_code': 429, 'headers': {'Retry-After': '3'}},
+                {'json': {'code': 'vilnius'}},
+            ])
+            data = api._make_request('places/vilnius')
+
+        assert data == {'code': 'vilnius'}
+        assert sleeps == [3.0]
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Vietinio meteo.lt simuliatoriaus unit testai
+"""
+import pytest
+import requests
+import sys
+import os
+from unittest.mock import patch
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from meteo_simulator import MeteoSimulator
+from http_client import HttpClient
+from place_catalog import PlaceCatalog
+from response_cache import ResponseCache
+from weather_api import WeatherAPI
+
+CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'forecast_data.csv')
+
+
+class TestMeteoSimulator:
+    """
+    MeteoSimulator klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.client = HttpClient(rate_per_second=None, backoff_max=0)
+
+    def make_api(self, simulator, **kwargs) -> WeatherAPI:
+        return WeatherAPI('vilnius', base_url=simulator.base_url, client=self.client, **kwargs)
+
+    def test_synthetic_forecast(self):
+        """
+        Testuoja sintezuotą prognozę per WeatherAPI
+        """
+        with MeteoSimulator(seed=1) as sim:
+            df = self.make_api(sim).get_forecast_data(days=3)
+
+        assert df is not None
+        assert 60 <= len(df) <= 73
+        assert 'temperatura' in df.columns
+        assert sim.stats()['ok'] == 1
+
+    def test_csv_replay(self):
+        """
+        Testuoja įrašytos CSV prognozės atkūrimą
+        """
+        with MeteoSimulator(csv_path=CSV_PATH) as sim:
+            data = self.make_api(sim)._make_request('places/kaunas/forecasts/long-term')
+
+        assert data['place']['code'] == 'kaunas'
+        assert len(data['forecastTimestamps']) == 83
+        first = data['forecastTimestamps'][0]
+        assert len(first['forecastTimeUtc']) == 19
+        assert isinstance(first['airTemperature'], float)
+
+    def test_unknown_place_returns_404(self):
+        """
+        Testuoja nežinomą vietovę
+        """
+        with MeteoSimulator() as sim:
+            response = requests.get(f"{sim.base_url}/places/nera/forecasts/long-term")
+
+        assert response.status_code == 404
+        assert sim.stats()['not_found'] == 1
+
+    def test_error_injection_exhausts_retries(self):
+        """
+        Testuoja 500 klaidų injekciją ir pakartojimus
+        """
+        with MeteoSimulator(error_rate=1.0) as sim:
+            with patch('weather_api.time.sleep'):
+                result = self.make_api(sim)._make_request('places')
+
+        assert result is None
+        assert sim.stats()['errors'] == 3
+
+    def test_throttle_sends_retry_after(self):
+        """
+        Testuoja 429 atsakymą su Retry-After antrašte
+        """
+        with MeteoSimulator(throttle_rate=1.0, retry_after=7) as sim:
+            response = requests.get(f"{sim.base_url}/places")
+
+        assert response.status_code == 429
+        assert HttpClient.retry_after(response) == 7
+
+    def test_rate_limit_per_minute(self):
+        """
+        Testuoja užklausų ribą per minutę
+        """
+        with MeteoSimulator(rate_limit_per_minute=2) as sim:
+            statuses = [requests.get(f"{sim.base_url}/places").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+
+    def test_etag_revalidation(self, tmp_path):
+        """
+        Testuoja sąlyginę užklausą su ResponseCache (304 Not Modified)
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), default_ttl=0, ttl_rules={})
+        with MeteoSimulator(csv_path=CSV_PATH) as sim:
+            api = self.make_api(sim, cache=cache)
+            first = api._make_request('places/vilnius')
+            second = api._make_request('places/vilnius')
+
+        assert first == second
+        assert sim.stats()['not_modified'] == 1
+
+    def test_gzip_encoding(self):
+        """
+        Testuoja suspaustus didelius atsakymus
+        """
+        with MeteoSimulator() as sim:
+            response = self.client.get(f"{sim.base_url}/places/vilnius/forecasts/long-term")
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert len(response.json()['forecastTimestamps']) == 168
+
+    def test_catalog_refresh(self, tmp_path):
+        """
+        Testuoja vietovių katalogo atnaujinimą iš simuliatoriaus
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        with MeteoSimulator(extra_places=20, seed=3) as sim:
+            count = catalog.refresh(self.make_api(sim), save=False)
+
+        assert count == 25
+        assert catalog.get('klaipeda')['latitude'] == pytest.approx(55.70329)
+
+    def test_record_and_replay(self, tmp_path):
+        """
+        Testuoja atsakymų įrašymą iš upstream ir vėlesnį atkūrimą
+        """
+        replay_dir = str(tmp_path / 'replay')
+        with MeteoSimulator(csv_path=CSV_PATH) as upstream:
+            with MeteoSimulator(replay_dir=replay_dir, upstream=upstream.base_url) as recorder:
+                recorded = self.make_api(recorder)._make_request('places/vilnius/forecasts/long-term')
+            assert recorder.stats()['recorded'] == 1
+
+        assert os.path.exists(os.path.join(replay_dir, 'places', 'vilnius', 'forecasts',
+                                           'long-term.json'))
+        with MeteoSimulator(replay_dir=replay_dir) as replay:
+            replayed = self.make_api(replay)._make_request('places/vilnius/forecasts/long-term')
+
+        assert replayed == recorded
+
+    def test_replay_path_traversal_rejected(self, tmp_path):
+        """
+        Testuoja, kad kelias su '..' neišeina už įrašų katalogo
+        """
+        replay_dir = tmp_path / 'replay'
+        replay_dir.mkdir()
+        (tmp_path / 'secret.json').write_text('{"slaptas": true}', encoding='utf-8')
+        simulator = MeteoSimulator(replay_dir=str(replay_dir))
+
+        status, _, body = simulator.handle('/v1/../../secret', {})
+        assert status == 400
+        assert b'slaptas' not in body
+        with pytest.raises(ValueError):
+            simulator._replay_path('places/../../secret')
+        assert simulator._replay_path('places/vilnius').startswith(os.path.realpath(str(replay_dir)))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Istorinių stebėjimų saugyklos ir sinchronizavimo unit testai
+"""
+import pytest
+import pandas as pd
+import requests_mock
+from datetime import date, datetime, timedelta
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from observation_store import ObservationStore, ObservationSync
+from http_client import HttpClient
+from meteo_simulator import MeteoSimulator
+from weather_api import WeatherAPI
+from tests.test_weather_api import make_observation_payload
+
+
+class TestObservationStore:
+    """
+    ObservationStore klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.day = date(2024, 1, 1)
+        self.observations = make_observation_payload('2024-01-01')['observations']
+
+    def test_write_and_load(self, tmp_path):
+        """
+        Testuoja įrašymą ir nuskaitymą su vietinio laiko indeksu
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        assert store.write_day('vilniaus-ams', self.day, self.observations) == 24
+
+        df = store.load('vilniaus-ams')
+        assert len(df) == 24
+        assert str(df.index.tz) == 'Europe/Vilnius'
+        assert df['temperatura'].iloc[0] == -2.0
+        assert df['krituliai'].iloc[0] == pytest.approx(0.2)
+        assert df['conditionCode'].iloc[0] == 'cloudy'
+
+    def test_rewrite_is_idempotent(self, tmp_path):
+        """
+        Testuoja, kad pakartotinis įrašymas nedubliuoja eilučių
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        store.write_day('vilniaus-ams', self.day, self.observations)
+        store.write_day('vilniaus-ams', self.day, self.observations)
+
+        assert len(store.load('vilniaus-ams')) == 24
+
+    def test_load_range_and_station(self, tmp_path):
+        """
+        Testuoja filtravimą pagal laiką ir stotį
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        store.write_day('vilniaus-ams', self.day, self.observations)
+        store.write_day('kauno-ams', self.day, self.observations[:5])
+
+        df = store.load('vilniaus-ams', datetime(2024, 1, 1, 6), datetime(2024, 1, 1, 12))
+        assert len(df) == 6
+        assert len(store.load('kauno-ams')) == 5
+        assert store.load('nera').empty
+
+    def test_synced_days(self, tmp_path):
+        """
+        Testuoja baigtų ir nebaigtų dienų žymėjimą
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        store.write_day('vilniaus-ams', self.day, self.observations)
+        store.write_day('vilniaus-ams', self.day + timedelta(days=1), [], complete=False)
+
+        assert store.synced_days('vilniaus-ams', self.day, self.day + timedelta(days=5)) == {self.day}
+        assert store.last_synced_day('vilniaus-ams') == self.day
+        assert store.last_synced_day('kauno-ams') is None
+
+
+class TestObservationSync:
+    """
+    ObservationSync klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.api = WeatherAPI('vilnius')
+
+    def mock_days(self, mocker, days):
+        for day in days:
+            mocker.get(f"{self.api.base_url}/stations/vilniaus-ams/observations/{day}",
+                       json=make_observation_payload(day))
+
+    def test_rerun_downloads_only_new_days(self, tmp_path):
+        """
+        Testuoja, kad pakartotinis sinchronizavimas siunčia tik naujas dienas
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        sync = ObservationSync(self.api, store, max_workers=3)
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_days(mocker, [f'2024-01-0{i}' for i in range(1, 6)])
+            first = sync.sync('vilniaus-ams', date(2024, 1, 1), date(2024, 1, 3))
+            calls_after_first = mocker.call_count
+            second = sync.sync('vilniaus-ams', date(2024, 1, 1), date(2024, 1, 5))
+
+        assert first == {'days': 3, 'rows': 72, 'failed': 0}
+        assert calls_after_first == 3
+        assert second['days'] == 2
+        assert mocker.call_count == 5
+        assert len(store.load('vilniaus-ams')) == 120
+
+    def test_failed_day_retried_on_resume(self, tmp_path, monkeypatch):
+        """
+        Testuoja, kad nepavykusi diena nepažymima ir parsiunčiama kitą kartą
+        """
+        monkeypatch.setattr('weather_api.time.sleep', lambda seconds: None)
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        sync = ObservationSync(self.api, store)
+
+        with requests_mock.Mocker() as mocker:
+            self.mock_days(mocker, ['2024-01-01', '2024-01-03'])
+            mocker.get(f"{self.api.base_url}/stations/vilniaus-ams/observations/2024-01-02",
+                       status_code=500)
+            first = sync.resume('vilniaus-ams', days=3, end=date(2024, 1, 3))
+
+            self.mock_days(mocker, ['2024-01-02'])
+            second = sync.resume('vilniaus-ams', days=3, end=date(2024, 1, 3))
+
+        assert first['failed'] == 1
+        assert second == {'days': 1, 'rows': 24, 'failed': 0}
+        assert store.last_synced_day('vilniaus-ams') == date(2024, 1, 3)
+
+    def test_today_is_refetched(self, tmp_path):
+        """
+        Testuoja, kad šiandienos duomenys laikomi nebaigtais
+        """
+        store = ObservationStore(str(tmp_path / 'obs.sqlite'))
+        client = HttpClient(rate_per_second=None)
+
+        with MeteoSimulator() as sim:
+            api = WeatherAPI('vilnius', base_url=sim.base_url, client=client,
+                             observation_store=store)
+            today = pd.Timestamp.now(tz='Europe/Vilnius').date()
+            start = (today - timedelta(days=2)).isoformat()
+
+            first = api.get_historical_data(start, today.isoformat())
+            api.get_historical_data(start, today.isoformat())
+            stats = sim.stats()
+
+        assert isinstance(first, pd.DataFrame)
+        assert len(first) >= 48
+        # 3 dienos pirmą kartą + tik šiandiena antrą kartą
+        assert stats['ok'] == 4
+        assert store.last_synced_day('vilniaus-ams') == today - timedelta(days=1)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+src paketo tingaus importavimo testai
+"""
+import subprocess
+import sys
+import os
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def run_python(code: str) -> str:
+    """
+    Paleidžia kodą naujame procese, kad sys.modules būtų švarus
+    """
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+class TestLazyPackage:
+    """
+    src/__init__.py tingaus importavimo testai
+    """
+
+    def test_import_package_loads_nothing(self):
+        """
+        Testuoja, kad `import src` neįkelia nei modulių, nei pandas/matplotlib
+        """
+        output = run_python(
+            "import sys, src\n"
+            "print(sorted(m for m in ('src.weather_api', 'src.visualization', 'pandas', "
+            "'matplotlib', 'scipy') if m in sys.modules))")
+        assert output == '[]'
+
+    def test_weather_api_skips_plotting_stack(self):
+        """
+        Testuoja, kad WeatherAPI neįkelia matplotlib, seaborn ir scipy
+        """
+        output = run_python(
+            "import sys, src\n"
+            "src.WeatherAPI\n"
+            "print(sorted(m for m in ('src.weather_api', 'matplotlib', 'seaborn', 'scipy') "
+            "if m in sys.modules))")
+        assert output == "['src.weather_api']"
+
+    def test_weather_api_does_not_configure_logging(self):
+        """
+        Testuoja, kad importas nekeičia root logger'io nustatymų
+        """
+        output = run_python(
+            "import logging\n"
+            "from src import WeatherAPI\n"
+            "print(len(logging.getLogger().handlers))")
+        assert output == '0'
+
+    def test_lazy_attribute_resolution(self):
+        """
+        Testuoja, kad tingus atributas yra ta pati klasė ir įrašomas į paketą
+        """
+        output = run_python(
+            "import src\n"
+            "from src.data_analysis import WeatherAnalyzer\n"
+            "print(src.WeatherAnalyzer is WeatherAnalyzer, 'WeatherAnalyzer' in vars(src), "
+            "'WeatherVisualizer' in dir(src))")
+        assert output == 'True True True'
+
+    def test_unknown_attribute(self):
+        """
+        Testuoja AttributeError nežinomam pavadinimui
+        """
+        output = run_python(
+            "import src\n"
+            "try:\n"
+            "    src.Missing\n"
+            "except AttributeError as e:\n"
+            "    print(e)")
+        assert output == "module 'src' has no attribute 'Missing'"
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+PlaceCatalog klasės unit testai
+"""
+import pytest
+import pandas as pd
+import requests_mock
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from place_catalog import PlaceCatalog
+from weather_api import WeatherAPI
+from tests.test_weather_api import make_forecast_payload
+
+
+PLACES = [
+    {'code': 'alytus', 'name': 'Alytus', 'administrativeDivision': 'Alytaus miesto savivaldybė',
+     'countryCode': 'LT'},
+    {'code': 'birstonas', 'name': 'Birštonas', 'administrativeDivision': 'Birštono savivaldybė',
+     'countryCode': 'LT'},
+    {'code': 'nida', 'name': 'Nida', 'administrativeDivision': 'Neringos savivaldybė',
+     'countryCode': 'LT'},
+]
+
+COORDINATES = {
+    'alytus': (54.3963, 24.0458),
+    'birstonas': (54.6056, 24.0297),
+    'nida': (55.3036, 21.0059),
+}
+
+
+def mock_places(mocker, base_url):
+    """
+    Užregistruoja /places ir /places/{code} atsakymus
+    """
+    mocker.get(f"{base_url}/places", json=PLACES)
+    for place in PLACES:
+        lat, lon = COORDINATES[place['code']]
+        mocker.get(f"{base_url}/places/{place['code']}",
+                   json=dict(place, coordinates={'latitude': lat, 'longitude': lon}))
+
+
+class TestPlaceCatalog:
+    """
+    PlaceCatalog klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.api = WeatherAPI('vilnius', catalog=PlaceCatalog('nera/places.csv'))
+
+    def test_empty_without_file(self, tmp_path):
+        """
+        Testuoja katalogo sukūrimą, kai failo dar nėra
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        assert len(catalog) == 0
+        assert 'alytus' not in catalog
+
+    def test_default_seeded_with_known_places(self, tmp_path, monkeypatch):
+        """
+        Testuoja, kad numatytasis katalogas be failo turi pagrindinių miestų koordinates
+        """
+        monkeypatch.setattr(PlaceCatalog, 'DEFAULT_PATH', str(tmp_path / 'places.csv'))
+        catalog = PlaceCatalog()
+
+        assert len(catalog) == 5
+        codes, _ = catalog.nearest(55.72, 21.12)
+        assert codes[0] == 'klaipeda'
+
+    def test_refresh_and_reload(self, tmp_path):
+        """
+        Testuoja katalogo parsiuntimą, išsaugojimą ir įkėlimą iš failo
+        """
+        path = str(tmp_path / 'places.csv')
+        catalog = PlaceCatalog(path)
+
+        with requests_mock.Mocker() as mocker:
+            mock_places(mocker, self.api.base_url)
+            count = catalog.refresh(self.api, max_workers=2)
+
+        assert count == 3
+        assert catalog.get('nida')['latitude'] == pytest.approx(55.3036)
+
+        reloaded = PlaceCatalog(path)
+        assert len(reloaded) == 3
+        assert reloaded.get('alytus')['administrativeDivision'] == 'Alytaus miesto savivaldybė'
+        assert reloaded.get('alytus')['longitude'] == pytest.approx(24.0458)
+
+    def test_refresh_keeps_known_coordinates(self, tmp_path):
+        """
+        Testuoja, kad pakartotinis atnaujinimas neparsiunčia jau žinomų koordinačių
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+
+        with requests_mock.Mocker() as mocker:
+            mock_places(mocker, self.api.base_url)
+            catalog.refresh(self.api)
+            first_calls = mocker.call_count
+            catalog.refresh(self.api)
+
+        assert first_calls == 4
+        assert mocker.call_count == 5
+
+    def test_select_by_division(self, tmp_path):
+        """
+        Testuoja vietovių atranką pagal savivaldybę
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        with requests_mock.Mocker() as mocker:
+            mock_places(mocker, self.api.base_url)
+            catalog.refresh(self.api, save=False)
+
+        assert sorted(catalog.select()) == ['alytus', 'birstonas', 'nida']
+        assert catalog.select(division='Neringos savivaldybė') == ['nida']
+
+    def test_weather_api_accepts_catalog_places(self, tmp_path):
+        """
+        Testuoja, kad WeatherAPI priima katalogo vietoves ir atmeta nežinomas
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        with requests_mock.Mocker() as mocker:
+            mock_places(mocker, self.api.base_url)
+            catalog.refresh(self.api, save=False)
+
+        api = WeatherAPI('nida', catalog=catalog)
+        assert api.location_code == 'nida'
+
+        with pytest.raises(ValueError, match="Nepalaikomas miesto kodas"):
+            WeatherAPI('netinkamas_miestas', catalog=catalog)
+
+    def test_bulk_fetch_forecasts(self, tmp_path):
+        """
+        Testuoja kelių katalogo vietovių prognozių gavimą
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        with requests_mock.Mocker() as mocker:
+            mock_places(mocker, self.api.base_url)
+            catalog.refresh(self.api, save=False)
+
+            api = WeatherAPI('vilnius', catalog=catalog)
+            for place in PLACES:
+                mocker.get(f"{api.base_url}/places/{place['code']}/forecasts/long-term",
+                           json=make_forecast_payload(place['code']))
+
+            results = catalog.fetch_forecasts(api, max_workers=2)
+
+        assert sorted(results) == ['alytus', 'birstonas', 'nida']
+        assert all(isinstance(df, pd.DataFrame) for df in results.values())
+
+
+class TestNearestPlaces:
+    """
+    Artimiausių vietovių paieškos testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.catalog = PlaceCatalog('nera/places.csv')
+        self.catalog.places = {
+            code: dict(place, latitude=COORDINATES[code][0], longitude=COORDINATES[code][1])
+            for code, place in ((p['code'], p) for p in PLACES)
+        }
+        self.api = WeatherAPI('vilnius', catalog=self.catalog)
+
+    def test_single_point(self):
+        """
+        Testuoja artimiausios vietovės paiešką vienam taškui
+        """
+        codes, distances = self.catalog.nearest(55.30, 21.01, k=2)
+
+        assert codes[0] == 'nida'
+        assert distances.shape == (2,)
+        assert distances[0] < 1.0
+        assert distances[0] <= distances[1]
+
+    def test_distance_matches_haversine(self):
+        """
+        Testuoja, kad atstumas atitinka didžiojo apskritimo atstumą
+        """
+        import numpy as np
+
+        _, distances = self.catalog.nearest(54.3963, 24.0458, k=2)
+        lat1, lon1, lat2, lon2 = map(np.radians, (54.3963, 24.0458, 54.6056, 24.0297))
+        haversine = 2 * 6371.0088 * np.arcsin(np.sqrt(
+            np.sin((lat2 - lat1) / 2) ** 2 +
+            np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2))
+
+        assert distances[0] == pytest.approx(0.0, abs=1e-6)
+        assert distances[1] == pytest.approx(haversine, rel=1e-9)
+
+    def test_batch_query(self):
+        """
+        Testuoja vektorizuotą kelių taškų paiešką
+        """
+        import numpy as np
+
+        lats = np.array([55.29, 54.40, 54.60, 54.61])
+        lons = np.array([21.00, 24.05, 24.03, 24.02])
+        codes, distances = self.catalog.nearest(lats, lons, k=1)
+
+        assert codes.shape == (4, 1)
+        assert list(codes[:, 0]) == ['nida', 'alytus', 'birstonas', 'birstonas']
+        assert distances.shape == (4, 1)
+
+    def test_k_larger_than_catalog(self):
+        """
+        Testuoja, kad k apribojamas vietovių skaičiumi
+        """
+        codes, _ = self.catalog.nearest(54.0, 24.0, k=10)
+        assert len(codes) == 3
+
+    def test_weather_api_lookup(self):
+        """
+        Testuoja WeatherAPI paiešką ir objekto sukūrimą pagal koordinates
+        """
+        assert self.api.nearest_places(55.31, 21.0) == ['nida']
+
+        api = WeatherAPI.for_coordinates(54.39, 24.04, catalog=self.catalog)
+        assert api.location_code == 'alytus'
+
+    def test_no_coordinates(self, tmp_path):
+        """
+        Testuoja paiešką tuščiame kataloge
+        """
+        catalog = PlaceCatalog(str(tmp_path / 'places.csv'))
+        with pytest.raises(ValueError):
+            catalog.nearest(54.0, 24.0)
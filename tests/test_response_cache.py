@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+ResponseCache klasės unit testai
+"""
+import pytest
+import requests_mock
+import threading
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from response_cache import ResponseCache
+from weather_api import WeatherAPI
+
+
+class FakeClock:
+    """
+    Valdomas laikrodis TTL testams
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """
+    ResponseCache klasės testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.clock = FakeClock()
+
+    def make_cache(self, tmp_path, **kwargs) -> ResponseCache:
+        return ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock, **kwargs)
+
+    def test_miss_then_hit(self, tmp_path):
+        """
+        Testuoja, kad išsaugotas atsakymas grąžinamas kaip šviežias
+        """
+        cache = self.make_cache(tmp_path)
+
+        assert cache.get('places/vilnius') is None
+        cache.set('places/vilnius', None, {'code': 'vilnius'})
+        entry = cache.get('places/vilnius')
+
+        assert entry is not None
+        assert entry.fresh
+        assert entry.data == {'code': 'vilnius'}
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_key_includes_sorted_params(self, tmp_path):
+        """
+        Testuoja, kad parametrų tvarka neturi įtakos raktui
+        """
+        assert (ResponseCache.make_key('x', {'b': 2, 'a': 1}) ==
+                ResponseCache.make_key('x', {'a': 1, 'b': 2}))
+
+        cache = self.make_cache(tmp_path)
+        cache.set('x', {'a': 1}, [1])
+        assert cache.get('x', {'a': 2}) is None
+        assert cache.get('x', {'a': 1}).data == [1]
+
+    def test_per_endpoint_ttl(self, tmp_path):
+        """
+        Testuoja endpoint TTL taisykles ir įrašo pasenimą
+        """
+        cache = self.make_cache(tmp_path, default_ttl=10,
+                                ttl_rules={'places/*/forecasts/*': 100})
+
+        assert cache.ttl_for('places/vilnius/forecasts/long-term') == 100
+        assert cache.ttl_for('stations') == 10
+
+        cache.set('places/vilnius/forecasts/long-term', None, {'a': 1})
+        self.clock.now += 99
+        assert cache.get('places/vilnius/forecasts/long-term').fresh
+        self.clock.now += 2
+        entry = cache.get('places/vilnius/forecasts/long-term')
+        assert entry is not None and not entry.fresh
+
+    def test_lru_eviction(self, tmp_path):
+        """
+        Testuoja, kad viršijus dydžio ribą šalinami seniausiai naudoti įrašai
+        """
+        payload = {'x': 'a' * 400}
+        cache = self.make_cache(tmp_path, max_bytes=1000)
+
+        cache.set('a', None, payload)
+        self.clock.now += 1
+        cache.set('b', None, payload)
+        self.clock.now += 1
+        cache.get('a')  # 'a' tampa naujausiai naudotas
+        self.clock.now += 1
+        cache.set('c', None, payload)
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+        assert cache.size_bytes() <= 1000
+        assert cache.stats()['evictions'] == 1
+
+    def test_shared_between_instances(self, tmp_path):
+        """
+        Testuoja, kad tas pats failas matomas kitam podėlio objektui (kitam procesui)
+        """
+        first = self.make_cache(tmp_path)
+        second = self.make_cache(tmp_path)
+
+        first.set('places', None, [{'code': 'vilnius'}])
+        assert second.get('places').data == [{'code': 'vilnius'}]
+
+
+class TestWeatherAPICache:
+    """
+    WeatherAPI integracijos su podėliu testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.clock = FakeClock()
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        """
+        Testuoja, kad šviežias įrašas grąžinamas be HTTP užklausos
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock)
+        api = WeatherAPI('vilnius', cache=cache)
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{api.base_url}/places/vilnius", json={'code': 'vilnius'})
+            assert api._make_request('places/vilnius') == {'code': 'vilnius'}
+            assert api._make_request('places/vilnius') == {'code': 'vilnius'}
+
+        assert mocker.call_count == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_stale_entry_revalidated_with_etag(self, tmp_path):
+        """
+        Testuoja sąlyginę užklausą ir 304 atsakymo apdorojimą
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock,
+                              ttl_rules={'places/*': 60})
+        api = WeatherAPI('vilnius', cache=cache)
+        url = f"{api.base_url}/places/vilnius"
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, json={'code': 'vilnius'}, headers={'ETag': '"v1"'})
+            api._make_request('places/vilnius')
+
+            self.clock.now += 61
+            mocker.get(url, status_code=304)
+            data = api._make_request('places/vilnius')
+
+            assert mocker.last_request.headers['If-None-Match'] == '"v1"'
+
+        assert data == {'code': 'vilnius'}
+        assert cache.stats()['revalidations'] == 1
+        assert cache.get('places/vilnius').fresh
+
+    def test_stale_entry_served_and_revalidated_in_background(self, tmp_path):
+        """
+        Testuoja, kad pasenęs įrašas stale_ttl lange grąžinamas iš karto
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock,
+                              ttl_rules={'places/*': 60})
+        api = WeatherAPI('vilnius', cache=cache, stale_ttl=300)
+        url = f"{api.base_url}/places/vilnius"
+        refreshed = threading.Event()
+
+        def slow_response(request, context):
+            refreshed.wait(5)
+            return {'code': 'vilnius', 'v': 2}
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, json={'code': 'vilnius', 'v': 1})
+            api._make_request('places/vilnius')
+
+            self.clock.now += 120
+            mocker.get(url, json=slow_response)
+            assert api._make_request('places/vilnius') == {'code': 'vilnius', 'v': 1}
+            assert api._make_request('places/vilnius') == {'code': 'vilnius', 'v': 1}
+
+            refreshed.set()
+            for thread in threading.enumerate():
+                if thread.name.startswith('revalidate-'):
+                    thread.join(5)
+
+        # Vienas pradinis ir vienas foninis atnaujinimas
+        assert mocker.call_count == 2
+        assert cache.get('places/vilnius').data == {'code': 'vilnius', 'v': 2}
+
+    def test_entry_beyond_stale_window_fetched(self, tmp_path):
+        """
+        Testuoja, kad už stale_ttl lango įrašas atnaujinamas sinchroniškai
+        """
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock,
+                              ttl_rules={'places/*': 60})
+        api = WeatherAPI('vilnius', cache=cache, stale_ttl=30)
+        url = f"{api.base_url}/places/vilnius"
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, json={'v': 1})
+            api._make_request('places/vilnius')
+
+            self.clock.now += 100
+            mocker.get(url, json={'v': 2})
+            assert api._make_request('places/vilnius') == {'v': 2}
+
+    def test_last_good_payload_served_on_error(self, tmp_path, monkeypatch):
+        """
+        Testuoja, kad nepasiekus API grąžinamas paskutinis geras atsakymas
+        """
+        monkeypatch.setattr('time.sleep', lambda delay: None)
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite'), clock=self.clock,
+                              ttl_rules={'places/*': 60})
+        api = WeatherAPI('vilnius', cache=cache)
+        strict = WeatherAPI('vilnius', cache=cache, serve_stale_on_error=False)
+        url = f"{api.base_url}/places/vilnius"
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, json={'v': 1})
+            api._make_request('places/vilnius')
+
+            self.clock.now += 3600
+            mocker.get(url, status_code=503)
+            assert api._make_request('places/vilnius') == {'v': 1}
+            assert strict._make_request('places/vilnius') is None
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Slenkančių langų vidurkių unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rolling_stats import daily_totals, trailing_means, climate_trends
+from data_analysis import WeatherAnalyzer
+
+
+def make_hourly(start: str = '2023-01-01', days: int = 800, seed: int = 3) -> pd.DataFrame:
+    index = pd.date_range(start, periods=days * 24, freq='h', tz='Europe/Vilnius')
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'temperatura': 8 + 10 * np.sin(np.arange(len(index)) / 1400) + rng.normal(0, 3, len(index)),
+        'dregme': rng.uniform(40, 95, len(index)),
+    }, index=index)
+
+
+def naive_trailing_mean(df: pd.DataFrame, column: str, day: pd.Timestamp, window: int) -> float:
+    local = df.index.tz_localize(None).normalize()
+    mask = (local > day - pd.Timedelta(days=window)) & (local <= day)
+    return df.loc[mask, column].mean()
+
+
+class TestRollingStats:
+    """
+    rolling_stats modulio funkcijų testai
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas: duomenys su spraga ir NaN reikšmėmis
+        """
+        df = make_hourly()
+        gap = (df.index >= '2023-06-10') & (df.index < '2023-06-25')
+        self.df = df[~gap].copy()
+        self.df.iloc[::11, 0] = np.nan
+
+    def test_matches_naive_windows(self):
+        """
+        Testuoja, kad prefiksų sumos sutampa su tiesioginiu lango vidurkiu
+        """
+        result = trailing_means(*daily_totals(self.df, ['temperatura', 'dregme']))
+
+        assert list(result.columns) == ['temperatura_365d', 'temperatura_30d', 'temperatura_7d',
+                                        'dregme_365d', 'dregme_30d', 'dregme_7d']
+        for day in ['2023-01-01', '2023-06-12', '2023-06-30', '2024-02-29', '2025-03-10']:
+            day = pd.Timestamp(day)
+            for window in (365, 30, 7):
+                expected = naive_trailing_mean(self.df, 'temperatura', day, window)
+                assert result.loc[day, f'temperatura_{window}d'] == pytest.approx(expected, rel=1e-9)
+
+    def test_gap_days_in_calendar(self):
+        """
+        Testuoja, kad spragos dienos yra rezultate, o visiškai tušti langai - NaN
+        """
+        result = trailing_means(*daily_totals(self.df, ['temperatura']), windows=[1, 7])
+
+        assert len(result) == 800
+        assert result.index.is_monotonic_increasing
+        assert np.isnan(result.loc['2023-06-15', 'temperatura_1d'])
+        assert not np.isnan(result.loc['2023-06-15', 'temperatura_7d'])
+        assert np.isnan(result.loc['2023-06-24', 'temperatura_7d'])
+
+    def test_min_coverage(self):
+        """
+        Testuoja, kad nepakankamos aprėpties langai grąžinami NaN
+        """
+        result = trailing_means(*daily_totals(self.df, ['dregme']), windows=[365], min_coverage=0.9)
+        assert result['dregme_365d'].first_valid_index() == pd.Timestamp('2023-12-10')
+
+    def test_chunk_totals_merge(self):
+        """
+        Testuoja, kad dalių dienų sumos sujungiamos į tą patį rezultatą
+        """
+        parts = [daily_totals(self.df.iloc[start:start + 5000], ['temperatura'])
+                 for start in range(0, len(self.df), 5000)]
+        merged = trailing_means(pd.concat([s for s, _ in parts]), pd.concat([c for _, c in parts]))
+        whole = trailing_means(*daily_totals(self.df, ['temperatura']))
+        pd.testing.assert_frame_equal(merged, whole, rtol=1e-12)
+
+    def test_climate_trends(self):
+        """
+        Testuoja metinį ir mėnesio pokytį
+        """
+        trends = climate_trends(*daily_totals(self.df, ['temperatura']), window=30)
+        means = trends['temperatura_30d']
+        day = pd.Timestamp('2024-08-01')
+
+        assert trends.loc[day, 'temperatura_metinis_pokytis'] == pytest.approx(
+            means[day] - means[day - pd.Timedelta(days=365)])
+        assert trends.loc[day, 'temperatura_mėnesio_pokytis'] == pytest.approx(
+            means[day] - means[day - pd.Timedelta(days=30)])
+        assert trends['temperatura_metinis_pokytis'].iloc[:365].isna().all()
+
+    def test_invalid_window(self):
+        """
+        Testuoja ValueError netinkamam langui
+        """
+        with pytest.raises(ValueError):
+            trailing_means(*daily_totals(self.df, ['dregme']), windows=[0])
+
+
+class TestWeatherAnalyzerRolling:
+    """
+    WeatherAnalyzer slenkančių vidurkių metodų testai
+    """
+
+    def test_rolling_averages(self):
+        """
+        Testuoja rolling_averages ir calculate_climate_trends metodus
+        """
+        df = make_hourly(days=400)
+        analyzer = WeatherAnalyzer(df)
+
+        rolling = analyzer.rolling_averages(columns=['temperatura'])
+        assert list(rolling.columns) == ['temperatura_365d', 'temperatura_30d', 'temperatura_7d']
+        last = rolling.index[-1]
+        assert rolling.loc[last, 'temperatura_7d'] == pytest.approx(
+            naive_trailing_mean(df, 'temperatura', last, 7))
+
+        trends = analyzer.calculate_climate_trends()
+        assert {'temperatura_metinis_pokytis', 'dregme_mėnesio_pokytis'} <= set(trends.columns)
+
+    def test_no_data(self):
+        """
+        Testuoja None be istorinių duomenų
+        """
+        assert WeatherAnalyzer().rolling_averages() is None
+        assert WeatherAnalyzer(make_hourly(days=3)).rolling_averages(columns=['nera']) is None
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Srautinio statistikos variklio unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from streaming_stats import RunningStats, StreamingAnalysis, analyze_chunks
+from data_analysis import WeatherAnalyzer
+
+
+def make_weather(start: str, end: str, freq: str = 'h', seed: int = 42) -> pd.DataFrame:
+    dates = pd.date_range(start, end, freq=freq, tz='Europe/Vilnius')
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'temperatura': rng.normal(5, 10, len(dates)),
+        'dregme': rng.uniform(40, 90, len(dates)),
+        'vejo_greitis': rng.uniform(0, 15, len(dates)),
+        'slegimasJuros': rng.normal(1013, 20, len(dates)),
+        'krituliai': rng.exponential(0.5, len(dates)),
+    }, index=dates)
+
+
+def split(df: pd.DataFrame, size: int):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+class TestRunningStats:
+    """
+    RunningStats klasės testai
+    """
+
+    def test_matches_numpy_over_chunks(self):
+        """
+        Testuoja vidurkį, dispersiją ir min/max per kelias dalis su NaN
+        """
+        values = np.random.default_rng(1).normal(1013, 20, 10_001)
+        values[::97] = np.nan
+        stats = RunningStats()
+        for start in range(0, len(values), 777):
+            stats.update(values[start:start + 777])
+
+        assert stats.count == np.count_nonzero(~np.isnan(values))
+        assert stats.rows == len(values)
+        assert stats.mean == pytest.approx(np.nanmean(values), rel=1e-12)
+        assert stats.variance == pytest.approx(np.nanvar(values, ddof=1), rel=1e-10)
+        assert stats.max == np.nanmax(values)
+        assert stats.argmin == int(np.nanargmin(values))
+
+    def test_merge_equals_single_pass(self):
+        """
+        Testuoja, kad sujungtos dalinės statistikos sutampa su vienu praėjimu
+        """
+        values = np.random.default_rng(2).uniform(0, 15, 5000)
+        left, right = RunningStats().update(values[:1234]), RunningStats().update(values[1234:])
+        whole = RunningStats().update(values)
+
+        left.merge(right)
+        assert left.count == whole.count
+        assert left.mean == pytest.approx(whole.mean, rel=1e-13)
+        assert left.m2 == pytest.approx(whole.m2, rel=1e-10)
+        assert (left.min, left.max) == (whole.min, whole.max)
+
+    def test_ties_keep_first_label(self):
+        """
+        Testuoja, kad lygybės atveju išlieka pirmoji žymė (kaip idxmax)
+        """
+        index = pd.date_range('2024-01-01', periods=4, freq='h')
+        stats = RunningStats().update([1.0, 5.0], index[:2]).update([5.0, 0.0], index[2:])
+        assert stats.argmax == index[1]
+        assert stats.argmin == index[3]
+
+
+class TestStreamingAnalysis:
+    """
+    StreamingAnalysis rezultatų palyginimas su WeatherAnalyzer
+    """
+
+    def setup_method(self):
+        """
+        Pradinis testų nustatymas
+        """
+        self.historical = make_weather('2023-01-01', '2024-06-30 23:00')
+        self.forecast = make_weather('2024-07-01', '2024-07-10', freq='3h', seed=7)
+
+    @pytest.mark.parametrize('chunk_size', [1000, 4096, 100_000])
+    def test_matches_weather_analyzer(self, chunk_size):
+        """
+        Testuoja, kad žodynai sutampa su WeatherAnalyzer nepriklausomai nuo dalių dydžio
+        """
+        analyzer = WeatherAnalyzer(self.historical, self.forecast)
+        results = analyze_chunks(split(self.historical, chunk_size),
+                                 split(self.forecast, chunk_size))
+
+        assert results['metiniai_vidurkiai'] == analyzer.calculate_yearly_averages()
+        assert results['dienos_nakties_analizė'] == analyzer.analyze_day_night_temperature()
+        assert results['ekstremaliuosius_rodikliai'] == analyzer.find_extremes()
+
+    def test_historical_only(self):
+        """
+        Testuoja ekstremumus be prognozės (kaip WeatherAnalyzer be combined_data)
+        """
+        analyzer = WeatherAnalyzer(self.historical)
+        engine = StreamingAnalysis()
+        for chunk in split(self.historical, 5000):
+            engine.update(chunk)
+        assert engine.extremes() == analyzer.find_extremes()
+
+    def test_yearly_window_memory_bounded(self):
+        """
+        Testuoja, kad metiniams vidurkiams laikomos tik paskutinių 365 dienų eilutės
+        """
+        engine = StreamingAnalysis()
+        for chunk in split(self.historical, 24 * 7):
+            engine.update(chunk)
+        retained = sum(len(times) for times, _ in engine._tail)
+        assert retained <= 366 * 24 + 24 * 7
+
+    def test_empty(self):
+        """
+        Testuoja tuščius rezultatus be duomenų
+        """
+        results = analyze_chunks([])
+        assert results == {'metiniai_vidurkiai': {}, 'dienos_nakties_analizė': {},
+                           'ekstremaliuosius_rodikliai': {}}
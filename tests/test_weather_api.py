@@ -4,7 +4,10 @@ WeatherAPI klasės unit testai - tik funkcionalūs testai su realiu API
 """
 import pytest
 import pandas as pd
-from datetime import datetime, timedelta
+import requests_mock
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 import os
 import sys
 
@@ -12,6 +15,60 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from weather_api import WeatherAPI
+from observation_store import ObservationStore
+
+
+def make_forecast_payload(place: str = 'vilnius', hours: int = 48) -> dict:
+    """
+    Sukuria meteo.lt long-term atsakymo pavyzdį, prasidedantį dabartine valanda
+    """
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    timestamps = []
+    for hour in range(hours):
+        moment = start + timedelta(hours=hour)
+        timestamps.append({
+            'forecastTimeUtc': moment.strftime('%Y-%m-%d %H:%M:%S'),
+            'airTemperature': 10.0 + hour % 7,
+            'feelsLikeTemperature': 9.0 + hour % 7,
+            'windSpeed': 3,
+            'windGust': 7,
+            'windDirection': 220,
+            'cloudCover': 40,
+            'seaLevelPressure': 1015,
+            'relativeHumidity': 70,
+            'totalPrecipitation': 0.5 if hour % 5 == 0 else 0.0,
+            'conditionCode': 'partly-cloudy'
+        })
+    return {
+        'place': {'code': place, 'name': place.title()},
+        'forecastType': 'long-term',
+        'forecastCreationTimeUtc': start.strftime('%Y-%m-%d %H:%M:%S'),
+        'forecastTimestamps': timestamps
+    }
+
+
+def make_observation_payload(day: str, station: str = 'vilniaus-ams') -> dict:
+    """
+    Sukuria meteo.lt vienos dienos stebėjimų atsakymo pavyzdį
+    """
+    start = datetime.strptime(day, '%Y-%m-%d')
+    observations = []
+    for hour in range(24):
+        moment = start + timedelta(hours=hour)
+        observations.append({
+            'observationTimeUtc': moment.strftime('%Y-%m-%d %H:%M:%S'),
+            'airTemperature': -2.0 + hour % 6,
+            'feelsLikeTemperature': -5.0 + hour % 6,
+            'windSpeed': 2.5,
+            'windGust': 6.1,
+            'windDirection': 180,
+            'cloudCover': 75,
+            'seaLevelPressure': 1012.4,
+            'relativeHumidity': 88,
+            'precipitation': 0.2 if hour % 4 == 0 else 0.0,
+            'conditionCode': 'cloudy'
+        })
+    return {'station': {'code': station}, 'observations': observations}
 
 
 class TestWeatherAPI:
@@ -40,15 +97,23 @@ class TestWeatherAPI:
         with pytest.raises(ValueError, match="Nepalaikomas miesto kodas"):
             WeatherAPI('netinkamas_miestas')
             
-    def test_get_historical_data_success(self):
+    def test_get_historical_data_success(self, tmp_path):
         """
-        Testuoja istorinių duomenų gavimą (meteo.lt API apribojimas - grąžins None)
+        Testuoja istorinių duomenų gavimą į vietinę saugyklą
         """
-        # REALUS meteo.lt API atvejis - istoriniai duomenys neprieinami
-        result = self.api.get_historical_data('2024-01-01', '2024-01-01')
+        api = WeatherAPI('vilnius', observation_store=ObservationStore(str(tmp_path / 'obs.sqlite')))
         
-        # Tikimės None, nes meteo.lt API neturi istorinių duomenų
-        assert result is None
+        with requests_mock.Mocker() as mocker:
+            mocker.get(requests_mock.ANY, json={'observations': []})
+            mocker.get(f"{api.base_url}/stations/vilniaus-ams/observations/2024-01-01",
+                       json=make_observation_payload('2024-01-01'))
+            result = api.get_historical_data('2024-01-01', '2024-01-01')
+            
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 24
+        assert result.index.name == 'observationTimeLocal'
+        for col in ['temperatura', 'dregme', 'vejo_greitis', 'slegimasJuros', 'krituliai']:
+            assert col in result.columns
             
     def test_get_historical_data_invalid_dates(self):
         """
@@ -62,12 +127,16 @@ class TestWeatherAPI:
         result = self.api.get_historical_data('2024-01-02', '2024-01-01')
         assert result is None
         
-    def test_get_historical_data_empty_response(self):
+    def test_get_historical_data_empty_response(self, tmp_path):
         """
         Testuoja istorinių duomenų gavimą - tuščias atsakas
         """
-        # meteo.lt API neturi istorinių duomenų
-        result = self.api.get_historical_data('2024-01-01', '2024-01-07')
+        api = WeatherAPI('vilnius', observation_store=ObservationStore(str(tmp_path / 'obs.sqlite')))
+        
+        with requests_mock.Mocker() as mocker:
+            mocker.get(requests_mock.ANY, json={'observations': []})
+            result = api.get_historical_data('2024-01-01', '2024-01-07')
+            
         assert result is None
             
     def test_get_forecast_data_success(self):
@@ -170,4 +239,175 @@ class TestWeatherAPI:
         
         # Testuoja dabartinio oro endpoint  
         current_result = self.api.get_current_weather()
-        assert current_result is None or isinstance(current_result, dict)
\ No newline at end of file
+        assert current_result is None or isinstance(current_result, dict)
+
+
+class TestWeatherAPIBatch:
+    """
+    Kelių vietovių lygiagretaus prognozių gavimo testai (be tinklo)
+    """
+    
+    def setup_method(self):
+        """
+        Paruošiami duomenys prieš kiekvieną testą
+        """
+        self.api = WeatherAPI('vilnius')
+        self.places = ['vilnius', 'kaunas', 'klaipeda']
+        
+    def test_fetch_forecasts_returns_frames(self):
+        """
+        Testuoja, kad kiekvienai vietovei grąžinamas toks pat DataFrame kaip get_forecast_data
+        """
+        with requests_mock.Mocker() as mocker:
+            for place in self.places:
+                mocker.get(f"{self.api.base_url}/places/{place}/forecasts/long-term",
+                           json=make_forecast_payload(place))
+                
+            results = self.api.fetch_forecasts(self.places, days=1, max_concurrency=2)
+            single = self.api.get_forecast_data(days=1)
+            
+        assert list(results.keys()) == self.places
+        for place, df in results.items():
+            assert isinstance(df, pd.DataFrame)
+            assert isinstance(df.index, pd.DatetimeIndex)
+            assert 'temperatura' in df.columns
+            
+        pd.testing.assert_frame_equal(results['vilnius'], single)
+        
+    def test_fetch_forecasts_partial_failure(self, monkeypatch):
+        """
+        Testuoja, kad nepavykusi vietovė grąžina None ir nestabdo kitų
+        """
+        monkeypatch.setattr('asyncio.sleep', _no_sleep)
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{self.api.base_url}/places/vilnius/forecasts/long-term",
+                       json=make_forecast_payload('vilnius'))
+            mocker.get(f"{self.api.base_url}/places/kaunas/forecasts/long-term",
+                       status_code=500)
+            
+            results = self.api.fetch_forecasts(['vilnius', 'kaunas'])
+            
+        assert isinstance(results['vilnius'], pd.DataFrame)
+        assert results['kaunas'] is None
+        
+    def test_fetch_forecasts_inside_running_loop(self):
+        """
+        Testuoja sinchroninį apvalkalą jau veikiančiame įvykių cikle (pvz. Jupyter)
+        """
+        import asyncio
+        
+        async def notebook_cell():
+            return self.api.fetch_forecasts(['vilnius', 'kaunas'], days=1)
+            
+        with requests_mock.Mocker() as mocker:
+            for place in ['vilnius', 'kaunas']:
+                mocker.get(f"{self.api.base_url}/places/{place}/forecasts/long-term",
+                           json=make_forecast_payload(place))
+            results = asyncio.run(notebook_cell())
+            
+        assert all(isinstance(df, pd.DataFrame) for df in results.values())
+        
+    def test_sync_and_async_retry_alike(self, monkeypatch):
+        """
+        Testuoja, kad abu keliai vienodai kartoja užklausas ir atlaisvina bandomąjį kvietimą
+        """
+        monkeypatch.setattr('asyncio.sleep', _no_sleep)
+        monkeypatch.setattr('time.sleep', lambda delay: None)
+        url = f"{self.api.base_url}/places/kaunas/forecasts/long-term"
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, [{'status_code': 503}, {'json': make_forecast_payload('kaunas')}])
+            results = self.api.fetch_forecasts(['kaunas'], days=1)
+            assert mocker.call_count == 2
+            
+            mocker.get(url, [{'status_code': 503}, {'json': make_forecast_payload('kaunas')}])
+            data = self.api._fetch_with_retries('places/kaunas/forecasts/long-term', None, None)
+            assert mocker.call_count == 4
+            
+        assert isinstance(results['kaunas'], pd.DataFrame)
+        assert data['place']['code'] == 'kaunas'
+        
+    def test_fetch_forecasts_invalid_place(self):
+        """
+        Testuoja, kad nežinomas vietovės kodas atmetamas prieš siunčiant užklausas
+        """
+        with pytest.raises(ValueError, match="Nepalaikomas miesto kodas"):
+            self.api.fetch_forecasts(['vilnius', 'netinkamas_miestas'])
+
+
+
+class TestForecastCoalescing:
+    """
+    Prognozės atsakymo bendrinimo tarp metodų ir gijų testai
+    """
+    
+    def setup_method(self):
+        """
+        Paruošiami duomenys prieš kiekvieną testą
+        """
+        self.api = WeatherAPI('vilnius', forecast_ttl=60)
+        self.url = f"{self.api.base_url}/places/vilnius/forecasts/long-term"
+        
+    def test_methods_share_one_download(self):
+        """
+        Testuoja, kad prognozė, dabartinis oras ir savaitgalio lietus naudoja vieną atsakymą
+        """
+        with requests_mock.Mocker() as mocker:
+            mocker.get(self.url, json=make_forecast_payload(hours=24 * 8))
+            
+            forecast = self.api.get_forecast_data()
+            current = self.api.get_current_weather()
+            weekend = self.api.predict_weekend_rain()
+            
+        assert mocker.call_count == 1
+        assert isinstance(forecast, pd.DataFrame)
+        assert current['place']['code'] == 'vilnius'
+        assert isinstance(weekend, dict)
+        
+    def test_concurrent_callers_coalesced(self):
+        """
+        Testuoja, kad vienu metu kviečiančios gijos laukia tos pačios užklausos
+        """
+        payload = make_forecast_payload()
+        
+        def slow_response(request, context):
+            time.sleep(0.2)
+            return payload
+            
+        results = []
+        with requests_mock.Mocker() as mocker:
+            mocker.get(self.url, json=slow_response)
+            threads = [threading.Thread(target=lambda: results.append(self.api.get_forecast_data()))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+                
+        assert mocker.call_count == 1
+        assert len(results) == 8
+        assert all(isinstance(df, pd.DataFrame) for df in results)
+        
+    def test_memo_expires_and_failures_not_cached(self, monkeypatch):
+        """
+        Testuoja TTL pabaigą ir tai, kad nesėkmingas atsakymas neįsimenamas
+        """
+        monkeypatch.setattr('time.sleep', lambda delay: None)
+        api = WeatherAPI('vilnius', forecast_ttl=0)
+        
+        with requests_mock.Mocker() as mocker:
+            mocker.get(self.url, status_code=500)
+            assert api.get_forecast_data() is None
+            
+            mocker.get(self.url, json=make_forecast_payload())
+            assert isinstance(api.get_forecast_data(), pd.DataFrame)
+            assert isinstance(api.get_forecast_data(), pd.DataFrame)
+            
+        # 3 nesėkmingi bandymai + 2 užklausos, nes TTL lygus 0
+        assert mocker.call_count == 5
+
+async def _no_sleep(delay):
+    """
+    asyncio.sleep pakaitalas, kad testai nelauktų backoff pauzių
+    """
+    return None
+
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Savaitgalio kritulių suvestinės unit testai
+"""
+import pytest
+import pandas as pd
+import numpy as np
+import requests_mock
+import sys
+import os
+
+# Pridedame src katalogą į Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from weekend_rain import (weekend_rain_table, weekend_rain_summary, local_days, day_of_week,
+                          iso_weeks, weekly_weekend_rain, weekend_rain_report,
+                          weekend_rain_reports, split_place_index)
+from data_analysis import WeatherAnalyzer
+from weather_api import WeatherAPI
+from tests.test_weather_api import make_forecast_payload
+
+
+def make_frame(start: str = '2025-08-08 00:00', hours: int = 96, rain: dict = None) -> pd.DataFrame:
+    """
+    Sukuria valandinę prognozę Vilniaus laiku (2025-08-08 - penktadienis)
+    """
+    index = pd.date_range(start, periods=hours, freq='h', tz='Europe/Vilnius')
+    krituliai = np.zeros(hours)
+    for timestamp, value in (rain or {}).items():
+        krituliai[index.get_loc(pd.Timestamp(timestamp, tz='Europe/Vilnius'))] = value
+    return pd.DataFrame({'temperatura': 15.0, 'krituliai': krituliai}, index=index)
+
+
+class TestWeekendRain:
+    """
+    weekend_rain modulio funkcijų testai
+    """
+
+    def test_day_of_week_matches_pandas(self):
+        """
+        Testuoja savaitės dienos skaičiavimą iš datetime64[D]
+        """
+        index = pd.date_range('2024-12-28', periods=400, freq='7h', tz='Europe/Vilnius')
+        assert (day_of_week(local_days(index)) == index.dayofweek).all()
+
+    def test_daily_totals_maxima_and_hours(self):
+        """
+        Testuoja dienų sumas, maksimumus ir lietingų valandų skaičių
+        """
+        df = make_frame(rain={'2025-08-09 10:00': 0.4, '2025-08-09 11:00': 1.2,
+                              '2025-08-09 23:00': 0.1, '2025-08-11 01:00': 5.0})
+        summary = weekend_rain_summary(df, 'vilnius')
+
+        assert list(summary['savaitės_diena']) == ['šeštadienis', 'sekmadienis']
+        assert list(summary['data'].dt.strftime('%Y-%m-%d')) == ['2025-08-09', '2025-08-10']
+        saturday, sunday = summary.iloc[0], summary.iloc[1]
+        assert saturday['krituliai_suma'] == pytest.approx(1.7)
+        assert saturday['krituliai_max'] == pytest.approx(1.2)
+        assert saturday['lietingos_valandos'] == 3
+        assert saturday['valandos'] == 24
+        assert saturday['lietus']
+        assert sunday['krituliai_suma'] == 0
+        assert not sunday['lietus']
+
+    def test_local_date_boundaries(self):
+        """
+        Testuoja, kad dienos ribos skaičiuojamos vietiniu, o ne UTC laiku
+        """
+        # 2025-08-10 00:00 Vilniuje yra 2025-08-09 21:00 UTC
+        df = make_frame(rain={'2025-08-10 00:00': 2.0})
+        summary = weekend_rain_summary(df)
+        assert summary.loc[summary['savaitės_diena'] == 'sekmadienis', 'krituliai_suma'].item() == 2.0
+
+    def test_rain_threshold(self):
+        """
+        Testuoja lietingos valandos slenkstį
+        """
+        df = make_frame(rain={'2025-08-09 10:00': 0.05, '2025-08-09 11:00': 0.3})
+        summary = weekend_rain_summary(df, rain_threshold=0.1)
+        assert summary.iloc[0]['lietingos_valandos'] == 1
+
+    def test_multi_place_table(self):
+        """
+        Testuoja kelių vietovių (ir kelių savaitgalių) suvestinę vienoje lentelėje
+        """
+        frames = {
+            'vilnius': make_frame(hours=24 * 10, rain={'2025-08-16 12:00': 3.0}),
+            'kaunas': make_frame(rain={'2025-08-10 08:00': 1.0}),
+            'klaipeda': None,
+            'siauliai': make_frame('2025-08-11 00:00', hours=48),
+        }
+        table = weekend_rain_table(frames)
+
+        assert list(table['vieta']) == ['vilnius'] * 4 + ['kaunas'] * 2
+        assert table.groupby('vieta')['data'].apply(lambda d: d.is_monotonic_increasing).all()
+        rainy = table[table['lietus']]
+        assert list(zip(rainy['vieta'], rainy['krituliai_suma'])) == [('vilnius', 3.0), ('kaunas', 1.0)]
+
+    def test_empty_input(self):
+        """
+        Testuoja tuščią rezultatą, kai savaitgalio duomenų nėra
+        """
+        table = weekend_rain_table({'vilnius': make_frame('2025-08-11 00:00', hours=48)})
+        assert table.empty
+        assert 'krituliai_suma' in table.columns
+
+
+class TestWeeklyWeekendRain:
+    """
+    Savaitgalių pagal ISO savaitę suvestinės testai
+    """
+
+    def test_iso_weeks_match_pandas(self):
+        """
+        Testuoja ISO metus ir savaitę per metų sandūras
+        """
+        days = pd.date_range('2020-12-20', '2027-01-10', freq='D')
+        iso_year, iso_week = iso_weeks(days.values.astype('datetime64[D]'))
+        calendar = days.isocalendar()
+        assert (iso_year == calendar['year'].to_numpy()).all()
+        assert (iso_week == calendar['week'].to_numpy()).all()
+
+    def test_saturday_and_sunday_form_one_weekend(self):
+        """
+        Testuoja, kad šeštadienis ir sekmadienis sudaro vieną savaitgalį
+        """
+        df = make_frame(hours=24 * 10, rain={'2025-08-10 08:00': 1.0, '2025-08-16 12:00': 3.0})
+        df.loc['2025-08-09 05:00', 'krituliai'] = np.nan
+        table = weekly_weekend_rain(df, 'vilnius')
+
+        assert list(table['data'].dt.strftime('%Y-%m-%d')) == ['2025-08-09', '2025-08-16']
+        assert list(table['iso_savaitė']) == [32, 33]
+        assert list(table['dienos']) == [2, 2]
+        assert list(table['valandos']) == [48, 48]
+        assert list(table['lietingos_valandos']) == [1, 1]
+        assert table.loc[0, 'vidutiniai_krituliai'] == round(1.0 / 47, 2)
+
+    def test_matches_daily_table(self):
+        """
+        Testuoja, kad savaitgalių sumos sutampa su weekend_rain_table() dienų sumomis
+        """
+        rng = np.random.default_rng(3)
+        frames = {place: make_frame(hours=24 * 30) for place in ['vilnius', 'kaunas']}
+        for df in frames.values():
+            df['krituliai'] = rng.exponential(0.2, len(df)).round(1)
+        multi = pd.concat(frames, names=['vieta', 'laikas'])
+
+        daily = weekend_rain_table(frames)
+        saturdays = daily['data'] - pd.to_timedelta(daily['data'].dt.dayofweek - 5, unit='D')
+        expected = daily.groupby(['vieta', saturdays], sort=False).agg(
+            krituliai_suma=('krituliai_suma', 'sum'), valandos=('valandos', 'sum'))
+        table = weekly_weekend_rain(multi)
+
+        assert list(zip(table['vieta'], table['data'])) == list(expected.index)
+        np.testing.assert_allclose(table['krituliai_suma'], expected['krituliai_suma'], atol=0.011)
+        assert list(table['valandos']) == list(expected['valandos'])
+        pd.testing.assert_frame_equal(weekly_weekend_rain(None), weekly_weekend_rain(multi).iloc[:0])
+
+    def test_multi_place_index(self):
+        """
+        Testuoja kelių vietovių DataFrame su 'vieta' indekso lygiu
+        """
+        frames = {
+            'vilnius': make_frame(hours=24 * 10, rain={'2025-08-16 12:00': 3.0}),
+            'kaunas': make_frame('2025-08-10 00:00', hours=24),
+        }
+        multi = pd.concat(frames, names=['vieta', 'laikas'])
+        table = weekly_weekend_rain(multi)
+
+        assert list(table['vieta']) == ['vilnius', 'vilnius', 'kaunas']
+        kaunas = table[table['vieta'] == 'kaunas'].iloc[0]
+        # Tik sekmadienis - savaitgalio data vis tiek šeštadienis
+        assert kaunas['data'] == pd.Timestamp('2025-08-09')
+        assert kaunas['dienos'] == 1
+
+        report = WeatherAnalyzer(forecast_data=multi).analyze_weekend_rain_forecast()
+        assert set(report) == {'vilnius', 'kaunas'}
+        assert report['vilnius'] == weekend_rain_report(weekly_weekend_rain(frames['vilnius']))
+
+    def test_analyzer_dict_format(self):
+        """
+        Testuoja, kad WeatherAnalyzer rezultatas sutampa su tiesioginiu grupavimu pagal ISO savaitę
+        """
+        index = pd.date_range('2024-12-20', periods=24 * 30, freq='h', tz='Europe/Vilnius')
+        rng = np.random.default_rng(1)
+        forecast = pd.DataFrame({'krituliai': rng.choice([0.0, 0.0, 0.0, 0.4, 1.3], len(index))},
+                                index=index)
+        analyzer = WeatherAnalyzer(forecast_data=forecast)
+        result = analyzer.analyze_weekend_rain_forecast()
+
+        weekends = forecast[forecast.index.dayofweek >= 5]
+        calendar = weekends.index.isocalendar()
+        groups = weekends.groupby([calendar['year'].to_numpy(), calendar['week'].to_numpy()])['krituliai']
+        assert result['savaitgalių_skaičius'] == groups.ngroups
+        assert result['savaitgaliai_su_lietumi'] == int((groups.max() > 0).sum())
+        assert [d['vidutiniai_krituliai'] for d in result['savaitgalių_detalizacija']] == list(
+            groups.mean().round(2))
+        assert result['savaitgalių_detalizacija'][0]['data'] == '2024-12-21'
+
+        table = analyzer.analyze_weekend_rain_forecast(as_frame=True)
+        assert weekend_rain_report(table) == result
+
+    def test_reports_from_arrays_match_table(self):
+        """
+        Testuoja, kad suvestinės iš masyvų sutampa su suvestinėmis iš lentelės
+        """
+        rng = np.random.default_rng(5)
+        frames = {place: make_frame(hours=24 * 20) for place in ['vilnius', 'kaunas']}
+        for df in frames.values():
+            df['krituliai'] = rng.choice([0.0, 0.0, 0.2, np.nan, 1.1], len(df))
+        multi = pd.concat(frames, names=['vieta', 'laikas'])
+
+        places, times = split_place_index(multi.index)
+        reports = weekend_rain_reports(places, local_days(times), multi['krituliai'].to_numpy())
+
+        assert list(reports) == ['vilnius', 'kaunas']
+        for place, df in frames.items():
+            assert reports[place] == weekend_rain_report(weekly_weekend_rain(df, place))
+        assert weekend_rain_reports(np.empty(0, dtype=object), np.empty(0, dtype='datetime64[D]'),
+                                    np.empty(0)) == {}
+
+
+class TestWeatherAPIWeekendRain:
+    """
+    WeatherAPI savaitgalio lietaus metodų testai
+    """
+
+    def test_predict_weekend_rain_uses_daily_totals(self):
+        """
+        Testuoja, kad prognozė remiasi dienos suma, o ne paskutine valanda
+        """
+        api = WeatherAPI('vilnius')
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{api.base_url}/places/vilnius/forecasts/long-term",
+                       json=make_forecast_payload(hours=24 * 8))
+            weekend = api.predict_weekend_rain()
+            summary = api.get_weekend_rain()
+
+        weeks = summary['data'].dt.isocalendar()['week']
+        complete = weeks[weeks.map(weeks.value_counts()) == 2]
+        nearest = summary[weeks == (complete.iloc[0] if not complete.empty else weeks.iloc[0])]
+        nearest = nearest.set_index('savaitės_diena')
+        assert set(weekend) == set(nearest.index)
+        for day, text in weekend.items():
+            assert day in ('šeštadienis', 'sekmadienis')
+            if nearest.loc[day, 'lietus']:
+                assert text.startswith(f"Tikėtinas lietus: {nearest.loc[day, 'krituliai_suma']}mm")
+            else:
+                assert text == "Sausas oras"
+
+    def test_forecast_starting_on_sunday(self, monkeypatch):
+        """
+        Testuoja, kad sekmadienis nesujungiamas su kito savaitgalio šeštadieniu
+        """
+        # 2025-08-10 - sekmadienis; lyja tik jį, kitas savaitgalis sausas
+        df = make_frame('2025-08-10 00:00', hours=24 * 8, rain={'2025-08-10 12:00': 2.0})
+        api = WeatherAPI('vilnius')
+        monkeypatch.setattr(api, 'get_weekend_rain',
+                            lambda days=7: weekend_rain_summary(df, 'vilnius'))
+
+        assert api.predict_weekend_rain() == {'šeštadienis': "Sausas oras",
+                                              'sekmadienis': "Sausas oras"}
+
+    def test_batch_returns_one_tidy_frame(self):
+        """
+        Testuoja kelių vietovių suvestinę viena lentele
+        """
+        api = WeatherAPI('vilnius')
+        places = ['vilnius', 'kaunas', 'klaipeda']
+        with requests_mock.Mocker() as mocker:
+            for place in places:
+                mocker.get(f"{api.base_url}/places/{place}/forecasts/long-term",
+                           json=make_forecast_payload(place, hours=24 * 8))
+            table = api.predict_weekend_rain_batch(places)
+
+        assert set(table['vieta']) == set(places)
+        assert (table['valandos'] > 0).all()
+        assert (table['krituliai_max'] <= table['krituliai_suma']).all()